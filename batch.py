@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Processamento em lote sem interface gráfica - SIN392
+
+Exemplo:
+    python batch.py entrada/ "scans/**/*.png" -o saida -p median:kernel_size=5 -p otsu
+"""
+
+import argparse
+import sys
+
+from src.pipeline.batch_processor import BatchProcessor, collect_inputs, format_summary
+from src.pipeline.operations import available_operations, parse_operation
+
+def main():
+    """Função principal do processamento em lote"""
+    parser = argparse.ArgumentParser(description="Aplica uma sequência de operações a várias imagens")
+    parser.add_argument("inputs", nargs="+", help="Diretórios, arquivos ou padrões glob de entrada")
+    parser.add_argument("-o", "--output", required=True, help="Diretório de saída")
+    parser.add_argument("-p", "--op", dest="operations", action="append", required=True,
+                        help="Operação no formato nome[:chave=valor,...]; pode ser repetida "
+                             f"(disponíveis: {', '.join(available_operations())})")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Número de processos (padrão: número de CPUs)")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="Reprocessa imagens cuja saída já existe")
+    parser.add_argument("--color", action="store_true",
+                        help="Processa as imagens em RGB em vez de escala de cinza")
+    parser.add_argument("--cache-mb", type=int, default=0,
+                        help="Memória, em MB, do cache de resultados de cada processo; reaproveita "
+                             "operações repetidas em imagens idênticas (padrão: 0, desativado)")
+    args = parser.parse_args()
+
+    try:
+        operations = [parse_operation(spec) for spec in args.operations]
+    except ValueError as e:
+        parser.error(str(e))
+
+    try:
+        inputs = collect_inputs(args.inputs)
+    except ValueError as e:
+        parser.error(str(e))
+    if not inputs:
+        print("Nenhuma imagem encontrada", file=sys.stderr)
+        return 1
+
+    processor = BatchProcessor(workers=args.workers, overwrite=args.overwrite,
+                               keep_color=args.color, cache_bytes=args.cache_mb * 1024 * 1024)
+    summary = processor.run(inputs, operations, args.output)
+    print(format_summary(summary))
+
+    return 1 if summary["failed"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Medição de desempenho das operações de processamento - SIN392
+
+Exemplo:
+    python benchmark.py --sizes 512,2048 -o resultados.json --baseline referencia.json
+"""
+
+import argparse
+import sys
+
+from src.benchmarks.benchmark_suite import (BenchmarkSuite, DEFAULT_SIZES, DEFAULT_DTYPES,
+                                            DEFAULT_THRESHOLD, SUPPORTED_DTYPES, save_results,
+                                            load_results, compare_results, format_comparison)
+from src.pipeline.operations import available_operations
+
+def parse_list(text, convert=str):
+    """Converte "a,b,c" em lista"""
+    return [convert(item) for item in text.split(",") if item]
+
+def main():
+    """Função principal da medição de desempenho"""
+    parser = argparse.ArgumentParser(description="Mede o desempenho das operações de processamento")
+    parser.add_argument("--ops", default=None,
+                        help="Operações separadas por vírgula "
+                             f"(padrão: todas - {', '.join(available_operations())})")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Lados das imagens quadradas, separados por vírgula")
+    parser.add_argument("--dtypes", default=",".join(DEFAULT_DTYPES),
+                        help=f"Tipos das imagens ({', '.join(SUPPORTED_DTYPES)})")
+    parser.add_argument("--warmup", type=int, default=1, help="Execuções de aquecimento")
+    parser.add_argument("--repeats", type=int, default=3, help="Execuções cronometradas")
+    parser.add_argument("--no-memory", action="store_true", help="Não mede o pico de memória")
+    parser.add_argument("-o", "--output", default=None, help="Arquivo JSON com os resultados")
+    parser.add_argument("--baseline", default=None, help="Arquivo JSON de referência para comparação")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Piora relativa considerada regressão (padrão: 0.10)")
+    args = parser.parse_args()
+
+    try:
+        sizes = parse_list(args.sizes, int)
+        dtypes = parse_list(args.dtypes)
+        unknown = [dtype for dtype in dtypes if dtype not in SUPPORTED_DTYPES]
+        if unknown:
+            raise ValueError(f"Tipos não suportados: {', '.join(unknown)}")
+        suite = BenchmarkSuite(operations=parse_list(args.ops) if args.ops else None,
+                               sizes=sizes, dtypes=dtypes, warmup=args.warmup,
+                               repeats=max(args.repeats, 1), measure_memory=not args.no_memory)
+    except ValueError as e:
+        parser.error(str(e))
+
+    report = suite.run()
+
+    if args.output:
+        save_results(report, args.output)
+        print(f"Resultados gravados em {args.output}")
+
+    if args.baseline:
+        comparison = compare_results(report, load_results(args.baseline), args.threshold)
+        print(format_comparison(comparison))
+        if any(item["regression"] for item in comparison):
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,11 +6,23 @@ Autor: Sistema Interativo de Processamento Digital de Imagens
 """
 
 import sys
-from PyQt6.QtWidgets import QApplication
-from src.ui.main_window import MainWindow
+
+# Mede o custo de cada importação e o tempo até a primeira pintura
+PROFILE_FLAG = "--profile-startup"
 
 def main():
     """Função principal que inicializa o sistema"""
+    profiler = None
+    if PROFILE_FLAG in sys.argv:
+        sys.argv.remove(PROFILE_FLAG)
+        from src.utils.startup_profiler import StartupProfiler
+        profiler = StartupProfiler()
+        profiler.install()
+    
+    # Importações feitas aqui para que o modo de medição as contabilize
+    from PyQt6.QtWidgets import QApplication
+    from src.ui.main_window import MainWindow
+    
     app = QApplication(sys.argv)
     
     # Configurar estilo da aplicação
@@ -18,10 +30,13 @@ def main():
     
     # Criar e exibir janela principal
     window = MainWindow()
+    if profiler is not None:
+        profiler.mark("janela principal criada")
+        profiler.watch(window, app)
     window.show()
     
     # Executar loop principal da aplicação
     sys.exit(app.exec())
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
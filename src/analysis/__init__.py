@@ -0,0 +1 @@
+# Análise estatística de imagens
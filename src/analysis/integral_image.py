@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Imagens integrais (tabelas de somas acumuladas) para estatísticas locais
+"""
+
+import threading
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+from src.utils.image_key import image_key
+
+class IntegralImage:
+    """
+    Somas acumuladas do valor e do seu quadrado
+
+    Com as tabelas S(y, x) = soma dos pixels acima e à esquerda de (y, x),
+    a soma de qualquer janela retangular sai de quatro leituras, e a média e
+    o desvio padrão locais custam o mesmo para qualquer tamanho de janela.
+
+    Nas bordas a janela é recortada à imagem: as estatísticas usam apenas os
+    pixels existentes. Imagens coloridas têm uma tabela por canal.
+    """
+
+    def __init__(self, image):
+        """
+        Args:
+            image: Imagem 2-D ou altura x largura x canais (até 4 canais,
+                   qualquer tipo numérico)
+        """
+        if image.ndim not in (2, 3) or (image.ndim == 3 and image.shape[2] > 4):
+            raise ValueError("A imagem integral requer uma imagem 2-D com até 4 canais")
+        if image.dtype not in (np.uint8, np.float32, np.float64):
+            # float32 é exato para 16 bits; as tabelas acumulam em float64
+            image = image.astype(np.float32)
+
+        self.shape = image.shape[:2]
+        self.channels = image.shape[2:]
+        # Tabelas (altura + 1) x (largura + 1) em float64 (exatas para 8 bits)
+        self.sum, self.sqsum = (table.reshape(table.shape[:2] + self.channels) for table in
+                                cv2.integral2(image, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F))
+
+    @property
+    def nbytes(self):
+        """Memória ocupada pelas tabelas"""
+        return self.sum.nbytes + self.sqsum.nbytes
+
+    def window_sum(self, window_size, table=None):
+        """
+        Soma em janelas quadradas centradas em cada pixel
+
+        Args:
+            window_size: Lado da janela (ímpar)
+            table: Tabela acumulada (padrão: a dos valores)
+
+        Returns:
+            Tupla (somas, número de pixels de cada janela)
+        """
+        table = self.sum if table is None else table
+        height, width = self.shape
+        radius = window_size // 2
+        end = 2 * radius + 1
+
+        # Repetir a borda da tabela: a janela recortada vira um deslocamento fixo
+        padded = np.pad(table, ((radius, radius), (radius, radius)) + ((0, 0),) * len(self.channels),
+                        mode="edge")
+        sums = padded[end:end + height, end:end + width] - padded[:height, end:end + width]
+        sums -= padded[end:end + height, :width]
+        sums += padded[:height, :width]
+
+        rows = self._counts(height, radius)
+        cols = self._counts(width, radius)
+        counts = np.outer(rows, cols)
+        return sums, counts.reshape(counts.shape + (1,) * len(self.channels))
+
+    def mean(self, window_size):
+        """Média local em janelas window_size x window_size"""
+        sums, counts = self.window_sum(window_size)
+        return sums / counts
+
+    def mean_variance(self, window_size):
+        """
+        Média e variância locais
+
+        Args:
+            window_size: Lado da janela (ímpar)
+
+        Returns:
+            Tupla (média, variância) em float64
+        """
+        sums, counts = self.window_sum(window_size)
+        squares, _ = self.window_sum(window_size, self.sqsum)
+        mean = np.divide(sums, counts, out=sums)
+        variance = np.divide(squares, counts, out=squares)
+        variance -= mean * mean
+        # E[x²] - E[x]² pode ficar levemente negativo por arredondamento
+        np.maximum(variance, 0, out=variance)
+        return mean, variance
+
+    def mean_std(self, window_size):
+        """
+        Média e desvio padrão locais
+
+        Args:
+            window_size: Lado da janela (ímpar)
+
+        Returns:
+            Tupla (média, desvio padrão) em float64
+        """
+        mean, variance = self.mean_variance(window_size)
+        return mean, np.sqrt(variance, out=variance)
+
+    @staticmethod
+    def _counts(length, radius):
+        """Número de pixels da janela de cada posição, recortada à imagem"""
+        positions = np.arange(length)
+        return np.minimum(positions + radius + 1, length) - np.maximum(positions - radius, 0)
+
+class IntegralImageCache:
+    """
+    Cache LRU de imagens integrais indexado pelo conteúdo da imagem
+
+    As tabelas são calculadas uma vez por versão da imagem; mudar o tamanho
+    da janela de uma estatística local só relê as tabelas, sem percorrer a
+    imagem de novo.
+    """
+
+    def __init__(self, max_bytes=512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_integral(self, image):
+        """
+        Retorna a imagem integral, calculando-a apenas na primeira vez
+
+        Args:
+            image: Imagem de entrada
+
+        Returns:
+            Objeto IntegralImage
+        """
+        key = image_key(image)
+        with self.lock:
+            integral = self.entries.get(key)
+            if integral is not None:
+                self.entries.move_to_end(key)
+                return integral
+
+        integral = IntegralImage(image)
+
+        with self.lock:
+            self.entries[key] = integral
+            self.entries.move_to_end(key)
+            self._evict()
+        return integral
+
+    def clear(self):
+        """Remove todas as imagens integrais"""
+        with self.lock:
+            self.entries.clear()
+
+    def _evict(self):
+        """Remove as tabelas menos usadas até caber no limite (mantém a mais recente)"""
+        while len(self.entries) > 1 and sum(i.nbytes for i in self.entries.values()) > self.max_bytes:
+            self.entries.popitem(last=False)
+
+_shared_cache = IntegralImageCache()
+
+def get_integral_cache():
+    """Cache de imagens integrais compartilhado por toda a aplicação"""
+    return _shared_cache
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Estatísticas de imagem derivadas de um único histograma
+"""
+
+import threading
+from collections import OrderedDict
+
+from src.utils.channels import to_gray
+from src.utils.image_key import image_key
+from src.utils.lazy_import import lazy_import
+
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+
+class StatsEngine:
+    """
+    Calcula histograma e estatísticas uma vez por versão da imagem
+
+    Para imagens inteiras de 8 bits (e 16 bits), o histograma por nível de
+    cinza é obtido em uma única passada; média, variância, assimetria,
+    curtose, mediana, percentis, entropia e amplitude são derivados dele de
+    forma exata, sem temporários do tamanho da imagem. Imagens coloridas
+    são descritas pela luminância.
+    """
+
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def compute(self, image):
+        """
+        Retorna as estatísticas da imagem (cacheadas pelo conteúdo)
+
+        Args:
+            image: Imagem de entrada
+
+        Returns:
+            Dicionário com histogram (256 posições), count, mean, median, std,
+            variance, min, max, range, p25, p75, skewness, kurtosis e entropy
+        """
+        key = image_key(image)
+        with self.lock:
+            stats = self.entries.get(key)
+            if stats is not None:
+                self.entries.move_to_end(key)
+                return stats
+
+        image = to_gray(image)
+        if image.dtype == np.uint8:
+            # Histograma de 256 níveis em uma passada
+            counts = cv2.calcHist([image], [0], None, [256], [0, 256]).ravel().astype(np.int64)
+            stats = self._from_histogram(counts, np.arange(256, dtype=np.float64))
+            stats["histogram"] = counts
+        elif image.dtype == np.uint16:
+            counts = np.bincount(image.ravel(), minlength=65536)
+            stats = self._from_histogram(counts, np.arange(65536, dtype=np.float64))
+            # Histograma de exibição com 256 faixas
+            stats["histogram"] = counts.reshape(256, 256).sum(axis=1)
+        else:
+            stats = self._from_array(image)
+
+        with self.lock:
+            self.entries[key] = stats
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return stats
+
+    def _from_histogram(self, counts, levels):
+        """Estatísticas exatas a partir das contagens por nível"""
+        count = int(counts.sum())
+        weights = counts / count
+
+        occupied = np.flatnonzero(counts)
+        min_val = levels[occupied[0]]
+        max_val = levels[occupied[-1]]
+
+        # Momentos centrais
+        mean_val = float(np.dot(weights, levels))
+        deviation = levels - mean_val
+        variance_val = float(np.dot(weights, deviation ** 2))
+        std_val = variance_val ** 0.5
+        if std_val == 0:
+            skewness_val = 0.0
+            kurtosis_val = 0.0
+        else:
+            skewness_val = float(np.dot(weights, deviation ** 3)) / std_val ** 3
+            kurtosis_val = float(np.dot(weights, deviation ** 4)) / std_val ** 4 - 3
+
+        # Percentis com interpolação linear (mesmo método do numpy)
+        cumulative = np.cumsum(counts)
+
+        def percentile(q):
+            position = q / 100 * (count - 1)
+            low = int(np.floor(position))
+            high = min(low + 1, count - 1)
+            low_val = levels[np.searchsorted(cumulative, low, side="right")]
+            high_val = levels[np.searchsorted(cumulative, high, side="right")]
+            return float(low_val + (high_val - low_val) * (position - low))
+
+        # Entropia em bits
+        prob = weights[occupied]
+        entropy_val = float(-np.sum(prob * np.log2(prob)))
+
+        return {
+            "count": count,
+            "mean": mean_val,
+            "median": percentile(50),
+            "std": std_val,
+            "variance": variance_val,
+            "min": float(min_val),
+            "max": float(max_val),
+            "range": float(max_val - min_val),
+            "p25": percentile(25),
+            "p75": percentile(75),
+            "skewness": skewness_val,
+            "kurtosis": kurtosis_val,
+            "entropy": entropy_val,
+        }
+
+    def _from_array(self, image):
+        """Estatísticas para imagens de ponto flutuante"""
+        values = image.ravel()
+        min_val = float(values.min())
+        max_val = float(values.max())
+
+        # Histograma de exibição com 256 faixas entre o mínimo e o máximo
+        counts, _ = np.histogram(values, bins=256, range=(min_val, max_val if max_val > min_val else min_val + 1))
+
+        mean_val = float(values.mean(dtype=np.float64))
+        variance_val = float(values.var(dtype=np.float64))
+        std_val = variance_val ** 0.5
+        if std_val == 0:
+            skewness_val = 0.0
+            kurtosis_val = 0.0
+        else:
+            standardized = (values - np.float32(mean_val)) / np.float32(std_val)
+            squared = standardized * standardized
+            skewness_val = float(np.mean(squared * standardized, dtype=np.float64))
+            kurtosis_val = float(np.mean(squared * squared, dtype=np.float64)) - 3
+
+        p25, median_val, p75 = (float(v) for v in np.percentile(values, [25, 50, 75]))
+        prob = counts[counts > 0] / counts.sum()
+
+        return {
+            "histogram": counts,
+            "count": int(values.size),
+            "mean": mean_val,
+            "median": median_val,
+            "std": std_val,
+            "variance": variance_val,
+            "min": min_val,
+            "max": max_val,
+            "range": max_val - min_val,
+            "p25": p25,
+            "p75": p75,
+            "skewness": skewness_val,
+            "kurtosis": kurtosis_val,
+            "entropy": float(-np.sum(prob * np.log2(prob))),
+        }
+
+_shared_engine = StatsEngine()
+
+def get_stats_engine():
+    """Motor de estatísticas compartilhado por toda a aplicação"""
+    return _shared_engine
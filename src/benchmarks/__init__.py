@@ -0,0 +1 @@
+# Medição de desempenho das operações de processamento
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Medição de desempenho das operações de processamento
+
+Cada operação registrada em src.pipeline.operations é executada sobre
+imagens sintéticas de vários tamanhos e tipos, com aquecimento e repetições;
+o resultado (tempo, vazão e pico de memória) é gravado em JSON e pode ser
+comparado com uma execução de referência.
+"""
+
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.analysis.integral_image import get_integral_cache
+from src.pipeline.operations import OPERATIONS, apply_operation
+from src.frequency.frequency_masks import get_frequency_masks
+from src.frequency.spectrum_cache import get_spectrum_cache
+from src.pipeline.result_cache import get_result_cache
+
+DEFAULT_SIZES = (512, 1024, 2048, 4096, 8192, 16384)
+DEFAULT_DTYPES = ("uint8",)
+SUPPORTED_DTYPES = ("uint8", "uint16", "float32")
+
+# Piora relativa do tempo mediano considerada regressão
+DEFAULT_THRESHOLD = 0.10
+
+def synthetic_image(size, dtype="uint8", seed=0):
+    """
+    Gera uma imagem sintética determinística
+
+    Combina um gradiente suave, formas retangulares e ruído, de modo que
+    filtros, morfologia e limiarização trabalhem sobre conteúdo realista.
+
+    Args:
+        size: Lado da imagem quadrada em pixels
+        dtype: "uint8", "uint16" ou "float32"
+        seed: Semente do gerador de ruído
+
+    Returns:
+        Imagem size x size do tipo pedido
+    """
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(f"Tipo não suportado: {dtype}")
+
+    rng = np.random.default_rng(seed)
+    ramp = np.linspace(0, 96, size, dtype=np.float32)
+    image = ramp[None, :] + ramp[:, None] * 0.5
+
+    # Retângulos claros em posições fixas relativas ao tamanho
+    step = max(size // 8, 1)
+    for i in range(1, 8, 2):
+        for j in range(1, 8, 2):
+            image[i * step:i * step + step // 2, j * step:j * step + step // 2] += 96
+
+    image += rng.normal(0, 12, size=(size, size)).astype(np.float32)
+    np.clip(image, 0, 255, out=image)
+
+    if dtype == "uint8":
+        return image.astype(np.uint8)
+    if dtype == "uint16":
+        return (image * 257).astype(np.uint16)
+    return image / np.float32(255)
+
+def clear_caches():
+    """Esvazia os caches compartilhados para que cada repetição meça o cálculo completo"""
+    get_spectrum_cache().clear()
+    get_frequency_masks().clear()
+    get_integral_cache().clear()
+    get_result_cache().clear()
+
+class BenchmarkSuite:
+    """Executa as operações registradas e coleta as medições"""
+
+    def __init__(self, operations=None, sizes=DEFAULT_SIZES, dtypes=DEFAULT_DTYPES,
+                 warmup=1, repeats=3, measure_memory=True):
+        self.operations = sorted(operations or OPERATIONS)
+        self.sizes = sizes
+        self.dtypes = dtypes
+        self.warmup = warmup
+        self.repeats = repeats
+        self.measure_memory = measure_memory
+
+        unknown = [name for name in self.operations if name not in OPERATIONS]
+        if unknown:
+            raise ValueError(f"Operações desconhecidas: {', '.join(unknown)}")
+
+    def run(self, log=print):
+        """
+        Mede todas as combinações de operação, tamanho e tipo
+
+        Args:
+            log: Função que recebe uma linha de progresso (ou None)
+
+        Returns:
+            Dicionário com "environment", "settings" e a lista "results"
+        """
+        results = []
+        for dtype in self.dtypes:
+            for size in self.sizes:
+                image = synthetic_image(size, dtype)
+                for name in self.operations:
+                    result = self.measure(image, name)
+                    results.append(result)
+                    if log:
+                        log(format_result(result))
+                del image
+                gc.collect()
+
+        return {
+            "environment": environment_info(),
+            "settings": {"warmup": self.warmup, "repeats": self.repeats,
+                         "sizes": list(self.sizes), "dtypes": list(self.dtypes)},
+            "results": results,
+        }
+
+    def measure(self, image, name):
+        """
+        Mede uma operação sobre uma imagem
+
+        Returns:
+            Dicionário com operation, size, dtype e as medições; em caso de
+            erro, o campo "error" descreve a falha
+        """
+        size = image.shape[0]
+        megapixels = image.size / 1e6
+        result = {"operation": name, "size": size, "dtype": image.dtype.name}
+
+        try:
+            for _ in range(self.warmup):
+                clear_caches()
+                apply_operation(image, name)
+
+            times = []
+            for _ in range(self.repeats):
+                clear_caches()
+                start = time.perf_counter()
+                apply_operation(image, name)
+                times.append(time.perf_counter() - start)
+
+            # Pico de memória medido em uma execução separada, fora da cronometragem
+            peak_mb = self.peak_memory(image, name) if self.measure_memory else None
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {str(e).strip()}"
+            return result
+
+        median = statistics.median(times)
+        result.update({
+            "times_s": times,
+            "median_s": median,
+            "min_s": min(times),
+            "megapixels_per_s": megapixels / median if median > 0 else None,
+            "peak_memory_mb": peak_mb,
+        })
+        return result
+
+    def peak_memory(self, image, name):
+        """Pico de memória alocada (MB) durante uma execução, via tracemalloc"""
+        clear_caches()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            apply_operation(image, name)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak / (1024 * 1024)
+
+def environment_info():
+    """Descrição da máquina e das versões usadas na medição"""
+    import cv2
+    import scipy
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+        "scipy": scipy.__version__,
+    }
+
+def format_result(result):
+    """Linha de texto com a medição de uma operação"""
+    case = f"{result['operation']:<24} {result['size']:>6}² {result['dtype']:<8}"
+    if "error" in result:
+        return f"{case} ERRO: {result['error']}"
+    memory = result["peak_memory_mb"]
+    memory_text = f"{memory:9.1f} MB" if memory is not None else ""
+    return f"{case} {result['median_s'] * 1000:10.2f} ms {result['megapixels_per_s']:9.1f} MP/s {memory_text}"
+
+def save_results(report, path):
+    """Grava o relatório em JSON"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+def load_results(path):
+    """Lê um relatório gravado por save_results"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def compare_results(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compara uma execução com a referência
+
+    Args:
+        report: Relatório da execução atual
+        baseline: Relatório de referência
+        threshold: Piora relativa do tempo mediano considerada regressão
+
+    Returns:
+        Lista de dicionários (operation, size, dtype, baseline_s, current_s,
+        change, regression), apenas para casos presentes nas duas execuções
+    """
+    def key(result):
+        return (result["operation"], result["size"], result["dtype"])
+
+    reference = {key(r): r for r in baseline["results"] if "error" not in r}
+    comparison = []
+    for result in report["results"]:
+        before = reference.get(key(result))
+        if before is None or "error" in result:
+            continue
+        change = result["median_s"] / before["median_s"] - 1
+        comparison.append({
+            "operation": result["operation"],
+            "size": result["size"],
+            "dtype": result["dtype"],
+            "baseline_s": before["median_s"],
+            "current_s": result["median_s"],
+            "change": change,
+            "regression": change > threshold,
+        })
+    return comparison
+
+def format_comparison(comparison):
+    """Texto com a comparação, destacando as regressões"""
+    lines = []
+    for item in comparison:
+        flag = "REGRESSÃO" if item["regression"] else ""
+        lines.append(f"{item['operation']:<24} {item['size']:>6}² {item['dtype']:<8} "
+                     f"{item['baseline_s'] * 1000:10.2f} ms -> {item['current_s'] * 1000:10.2f} ms "
+                     f"({item['change']:+.1%}) {flag}".rstrip())
+    regressions = sum(item["regression"] for item in comparison)
+    lines.append(f"{len(comparison)} casos comparados, {regressions} regressões")
+    return "\n".join(lines)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Filtros adaptativos baseados em média e variância locais
+"""
+
+import numpy as np
+
+from src.analysis.integral_image import get_integral_cache
+from src.utils.dtype_utils import saturate, value_range
+
+# Menor desvio padrão local da normalização de contraste, em fração da faixa
+# do tipo (evita amplificar ruído em regiões planas)
+LCN_MIN_STD = 0.01
+
+class AdaptiveFilters:
+    """
+    Filtros cujo comportamento em cada pixel depende da média e da variância
+    da vizinhança
+
+    As estatísticas locais vêm das imagens integrais cacheadas por versão da
+    imagem: qualquer tamanho de janela custa o mesmo, e trocar a janela não
+    percorre a imagem de novo. Imagens coloridas são filtradas canal a canal,
+    com estimativas de ruído separadas por canal.
+    """
+
+    def __init__(self):
+        # Somas e somas dos quadrados calculadas uma vez por imagem
+        self.integral_cache = get_integral_cache()
+
+    def wiener_filter(self, image, window_size=5, noise=None):
+        """
+        Aplica o filtro de Wiener adaptativo (ruído aditivo)
+
+        Em cada pixel: m + max(v - n, 0) / max(v, n) * (x - m), com média m e
+        variância v locais e variância do ruído n (como scipy.signal.wiener).
+
+        Args:
+            image: Imagem de entrada
+            window_size: Lado da janela (deve ser ímpar)
+            noise: Variância do ruído, em unidades da imagem ao quadrado
+                   (padrão: média das variâncias locais)
+
+        Returns:
+            Imagem filtrada, do mesmo tipo da entrada
+        """
+        mean, variance = self._local_stats(image, window_size)
+        if noise is None:
+            noise = variance.mean(axis=(0, 1))
+
+        # Ganho = 1 - n / v onde v > n; 0 (média local) no restante
+        gain = np.maximum(variance - noise, 0)
+        gain /= np.maximum(np.maximum(variance, noise), np.finfo(np.float64).tiny)
+        return self._blend(image, mean, gain)
+
+    def lee_filter(self, image, window_size=7, noise=None):
+        """
+        Aplica o filtro de Lee para ruído multiplicativo (speckle)
+
+        Em cada pixel: m + k * (x - m), com k = (1 - Cu² / Ci²) / (1 + Cu²)
+        limitado a [0, 1], em que Ci² = v / m² é o coeficiente de variação
+        local ao quadrado e Cu² o do ruído.
+
+        Args:
+            image: Imagem de entrada
+            window_size: Lado da janela (deve ser ímpar)
+            noise: Coeficiente de variação do ruído ao quadrado, Cu²
+                   (padrão: mediana de Ci² na imagem, dominada pelas regiões
+                   homogêneas)
+
+        Returns:
+            Imagem filtrada, do mesmo tipo da entrada
+        """
+        mean, variance = self._local_stats(image, window_size)
+        squared_mean = mean * mean
+        if noise is None:
+            ratio = np.divide(variance, squared_mean, out=np.zeros_like(variance),
+                              where=squared_mean > 0)
+            noise = np.median(ratio, axis=(0, 1))
+
+        # k = (v - Cu² m²) / (v (1 + Cu²)); pixels sem variação ficam na média
+        gain = variance - squared_mean * noise
+        np.divide(gain, variance * (1 + noise), out=gain, where=variance > 0)
+        gain[variance <= 0] = 0
+        np.clip(gain, 0, 1, out=gain)
+        return self._blend(image, mean, gain)
+
+    def local_contrast_normalization(self, image, window_size=31, contrast=3.0):
+        """
+        Aplica normalização de contraste local
+
+        Cada pixel vira o seu desvio em relação à média local, em desvios
+        padrão locais: z = (x - m) / s. A faixa [-contrast, contrast] de z é
+        mapeada na faixa do tipo da imagem.
+
+        Args:
+            image: Imagem de entrada
+            window_size: Lado da janela (deve ser ímpar)
+            contrast: Número de desvios padrão que ocupam metade da faixa
+
+        Returns:
+            Imagem normalizada, do mesmo tipo da entrada
+        """
+        if contrast <= 0:
+            raise ValueError("O contraste deve ser positivo")
+        mean, variance = self._local_stats(image, window_size)
+        low, high = value_range(image.dtype)
+        min_std = LCN_MIN_STD * (high - low)
+
+        # (z / contrast + 1) / 2 na faixa [low, high]
+        std = np.sqrt(np.maximum(variance, min_std * min_std), out=variance)
+        result = image - mean
+        result /= std
+        result *= (high - low) / (2 * contrast)
+        result += (high + low) / 2
+        np.clip(result, low, high, out=result)
+        return saturate(result, image.dtype)
+
+    def _local_stats(self, image, window_size):
+        """Média e variância locais (float64) a partir da imagem integral cacheada"""
+        # Garantir que a janela seja ímpar
+        if window_size % 2 == 0:
+            window_size += 1
+        return self.integral_cache.get_integral(image).mean_variance(window_size)
+
+    @staticmethod
+    def _blend(image, mean, gain):
+        """m + k * (x - m), no tipo da imagem"""
+        result = image - mean
+        result *= gain
+        result += mean
+        return saturate(result, image.dtype)
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Filtro gaussiano com custo constante por pixel para sigmas grandes
+"""
+
+from functools import lru_cache
+
+import cv2
+import numpy as np
+from scipy import signal
+
+from src.utils.dtype_utils import saturate, to_float32
+
+# Raio do kernel em desvios padrão (o mesmo truncate=4.0 do scipy.ndimage)
+TRUNCATE = 4.0
+
+# Menor sigma para o qual a aproximação de Young-van Vliet é válida
+RECURSIVE_MIN_SIGMA = 0.5
+
+# Coeficientes do denominador analógico de Young e van Vliet (1995)
+YOUNG_VAN_VLIET = (1.57825, 2.44413, 1.4281, 0.422205)
+
+class GaussianEngine:
+    """
+    Escolhe entre convolução separável (FIR) e filtro recursivo (IIR)
+
+    - FIR: kernel gaussiano amostrado, truncado em 4 sigmas, aplicado por
+      linhas e colunas com cv2.sepFilter2D em float32. É exato, mas o custo
+      cresce linearmente com sigma.
+    - IIR: filtro recursivo de terceira ordem de Young e van Vliet, uma
+      passada causal e uma anticausal por eixo (scipy.signal.lfilter com
+      coeficientes, estado e acumulação em float64; só o resultado volta ao
+      tipo da entrada). O custo por pixel não depende de sigma. A forma do
+      kernel é aproximada: para sigma entre 20 e 100 o erro máximo em relação
+      à gaussiana exata fica abaixo de 1.5% do contraste nas bordas e cantos
+      (cerca de 4 níveis em 8 bits) e abaixo de 0.2% em ruído.
+
+    Acima de recursive_sigma a rota IIR é usada (o ponto em que as duas
+    custam o mesmo fica por volta de sigma 15). As duas rotas replicam a
+    borda da imagem; na IIR as condições iniciais de cada passada (Triggs e
+    Sdika) equivalem a estender a borda infinitamente. O resultado volta ao
+    tipo da entrada com saturação, e imagens coloridas são filtradas com
+    todos os canais de uma vez.
+    """
+
+    def __init__(self, recursive_sigma=15.0):
+        self.recursive_sigma = max(recursive_sigma, RECURSIVE_MIN_SIGMA)
+
+    def gaussian(self, image, sigma, method="auto"):
+        """
+        Aplica o filtro gaussiano
+
+        Args:
+            image: Imagem de entrada (altura x largura [x canais])
+            sigma: Desvio padrão, em pixels
+            method: "auto", "fir" ou "iir" (sigmas abaixo de 0.5 usam sempre FIR)
+
+        Returns:
+            Imagem filtrada, do mesmo tipo da entrada
+        """
+        method = self.resolve_method(sigma, method)
+        if sigma <= 0:
+            return image.copy()
+
+        if method == "fir":
+            result = self._fir(to_float32(image), sigma)
+        else:
+            # Polos perto de 1: coeficientes, estado e acumulação em float64
+            result = self._iir(image.astype(np.float64), sigma)
+        return saturate(result, image.dtype)
+
+    def resolve_method(self, sigma, method="auto"):
+        """
+        Rota ("fir" ou "iir") que gaussian usará para o sigma e o método pedidos
+
+        A rota IIR tem suporte infinito: processada em blocos, cada passada
+        recomeçaria na borda do bloco e o resultado mudaria nas emendas.
+        """
+        if method not in ("auto", "fir", "iir"):
+            raise ValueError(f"Método de filtro gaussiano desconhecido: {method}")
+        if method == "auto":
+            method = "iir" if sigma > self.recursive_sigma else "fir"
+        if sigma < RECURSIVE_MIN_SIGMA:
+            # Fora da faixa da aproximação recursiva (o kernel tem 3 pixels)
+            method = "fir"
+        return method
+
+    @staticmethod
+    def radius(sigma):
+        """Raio de influência do filtro (o halo necessário para processar em blocos)"""
+        return int(TRUNCATE * sigma + 0.5)
+
+    def _fir(self, image, sigma):
+        """Convolução separável com o kernel gaussiano truncado"""
+        kernel = _fir_kernel(float(sigma))
+        return cv2.sepFilter2D(image, cv2.CV_32F, kernel, kernel,
+                               borderType=cv2.BORDER_REPLICATE).reshape(image.shape)
+
+    def _iir(self, image, sigma):
+        """Passadas recursivas causal e anticausal nas colunas e nas linhas"""
+        gain, feedback, boundary = _recursive_coefficients(float(sigma))
+        result = image
+        for axis in (1, 0):
+            result = self._recursive_axis(result, axis, gain, feedback, boundary)
+        return result
+
+    @staticmethod
+    def _recursive_axis(image, axis, gain, feedback, boundary):
+        """
+        Filtro de Young-van Vliet ao longo de um eixo
+
+        Recorrência (a mesma nas duas direções):
+            w[n] = gain * x[n] + a1 * w[n-1] + a2 * w[n-2] + a3 * w[n-3]
+        """
+        length = image.shape[axis]
+        if length < 3:
+            # A borda anticausal usa três saídas causais: replicar o início
+            # (exato, a passada causal já supõe a borda replicada)
+            pad = [(0, 0)] * image.ndim
+            pad[axis] = (3 - length, 0)
+            padded = np.pad(image, pad, mode="edge")
+            result = GaussianEngine._recursive_axis(padded, axis, gain, feedback, boundary)
+            return np.take(result, np.arange(3 - length, 3), axis=axis)
+
+        a1, a2, a3 = feedback
+        numerator = np.array([gain])
+        denominator = np.array([1.0, -a1, -a2, -a3])
+
+        # Passada causal: com a borda replicada, as saídas anteriores valem x[0]
+        first = np.take(image, [0], axis=axis)
+        state = _filter_state(feedback, first, first, first, axis)
+        forward, _ = signal.lfilter(numerator, denominator, image, axis=axis, zi=state)
+
+        # Passada anticausal: saídas além do fim a partir dos três últimos
+        # valores causais (desvio em relação ao valor de borda)
+        last = np.take(image, [-1], axis=axis)
+        tail = [np.take(forward, [-1 - i], axis=axis) - last for i in range(3)]
+        after = [last + boundary[row, 0] * tail[0] + boundary[row, 1] * tail[1]
+                 + boundary[row, 2] * tail[2] for row in range(3)]
+        state = _filter_state(feedback, after[0], after[1], after[2], axis)
+
+        backward, _ = signal.lfilter(numerator, denominator, np.flip(forward, axis=axis),
+                                     axis=axis, zi=state)
+        return np.flip(backward, axis=axis)
+
+def _filter_state(feedback, previous1, previous2, previous3, axis):
+    """
+    Estado do lfilter (forma direta II transposta) a partir das três saídas
+    anteriores y[-1], y[-2] e y[-3]
+    """
+    a1, a2, a3 = feedback
+    state = [a1 * previous1 + a2 * previous2 + a3 * previous3,
+             a2 * previous1 + a3 * previous2,
+             a3 * previous1]
+    return np.concatenate(state, axis=axis)
+
+@lru_cache(maxsize=32)
+def _fir_kernel(sigma):
+    """Kernel gaussiano amostrado e normalizado (coluna float32)"""
+    radius = int(TRUNCATE * sigma + 0.5)
+    positions = np.arange(-radius, radius + 1, dtype=np.float64)
+    kernel = np.exp(-0.5 * (positions / sigma) ** 2)
+    return (kernel / kernel.sum()).astype(np.float32)[:, None]
+
+@lru_cache(maxsize=32)
+def _recursive_coefficients(sigma):
+    """
+    Coeficientes de Young e van Vliet (1995) e matriz de borda anticausal
+
+    Returns:
+        Tupla (ganho, (a1, a2, a3), matriz 3x3 que leva os desvios das três
+        últimas saídas causais às três saídas anticausais além do fim)
+    """
+    if sigma >= 2.5:
+        q = 0.98711 * sigma - 0.96330
+    else:
+        q = 3.97156 - 4.14554 * np.sqrt(1.0 - 0.26891 * sigma)
+
+    # Denominador analógico c0 + c1*(q*s) + c2*(q*s)^2 + c3*(q*s)^3 com
+    # s = 1 - z^-1. Os b1..b3 são expandidos daqui em vez de usar os valores
+    # arredondados do artigo (2.85619, 1.26661): com os polos perto de 1, a
+    # diferença na quinta casa cresce com q^2 e estreitava o filtro (sigma
+    # efetivo 165 em vez de 200)
+    c0, c1, c2, c3 = YOUNG_VAN_VLIET
+    b0 = c0 + c1 * q + c2 * q ** 2 + c3 * q ** 3
+    b1 = c1 * q + 2.0 * c2 * q ** 2 + 3.0 * c3 * q ** 3
+    b2 = -(c2 * q ** 2 + 3.0 * c3 * q ** 3)
+    b3 = c3 * q ** 3
+    # Ganho em frequência zero exatamente 1. Os coeficientes ficam em float64:
+    # arredondá-los para float32 também desloca os polos
+    feedback = (b1 / b0, b2 / b0, b3 / b0)
+    gain = 1.0 - sum(feedback)
+
+    # Triggs e Sdika (2006): além do fim a entrada é constante, então o
+    # desvio da passada causal só decai pela recorrência. A matriz é obtida
+    # propagando cada desvio unitário até se extinguir e voltando com a
+    # passada anticausal (uma vez por sigma, em sinais 1-D curtos).
+    length = int(20 * sigma) + 64
+    denominator = [1.0, -feedback[0], -feedback[1], -feedback[2]]
+    boundary = np.empty((3, 3))
+    for column in range(3):
+        deviation = np.zeros(3)
+        deviation[column] = 1.0
+        # Continuação causal com entrada nula a partir de y[N-1], y[N-2], y[N-3]
+        state = signal.lfiltic([gain], denominator, deviation)
+        causal, _ = signal.lfilter([gain], denominator, np.zeros(length), zi=state)
+        # Passada anticausal partindo do repouso bem depois do fim
+        anticausal = signal.lfilter([gain], denominator, causal[::-1])[::-1]
+        boundary[:, column] = anticausal[:3]
+    return gain, feedback, boundary
+
+_shared_engine = GaussianEngine()
+
+def get_gaussian_engine():
+    """Motor de filtro gaussiano compartilhado por toda a aplicação"""
+    return _shared_engine
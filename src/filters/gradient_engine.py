@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gradientes de imagem (Sobel, Prewitt, Roberts) e laplaciano em float32
+"""
+
+import cv2
+import numpy as np
+
+from src.utils.dtype_utils import saturate, to_float32
+
+# Saídas que podem ser pedidas a GradientEngine.gradients
+GRADIENT_OUTPUTS = ("magnitude", "angle", "gx", "gy")
+
+# Normalização da magnitude do scikit-image: raiz da média dos quadrados
+_MAGNITUDE_SCALE = np.float32(1 / np.sqrt(2))
+
+# Operador -> (derivada, suavização) aplicados por sepFilter2D. Os kernels
+# são os do scikit-image (suavização normalizada) já com a escala da magnitude
+_SEPARABLE_KERNELS = {
+    "sobel": (np.array([-1, 0, 1], dtype=np.float32) * _MAGNITUDE_SCALE,
+              np.array([1, 2, 1], dtype=np.float32) / 4),
+    "prewitt": (np.array([-1, 0, 1], dtype=np.float32) * _MAGNITUDE_SCALE,
+                np.array([1, 1, 1], dtype=np.float32) / 3),
+}
+
+# Cruz de Roberts, âncora no canto superior esquerdo: as diferenças nas duas
+# diagonais (d1, d2) giradas 45° para os eixos, gx = (d1 - d2) / sqrt(2) e
+# gy = (d1 + d2) / sqrt(2), que junto com a escala da magnitude dá 1/2
+_ROBERTS_KERNELS = (np.array([[-1, 1], [-1, 1]], dtype=np.float32) / 2,
+                    np.array([[-1, -1], [1, 1]], dtype=np.float32) / 2)
+
+class GradientEngine:
+    """
+    Calcula as duas componentes do gradiente uma única vez e deriva delas as
+    saídas pedidas
+
+    As componentes são calculadas em float32 com cv2.sepFilter2D (Sobel e
+    Prewitt) ou cv2.filter2D (Roberts), com todos os canais de uma imagem
+    colorida na mesma chamada e a borda refletida como no scikit-image. A
+    escala 1/sqrt(2) da magnitude do scikit-image já está nos kernels, então
+    a magnitude sai de uma única passada do cv2.magnitude e o ângulo do
+    cv2.phase, sem temporários em float64 nem quadrados intermediários.
+    Os valores ficam na unidade da imagem (não na faixa [0, 1]).
+    """
+
+    def gradients(self, image, operator="sobel", outputs=("magnitude",)):
+        """
+        Calcula várias saídas do mesmo gradiente
+
+        Args:
+            image: Imagem de entrada (altura x largura [x canais])
+            operator: "sobel", "prewitt" ou "roberts"
+            outputs: Saídas desejadas entre "magnitude", "angle" (graus em
+                     [0, 360), a partir do eixo x e no sentido das linhas
+                     crescentes), "gx" e "gy"; magnitude = sqrt(gx² + gy²)
+
+        Returns:
+            Dicionário saída -> matriz float32
+        """
+        unknown = [name for name in outputs if name not in GRADIENT_OUTPUTS]
+        if unknown:
+            raise ValueError(f"Saída de gradiente desconhecida: {', '.join(unknown)}")
+
+        gx, gy = self._components(to_float32(image), operator)
+        result = {}
+        if "magnitude" in outputs:
+            result["magnitude"] = self._shaped(cv2.magnitude(gx, gy), image)
+        if "angle" in outputs:
+            result["angle"] = self._shaped(cv2.phase(gx, gy, angleInDegrees=True), image)
+        if "gx" in outputs:
+            result["gx"] = gx
+        if "gy" in outputs:
+            result["gy"] = gy
+        return result
+
+    def magnitude(self, image, operator="sobel"):
+        """
+        Magnitude do gradiente no tipo da imagem, com saturação
+
+        Args:
+            image: Imagem de entrada (uint8, uint16 ou float32)
+            operator: "sobel", "prewitt" ou "roberts"
+
+        Returns:
+            Imagem com bordas detectadas, do mesmo tipo da entrada
+        """
+        magnitude = self.gradients(image, operator, ("magnitude",))["magnitude"]
+        return saturate(magnitude, image.dtype)
+
+    def laplacian(self, image):
+        """
+        Valor absoluto do laplaciano (kernel 3x3 do OpenCV), com saturação
+
+        Args:
+            image: Imagem de entrada (uint8, uint16 ou float32)
+
+        Returns:
+            Imagem com bordas detectadas, do mesmo tipo da entrada
+        """
+        # float32 representa exatamente 8 e 16 bits
+        laplacian = cv2.Laplacian(image, cv2.CV_32F)
+        abs_laplacian = np.absolute(laplacian, out=laplacian)
+        return saturate(abs_laplacian, image.dtype)
+
+    def _components(self, image, operator):
+        """Componentes (gx, gy) do gradiente, já com a escala da magnitude"""
+        if operator == "roberts":
+            gx, gy = (cv2.filter2D(image, cv2.CV_32F, kernel, anchor=(0, 0),
+                                   borderType=cv2.BORDER_REFLECT)
+                      for kernel in _ROBERTS_KERNELS)
+            return self._shaped(gx, image), self._shaped(gy, image)
+
+        if operator not in _SEPARABLE_KERNELS:
+            raise ValueError(f"Operador de gradiente desconhecido: {operator}")
+        derivative, smooth = _SEPARABLE_KERNELS[operator]
+        gx = cv2.sepFilter2D(image, cv2.CV_32F, derivative, smooth, borderType=cv2.BORDER_REFLECT)
+        gy = cv2.sepFilter2D(image, cv2.CV_32F, smooth, derivative, borderType=cv2.BORDER_REFLECT)
+        return self._shaped(gx, image), self._shaped(gy, image)
+
+    @staticmethod
+    def _shaped(result, image):
+        """Restaura o eixo de canais que o OpenCV descarta em imagens de um canal"""
+        return result.reshape(image.shape)
+
+_shared_engine = GradientEngine()
+
+def get_gradient_engine():
+    """Motor de gradientes compartilhado por toda a aplicação"""
+    return _shared_engine
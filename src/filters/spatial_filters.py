@@ -5,15 +5,27 @@ Filtros espaciais para processamento de imagens
 """
 
 import cv2
-import numpy as np
-from scipy import ndimage
-from skimage import filters
+
+from src.tiling.tile_engine import TileEngine
+from .gaussian_engine import get_gaussian_engine
+from .gradient_engine import get_gradient_engine
+from .median_engine import get_median_engine
+from .extrema_engine import get_extrema_engine
 
 class SpatialFilters:
     """Classe para filtros espaciais"""
     
     def __init__(self):
-        pass
+        # Imagens grandes são processadas em blocos com halo igual ao raio do kernel
+        self.tile_engine = TileEngine()
+        # Mediana com algoritmo escolhido pelo tipo da imagem e tamanho do kernel
+        self.median_engine = get_median_engine()
+        # Máximo/mínimo com custo independente do tamanho do kernel
+        self.extrema_engine = get_extrema_engine()
+        # Gaussiana separável ou recursiva, escolhida pelo sigma
+        self.gaussian_engine = get_gaussian_engine()
+        # Gradientes e laplaciano em float32, com saturação no tipo da imagem
+        self.gradient_engine = get_gradient_engine()
         
     def mean_filter(self, image, kernel_size=3):
         """
@@ -31,7 +43,8 @@ class SpatialFilters:
             kernel_size += 1
             
         # Aplicar filtro da média
-        result = cv2.blur(image, (kernel_size, kernel_size))
+        result = self.tile_engine.apply(
+            image, lambda tile: cv2.blur(tile, (kernel_size, kernel_size)), kernel_size // 2)
         
         return result
         
@@ -51,25 +64,34 @@ class SpatialFilters:
             kernel_size += 1
             
         # Aplicar filtro da mediana
-        result = cv2.medianBlur(image, kernel_size)
+        result = self.tile_engine.apply(
+            image, lambda tile: self.median_engine.median(tile, kernel_size), kernel_size // 2)
         
         return result
         
-    def gaussian_filter(self, image, sigma=1.0):
+    def gaussian_filter(self, image, sigma=1.0, method="auto"):
         """
         Aplica filtro gaussiano
         
         Args:
             image: Imagem de entrada
             sigma: Desvio padrão do filtro gaussiano
+            method: "auto" (escolha pelo sigma), "fir" (separável) ou "iir" (recursivo)
             
         Returns:
-            Imagem filtrada
+            Imagem filtrada, do mesmo tipo da entrada
         """
-        # Aplicar filtro gaussiano
-        result = ndimage.gaussian_filter(image, sigma=sigma)
+        # A rota recursiva já custa O(1) por pixel e não tem raio finito:
+        # processar em blocos só mudaria o resultado nas emendas
+        if self.gaussian_engine.resolve_method(sigma, method) == "iir":
+            return self.gaussian_engine.gaussian(image, sigma, method)
+
+        # Aplicar filtro gaussiano (halo: raio de 4 sigmas, como no kernel separável)
+        result = self.tile_engine.apply(
+            image, lambda tile: self.gaussian_engine.gaussian(tile, sigma, method),
+            self.gaussian_engine.radius(sigma))
         
-        return result.astype(np.uint8)
+        return result
         
     def max_filter(self, image, kernel_size=3):
         """
@@ -87,7 +109,8 @@ class SpatialFilters:
             kernel_size += 1
             
         # Aplicar filtro máximo
-        result = ndimage.maximum_filter(image, size=kernel_size)
+        result = self.tile_engine.apply(
+            image, lambda tile: self.extrema_engine.maximum(tile, kernel_size), kernel_size // 2)
         
         return result
         
@@ -107,7 +130,8 @@ class SpatialFilters:
             kernel_size += 1
             
         # Aplicar filtro mínimo
-        result = ndimage.minimum_filter(image, size=kernel_size)
+        result = self.tile_engine.apply(
+            image, lambda tile: self.extrema_engine.minimum(tile, kernel_size), kernel_size // 2)
         
         return result
         
@@ -121,16 +145,7 @@ class SpatialFilters:
         Returns:
             Imagem com bordas detectadas
         """
-        # Aplicar filtro laplaciano
-        laplacian = cv2.Laplacian(image, cv2.CV_64F)
-        
-        # Converter para valores absolutos
-        abs_laplacian = np.absolute(laplacian)
-        
-        # Normalizar para [0, 255]
-        result = np.uint8(abs_laplacian)
-        
-        return result
+        return self.tile_engine.apply(image, self.gradient_engine.laplacian, 1)
         
     def roberts_filter(self, image):
         """
@@ -142,13 +157,8 @@ class SpatialFilters:
         Returns:
             Imagem com bordas detectadas
         """
-        # Aplicar filtro de Roberts
-        roberts = filters.roberts(image)
-        
-        # Normalizar para [0, 255]
-        result = np.uint8(roberts * 255)
-        
-        return result
+        return self.tile_engine.apply(
+            image, lambda tile: self.gradient_engine.magnitude(tile, "roberts"), 1)
         
     def prewitt_filter(self, image):
         """
@@ -160,13 +170,8 @@ class SpatialFilters:
         Returns:
             Imagem com bordas detectadas
         """
-        # Aplicar filtro de Prewitt
-        prewitt = filters.prewitt(image)
-        
-        # Normalizar para [0, 255]
-        result = np.uint8(prewitt * 255)
-        
-        return result
+        return self.tile_engine.apply(
+            image, lambda tile: self.gradient_engine.magnitude(tile, "prewitt"), 1)
         
     def sobel_filter(self, image):
         """
@@ -178,10 +183,5 @@ class SpatialFilters:
         Returns:
             Imagem com bordas detectadas
         """
-        # Aplicar filtro de Sobel
-        sobel = filters.sobel(image)
-        
-        # Normalizar para [0, 255]
-        result = np.uint8(sobel * 255)
-        
-        return result 
\ No newline at end of file
+        return self.tile_engine.apply(
+            image, lambda tile: self.gradient_engine.magnitude(tile, "sobel"), 1)
@@ -5,78 +5,91 @@ Filtros no domínio da frequência
 """
 
 import numpy as np
-import cv2
+
+from src.utils.dtype_utils import saturate
+from .frequency_masks import get_frequency_masks
+from .spectrum_cache import get_spectrum_cache
 
 class FrequencyFilters:
     """Classe para filtros no domínio da frequência"""
-    
+
     def __init__(self):
-        pass
-        
-    def low_pass_filter(self, image, cutoff=30):
+        # O espectro de cada imagem e as máscaras são calculados uma única vez
+        self.spectrum_cache = get_spectrum_cache()
+        self.masks = get_frequency_masks()
+
+    def low_pass_filter(self, image, cutoff=30, filter_shape="ideal", order=2):
         """
         Aplica filtro passa-baixa no domínio da frequência
-        
+
         Args:
             image: Imagem de entrada
             cutoff: Frequência de corte
-            
+            filter_shape: Forma da máscara ("ideal", "butterworth" ou "gaussian")
+            order: Ordem do filtro Butterworth
+
         Returns:
             Imagem filtrada
         """
-        # Calcular transformada de Fourier
-        f_transform = np.fft.fft2(image)
-        f_shift = np.fft.fftshift(f_transform)
-        
-        # Criar máscara passa-baixa
-        rows, cols = image.shape
-        crow, ccol = rows // 2, cols // 2
-        mask = np.zeros((rows, cols), np.uint8)
-        cv2.circle(mask, (ccol, crow), cutoff, 1, -1)
-        
-        # Aplicar máscara
-        f_shift_filtered = f_shift * mask
-        
-        # Transformada inversa
-        f_ishift = np.fft.ifftshift(f_shift_filtered)
-        img_back = np.fft.ifft2(f_ishift)
-        img_back = np.abs(img_back)
-        
-        # Normalizar para [0, 255]
-        result = np.uint8(img_back)
-        
-        return result
-        
-    def high_pass_filter(self, image, cutoff=30):
+        return self._filter(image, "low_pass", filter_shape, cutoff=cutoff, order=order)
+
+    def high_pass_filter(self, image, cutoff=30, filter_shape="ideal", order=2):
         """
         Aplica filtro passa-alta no domínio da frequência
-        
+
         Args:
             image: Imagem de entrada
             cutoff: Frequência de corte
-            
+            filter_shape: Forma da máscara ("ideal", "butterworth" ou "gaussian")
+            order: Ordem do filtro Butterworth
+
         Returns:
             Imagem filtrada
         """
-        # Calcular transformada de Fourier
-        f_transform = np.fft.fft2(image)
-        f_shift = np.fft.fftshift(f_transform)
-        
-        # Criar máscara passa-alta
-        rows, cols = image.shape
-        crow, ccol = rows // 2, cols // 2
-        mask = np.ones((rows, cols), np.uint8)
-        cv2.circle(mask, (ccol, crow), cutoff, 0, -1)
-        
-        # Aplicar máscara
-        f_shift_filtered = f_shift * mask
-        
-        # Transformada inversa
-        f_ishift = np.fft.ifftshift(f_shift_filtered)
-        img_back = np.fft.ifft2(f_ishift)
-        img_back = np.abs(img_back)
-        
-        # Normalizar para [0, 255]
-        result = np.uint8(img_back)
-        
-        return result 
\ No newline at end of file
+        return self._filter(image, "high_pass", filter_shape, cutoff=cutoff, order=order)
+
+    def band_pass_filter(self, image, cutoff=30, width=10, filter_shape="ideal", order=2):
+        """
+        Aplica filtro passa-faixa no domínio da frequência
+
+        Args:
+            image: Imagem de entrada
+            cutoff: Frequência central da faixa
+            width: Largura da faixa
+            filter_shape: Forma da máscara ("ideal", "butterworth" ou "gaussian")
+            order: Ordem do filtro Butterworth
+
+        Returns:
+            Imagem filtrada
+        """
+        return self._filter(image, "band_pass", filter_shape, cutoff=cutoff, order=order, width=width)
+
+    def band_reject_filter(self, image, cutoff=30, width=10, filter_shape="ideal", order=2):
+        """
+        Aplica filtro rejeita-faixa no domínio da frequência
+
+        Args:
+            image: Imagem de entrada
+            cutoff: Frequência central da faixa
+            width: Largura da faixa
+            filter_shape: Forma da máscara ("ideal", "butterworth" ou "gaussian")
+            order: Ordem do filtro Butterworth
+
+        Returns:
+            Imagem filtrada
+        """
+        return self._filter(image, "band_reject", filter_shape, cutoff=cutoff, order=order, width=width)
+
+    def _filter(self, image, kind, filter_shape, **params):
+        """Aplica a máscara ao espectro (cacheado) e retorna a imagem filtrada"""
+        spectrum = self.spectrum_cache.get_spectrum(image)
+        mask = self.masks.get_mask(spectrum, kind, filter_shape, **params)
+        if spectrum.spectrum.ndim == 3:
+            # Mesma máscara para todos os canais, por broadcast
+            mask = mask[..., None]
+
+        # Aplicar máscara e calcular a transformada inversa
+        img_back = np.abs(spectrum.inverse(spectrum.spectrum * mask))
+
+        # Saturar na faixa do tipo da imagem (uint8, uint16) ou manter float32
+        return saturate(img_back, image.dtype)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Geração de máscaras para filtros no domínio da frequência
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+FILTER_SHAPES = ("ideal", "butterworth", "gaussian")
+FILTER_KINDS = ("low_pass", "high_pass", "band_pass", "band_reject")
+
+class FrequencyMasks:
+    """
+    Máscaras vetorizadas derivadas de uma grade de distâncias radiais
+
+    A grade D(u, v) é calculada uma vez por formato de espectro; as máscaras
+    ideal, Butterworth e gaussiana (passa-baixa, passa-alta, passa-faixa e
+    rejeita-faixa) são obtidas dela com operações vetorizadas e guardadas em
+    um cache LRU indexado por (formato, tipo, parâmetros). Grades e máscaras
+    têm o tamanho do espectro (cerca de 512 MB cada em uma imagem de
+    16k x 16k), então os dois caches são limitados em bytes.
+    """
+
+    def __init__(self, max_mask_bytes=512 * 1024 * 1024, max_grid_bytes=256 * 1024 * 1024):
+        self.max_mask_bytes = max_mask_bytes
+        self.max_grid_bytes = max_grid_bytes
+        self.grids = OrderedDict()
+        self.masks = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_mask(self, spectrum, kind, filter_shape="ideal", cutoff=30, order=2, width=10):
+        """
+        Retorna a máscara para o espectro informado
+
+        Args:
+            spectrum: Objeto FFTSpectrum (define o formato e a grade de frequências)
+            kind: "low_pass", "high_pass", "band_pass" ou "band_reject"
+            filter_shape: "ideal", "butterworth" ou "gaussian"
+            cutoff: Frequência de corte (centro da faixa nos filtros de faixa)
+            order: Ordem do filtro Butterworth
+            width: Largura da faixa nos filtros de faixa
+
+        Returns:
+            Máscara (float32) no formato do espectro
+        """
+        if kind not in FILTER_KINDS:
+            raise ValueError(f"Tipo de filtro desconhecido: {kind}")
+        if filter_shape not in FILTER_SHAPES:
+            raise ValueError(f"Forma de filtro desconhecida: {filter_shape}")
+
+        shape = (spectrum.image_shape, spectrum.padded_shape)
+        # Parâmetros que não afetam a máscara não entram na chave
+        key = (shape, kind, filter_shape, float(cutoff),
+               int(order) if filter_shape == "butterworth" else None,
+               float(width) if kind in ("band_pass", "band_reject") else None)
+
+        with self.lock:
+            mask = self.masks.get(key)
+            if mask is not None:
+                self.masks.move_to_end(key)
+                return mask
+
+        distance = self.radial_distance(spectrum)
+        if kind in ("low_pass", "high_pass"):
+            mask = self._low_pass(distance, filter_shape, float(cutoff), int(order))
+        else:
+            mask = self._band_reject(distance, filter_shape, float(cutoff), float(width), int(order))
+
+        # Passa-alta e passa-faixa são complementos
+        if kind in ("high_pass", "band_pass"):
+            np.subtract(1.0, mask, out=mask)
+
+        # Máscaras cacheadas são compartilhadas e não podem ser modificadas
+        mask.setflags(write=False)
+
+        with self.lock:
+            self.masks[key] = mask
+            self._evict(self.masks, self.max_mask_bytes)
+        return mask
+
+    def radial_distance(self, spectrum):
+        """Grade de distâncias ao centro do espectro (calculada uma vez por formato)"""
+        shape = (spectrum.image_shape, spectrum.padded_shape)
+        with self.lock:
+            distance = self.grids.get(shape)
+            if distance is not None:
+                self.grids.move_to_end(shape)
+                return distance
+
+        fu, fv = spectrum.frequency_grid()
+        distance = np.sqrt(fu * fu + fv * fv)
+        distance.setflags(write=False)
+
+        with self.lock:
+            self.grids[shape] = distance
+            self._evict(self.grids, self.max_grid_bytes)
+        return distance
+
+    def clear(self):
+        """Remove todas as máscaras e grades"""
+        with self.lock:
+            self.masks.clear()
+            self.grids.clear()
+
+    @staticmethod
+    def _evict(entries, max_bytes):
+        """Remove as entradas menos usadas até caber no limite (mantém a mais recente)"""
+        while len(entries) > 1 and sum(array.nbytes for array in entries.values()) > max_bytes:
+            entries.popitem(last=False)
+
+    def _low_pass(self, distance, filter_shape, cutoff, order):
+        """Máscara passa-baixa"""
+        cutoff = max(cutoff, 1e-6)
+        if filter_shape == "ideal":
+            return (distance <= cutoff).astype(np.float32)
+        if filter_shape == "butterworth":
+            # H = 1 / (1 + (D / D0)^(2n))
+            with np.errstate(over="ignore"):
+                mask = np.power(distance / np.float32(cutoff), 2 * order, dtype=np.float32)
+            mask += 1.0
+            return np.reciprocal(mask, out=mask)
+        # H = exp(-D² / (2 D0²))
+        mask = np.square(distance) * np.float32(-0.5 / (cutoff * cutoff))
+        return np.exp(mask, out=mask)
+
+    def _band_reject(self, distance, filter_shape, cutoff, width, order):
+        """Máscara rejeita-faixa centrada em cutoff com largura width"""
+        width = max(width, 1e-6)
+        if filter_shape == "ideal":
+            inside = np.abs(distance - np.float32(cutoff)) <= width / 2
+            return (~inside).astype(np.float32)
+
+        # Termo (D² - D0²) / (D W), comum às formas Butterworth e gaussiana
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = (np.square(distance) - np.float32(cutoff * cutoff)) / (distance * np.float32(width))
+        ratio[distance == 0] = np.inf
+
+        if filter_shape == "butterworth":
+            # H = 1 / (1 + (D W / (D² - D0²))^(2n))
+            with np.errstate(divide="ignore", over="ignore"):
+                mask = np.power(np.reciprocal(ratio), 2 * order, dtype=np.float32)
+            mask += 1.0
+            return np.reciprocal(mask, out=mask)
+        # H = 1 - exp(-((D² - D0²) / (D W))²)
+        with np.errstate(over="ignore"):
+            mask = np.exp(-np.square(ratio))
+        return np.subtract(1.0, mask, out=mask)
+
+_shared_masks = FrequencyMasks()
+
+def get_frequency_masks():
+    """Gerador de máscaras compartilhado por toda a aplicação"""
+    return _shared_masks
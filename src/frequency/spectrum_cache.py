@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache do espectro de Fourier compartilhado pelos filtros de frequência
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from scipy import fft
+
+from src.utils.image_key import image_key
+
+class FFTSpectrum:
+    """
+    Espectro de uma imagem calculado com FFT real sobre um tamanho rápido
+
+    Imagens coloridas (altura x largura x canais) são transformadas em uma
+    única chamada sobre os eixos espaciais: o pocketfft do scipy distribui
+    os canais entre as threads, sem laço em Python.
+    """
+
+    def __init__(self, image):
+        self.image_shape = image.shape[:2]
+        rows, cols = self.image_shape
+
+        # Tamanhos com fatores primos pequenos são muito mais rápidos
+        self.padded_shape = (fft.next_fast_len(rows, real=True), fft.next_fast_len(cols, real=True))
+        pad = ((0, self.padded_shape[0] - rows), (0, self.padded_shape[1] - cols)) + ((0, 0),) * (image.ndim - 2)
+
+        # Preencher por reflexão evita descontinuidades nas bordas
+        padded = np.pad(image, pad, mode="symmetric").astype(np.float32)
+
+        # FFT de entrada real: metade das colunas, em complex64
+        self.spectrum = fft.rfft2(padded, axes=(0, 1), workers=-1)
+        self._magnitude = None
+
+    @property
+    def nbytes(self):
+        """Memória ocupada pelo espectro"""
+        size = self.spectrum.nbytes
+        if self._magnitude is not None:
+            size += self._magnitude.nbytes
+        return size
+
+    def frequency_grid(self):
+        """
+        Frequências de cada coeficiente, em unidades da imagem original
+
+        Returns:
+            Tupla (frequências das linhas, frequências das colunas) prontas para broadcast
+        """
+        rows, cols = self.image_shape
+        padded_rows, padded_cols = self.padded_shape
+        fu = (fft.fftfreq(padded_rows) * rows).astype(np.float32)
+        fv = (fft.rfftfreq(padded_cols) * cols).astype(np.float32)
+        return fu[:, None], fv[None, :]
+
+    def inverse(self, filtered):
+        """
+        Transformada inversa de um espectro filtrado
+
+        Args:
+            filtered: Espectro no mesmo formato de self.spectrum
+
+        Returns:
+            Imagem real (float32) com o tamanho e os canais originais
+        """
+        rows, cols = self.image_shape
+        image = fft.irfft2(filtered, s=self.padded_shape, axes=(0, 1), workers=-1)
+        return image[:rows, :cols]
+
+    def magnitude_spectrum(self):
+        """Espectro de magnitude log(1 + |F|) completo e centralizado (média dos canais)"""
+        if self._magnitude is None:
+            padded_rows, padded_cols = self.padded_shape
+            half = np.log1p(np.abs(self.spectrum))
+            if half.ndim == 3:
+                half = half.mean(axis=2)
+
+            # Reconstruir as colunas negativas pela simetria hermitiana
+            full = np.empty(self.padded_shape, dtype=half.dtype)
+            full[:, :half.shape[1]] = half
+            negative_cols = np.arange(half.shape[1], padded_cols)
+            mirrored_rows = (-np.arange(padded_rows)) % padded_rows
+            full[:, negative_cols] = half[mirrored_rows][:, padded_cols - negative_cols]
+
+            self._magnitude = np.fft.fftshift(full)
+        return self._magnitude
+
+class SpectrumCache:
+    """Cache LRU de espectros indexado pelo conteúdo da imagem"""
+
+    def __init__(self, max_bytes=1024 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_spectrum(self, image):
+        """
+        Retorna o espectro da imagem, calculando-o apenas na primeira vez
+
+        Args:
+            image: Imagem de entrada
+
+        Returns:
+            Objeto FFTSpectrum
+        """
+        key = image_key(image)
+        with self.lock:
+            spectrum = self.entries.get(key)
+            if spectrum is not None:
+                self.entries.move_to_end(key)
+                return spectrum
+
+        spectrum = FFTSpectrum(image)
+
+        with self.lock:
+            self.entries[key] = spectrum
+            self.entries.move_to_end(key)
+            self._evict()
+        return spectrum
+
+    def clear(self):
+        """Remove todos os espectros"""
+        with self.lock:
+            self.entries.clear()
+
+    def _evict(self):
+        """Remove os espectros menos usados até caber no limite (mantém o mais recente)"""
+        while len(self.entries) > 1 and sum(s.nbytes for s in self.entries.values()) > self.max_bytes:
+            self.entries.popitem(last=False)
+
+_shared_cache = SpectrumCache()
+
+def get_spectrum_cache():
+    """Cache de espectros compartilhado por toda a aplicação"""
+    return _shared_cache
@@ -0,0 +1 @@
+# Histórico de edições da imagem
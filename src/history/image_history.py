@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Histórico de desfazer/refazer com limite de memória
+"""
+
+import time
+import zlib
+
+from src.utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+class HistoryEntry:
+    """Estado do histórico: quadro-chave ou delta em relação ao estado anterior"""
+
+    __slots__ = ("label", "operation", "is_keyframe", "data", "compressed", "shape", "dtype")
+
+    def __init__(self, label, operation, is_keyframe, data, compressed, shape, dtype):
+        self.label = label
+        self.operation = operation
+        self.is_keyframe = is_keyframe
+        self.data = data
+        self.compressed = compressed
+        self.shape = shape
+        self.dtype = dtype
+
+    @property
+    def nbytes(self):
+        """Memória ocupada pelo estado armazenado"""
+        return len(self.data) if self.compressed else self.data.nbytes
+
+class PendingPush:
+    """
+    Novo estado do histórico preparado em duas etapas
+
+    encode comprime o estado (o trabalho caro) e pode rodar em qualquer
+    thread, por exemplo a que calculou a imagem; commit só anexa a entrada
+    pronta e deve rodar na thread dona do histórico.
+    """
+
+    def __init__(self, history, label, operation):
+        self.history = history
+        self.label = label
+        self.operation = operation
+        # Estado no momento do pedido: o delta é calculado contra ele
+        self.previous = history.current_image
+        self.index = history.index
+        self.keyframe = history._needs_keyframe()
+        self.image = None
+        self.entry = None
+        self.seconds = 0.0
+
+    def encode(self, image):
+        """Comprime o novo estado (seguro fora da thread da interface)"""
+        start = time.perf_counter()
+        self.image = image
+        self.entry = self.history._encode(self.previous, image, self.label, self.operation, self.keyframe)
+        self.seconds = time.perf_counter() - start
+
+    def commit(self):
+        """Anexa o estado ao histórico"""
+        history = self.history
+        if self.entry is None:
+            raise RuntimeError("O estado precisa ser codificado antes de ser anexado")
+        if history.index != self.index or history.current_image is not self.previous:
+            # O histórico mudou desde o pedido: o delta não vale mais
+            history.push(self.image, self.label, self.operation)
+            return
+        history._append(self.entry, self.image)
+
+class ImageHistory:
+    """
+    Histórico de imagens com quadros-chave periódicos e deltas comprimidos
+
+    Cada entrada guarda o registro da operação e, em vez de uma cópia completa,
+    o XOR comprimido entre o estado anterior e o novo. Como o XOR é reversível,
+    desfazer/refazer a partir do estado atual custa uma única descompressão;
+    saltos maiores reconstroem o estado a partir do quadro-chave mais próximo.
+
+    A compressão de um novo estado pode ser feita fora da thread da interface
+    com begin_push (PendingPush.encode na thread de trabalho, commit na
+    interface). Antes de comprimir um buffer inteiro, uma amostra estima se a
+    compressão compensa: filtros que mudam quase todos os pixels vão direto
+    para quadro-chave, sem comprimir o delta e depois a imagem.
+    """
+
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+    # Amostra usada para estimar a taxa de compressão (blocos espaçados)
+    SAMPLE_BLOCKS = 16
+    SAMPLE_BLOCK_BYTES = 64 * 1024
+
+    # Limites de tamanho comprimido, em fração da imagem
+    DELTA_MAX_RATIO = 0.5
+    KEYFRAME_MAX_RATIO = 0.9
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, keyframe_interval=8, compression_level=1):
+        self.max_bytes = max_bytes
+        self.keyframe_interval = keyframe_interval
+        self.compression_level = compression_level
+        self.entries = []
+        self.index = -1
+        self.current_image = None
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def nbytes(self):
+        """Memória total ocupada pelo histórico"""
+        return sum(entry.nbytes for entry in self.entries)
+
+    def can_undo(self):
+        """Indica se há um estado anterior"""
+        return self.index > 0
+
+    def can_redo(self):
+        """Indica se há um estado posterior"""
+        return self.index < len(self.entries) - 1
+
+    def current_label(self):
+        """Descrição da operação que gerou o estado atual"""
+        return self.entries[self.index].label if self.entries else None
+
+    def reset(self, image, label=None):
+        """
+        Reinicia o histórico a partir de uma imagem
+
+        Args:
+            image: Imagem inicial (não deve ser modificada posteriormente)
+            label: Descrição do estado inicial
+        """
+        self.entries = [self._make_keyframe(image, label, None)]
+        self.index = 0
+        self.current_image = image
+
+    def push(self, image, label=None, operation=None):
+        """
+        Adiciona um novo estado após o atual, descartando os estados refazíveis
+
+        Args:
+            image: Nova imagem (não deve ser modificada posteriormente)
+            label: Descrição da operação
+            operation: Tupla (nome, parâmetros) da operação aplicada
+        """
+        if not self.entries:
+            self.reset(image, label)
+            return
+
+        pending = self.begin_push(label, operation)
+        pending.encode(image)
+        pending.commit()
+
+    def begin_push(self, label=None, operation=None):
+        """
+        Prepara um novo estado cuja compressão pode rodar em outra thread
+
+        Args:
+            label: Descrição da operação
+            operation: Tupla (nome, parâmetros) da operação aplicada
+
+        Returns:
+            PendingPush; chamar encode(imagem) e depois commit()
+        """
+        return PendingPush(self, label, operation)
+
+    def undo(self):
+        """Volta para o estado anterior e retorna a imagem correspondente"""
+        if not self.can_undo():
+            return None
+        return self._move_to(self.index - 1)
+
+    def redo(self):
+        """Avança para o próximo estado e retorna a imagem correspondente"""
+        if not self.can_redo():
+            return None
+        return self._move_to(self.index + 1)
+
+    def state_at(self, index):
+        """Reconstrói o estado de uma posição do histórico"""
+        if index == self.index:
+            return self.current_image
+
+        # Um passo a partir do estado atual: basta aplicar o delta
+        if index == self.index - 1 and not self.entries[self.index].is_keyframe:
+            return self._apply_delta(self.current_image, self.entries[self.index])
+        if index == self.index + 1 and not self.entries[index].is_keyframe:
+            return self._apply_delta(self.current_image, self.entries[index])
+
+        # Caso geral: partir do quadro-chave mais próximo
+        start = self._keyframe_before(index)
+        image = self._decode_keyframe(self.entries[start])
+        for position in range(start + 1, index + 1):
+            image = self._apply_delta(image, self.entries[position])
+        return image
+
+    def _move_to(self, index):
+        """Torna atual a posição informada"""
+        image = self.state_at(index)
+        self.index = index
+        self.current_image = image
+        return image
+
+    def _keyframe_before(self, index):
+        """Posição do quadro-chave mais próximo, até a posição informada"""
+        while not self.entries[index].is_keyframe:
+            index -= 1
+        return index
+
+    def _needs_keyframe(self):
+        """Indica se o próximo estado deve ser um quadro-chave pelo intervalo"""
+        if not self.entries:
+            return True
+        return self.index - self._keyframe_before(self.index) + 1 >= self.keyframe_interval
+
+    def _append(self, entry, image):
+        """Anexa uma entrada pronta após o estado atual, descartando os refazíveis"""
+        del self.entries[self.index + 1:]
+        self.entries.append(entry)
+        self.index += 1
+        self.current_image = image
+        self._enforce_budget()
+
+    def _encode(self, previous, image, label, operation, keyframe):
+        """Cria a entrada de um novo estado (não altera o histórico)"""
+        if keyframe or previous is None or previous.shape != image.shape or previous.dtype != image.dtype:
+            return self._make_keyframe(image, label, operation)
+        return self._make_delta(previous, image, label, operation)
+
+    def _make_keyframe(self, image, label, operation):
+        """Cria um quadro-chave, comprimido quando a compressão compensa"""
+        image = np.ascontiguousarray(image)
+        data = image.reshape(-1).view(np.uint8)
+        if self._estimated_ratio(data) < self.KEYFRAME_MAX_RATIO:
+            compressed = zlib.compress(data, self.compression_level)
+            if len(compressed) < image.nbytes * self.KEYFRAME_MAX_RATIO:
+                return HistoryEntry(label, operation, True, compressed, True, image.shape, image.dtype)
+        return HistoryEntry(label, operation, True, image, False, image.shape, image.dtype)
+
+    def _make_delta(self, previous, image, label, operation):
+        """Cria um delta comprimido; usa quadro-chave se o delta não compensar"""
+        previous = np.ascontiguousarray(previous).reshape(-1).view(np.uint8)
+        current = np.ascontiguousarray(image).reshape(-1).view(np.uint8)
+
+        # Estimar pela amostra antes de calcular e comprimir o XOR inteiro
+        sample = self._sample_slices(current.size)
+        if sample is not None:
+            delta_sample = np.concatenate([np.bitwise_xor(previous[part], current[part]) for part in sample])
+            if self._compressed_ratio(delta_sample) >= self.DELTA_MAX_RATIO:
+                return self._make_keyframe(image, label, operation)
+
+        delta = np.bitwise_xor(previous, current)
+        compressed = zlib.compress(delta, self.compression_level)
+        del delta
+
+        if len(compressed) >= current.size * self.DELTA_MAX_RATIO:
+            return self._make_keyframe(image, label, operation)
+        return HistoryEntry(label, operation, False, compressed, True, image.shape, image.dtype)
+
+    def _sample_slices(self, size):
+        """Blocos espaçados ao longo do buffer, ou None se o buffer for pequeno"""
+        blocks, block = self.SAMPLE_BLOCKS, self.SAMPLE_BLOCK_BYTES
+        if size <= 4 * blocks * block:
+            return None
+        step = size // blocks
+        return [slice(i * step, i * step + block) for i in range(blocks)]
+
+    def _estimated_ratio(self, data):
+        """Taxa de compressão estimada por amostra (0 quando o buffer é pequeno)"""
+        sample = self._sample_slices(data.size)
+        if sample is None:
+            return 0.0
+        return self._compressed_ratio(np.concatenate([data[part] for part in sample]))
+
+    def _compressed_ratio(self, data):
+        """Tamanho comprimido em fração do original"""
+        return len(zlib.compress(data, self.compression_level)) / max(data.size, 1)
+
+    def _decode_keyframe(self, entry):
+        """Recupera a imagem de um quadro-chave"""
+        if not entry.compressed:
+            return entry.data
+        buffer = np.frombuffer(zlib.decompress(entry.data), dtype=entry.dtype)
+        return buffer.reshape(entry.shape)
+
+    def _apply_delta(self, image, entry):
+        """Aplica (ou desfaz) um delta sobre a imagem"""
+        if entry.is_keyframe:
+            return self._decode_keyframe(entry)
+
+        delta = np.frombuffer(zlib.decompress(entry.data), dtype=np.uint8)
+        result = np.empty(entry.shape, dtype=entry.dtype)
+        np.bitwise_xor(np.ascontiguousarray(image).reshape(-1).view(np.uint8), delta,
+                       out=result.reshape(-1).view(np.uint8))
+        return result
+
+    def _enforce_budget(self):
+        """Remove os estados mais antigos (e depois os refazíveis) até caber no limite"""
+        while self.nbytes > self.max_bytes and self.index > 0:
+            # O novo primeiro estado precisa ser um quadro-chave
+            if not self.entries[1].is_keyframe:
+                image = self.state_at(1)
+                entry = self.entries[1]
+                self.entries[1] = self._make_keyframe(image, entry.label, entry.operation)
+            del self.entries[0]
+            self.index -= 1
+
+        while self.nbytes > self.max_bytes and self.can_redo():
+            self.entries.pop()
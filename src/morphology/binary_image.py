@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Imagem binária compactada (64 pixels por palavra) para morfologia binária
+"""
+
+import cv2
+import numpy as np
+
+WORD_BITS = 64
+
+# Contagem de bits por byte, usada quando numpy.bitwise_count não existe
+_BYTE_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+def is_binary_mask(image):
+    """Indica se a imagem é uma máscara uint8 2-D contendo apenas 0 e 255"""
+    if image.dtype != np.uint8 or image.ndim != 2 or image.size == 0:
+        return False
+    # Uma única passada vetorizada procurando valores intermediários
+    return cv2.countNonZero(cv2.inRange(image, 1, 254)) == 0
+
+def _runs(row):
+    """Trechos contínuos (primeira, última coluna) de uma linha booleana"""
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], row, [False])).astype(np.int8)))
+    return [(int(start), int(end) - 1) for start, end in zip(edges[::2], edges[1::2])]
+
+class PackedBinaryImage:
+    """
+    Máscara binária com um bit por pixel
+
+    Cada linha é guardada como palavras uint64: o pixel x da linha é o bit
+    x % 64 da palavra x // 64 (ordem little-endian, como
+    numpy.packbits(bitorder="little")). Os bits excedentes da última palavra
+    são sempre zero.
+
+    Erosão e dilatação usam deslocamentos de palavras e OR, dobrando o
+    alcance a cada passo (O(log k) operações por eixo em uma janela
+    retangular, cada uma sobre 64 pixels por vez); a erosão é o complemento
+    da dilatação do complemento. Pixels fora da imagem são neutros, como na
+    morfologia do OpenCV.
+    """
+
+    def __init__(self, words, width):
+        self.words = words
+        self.width = width
+
+    @property
+    def shape(self):
+        """Dimensões da máscara (altura, largura)"""
+        return (self.words.shape[0], self.width)
+
+    @property
+    def nbytes(self):
+        """Memória ocupada pelos bits"""
+        return self.words.nbytes
+
+    @classmethod
+    def from_mask(cls, mask):
+        """
+        Compacta uma máscara (pixels diferentes de zero viram 1)
+
+        Args:
+            mask: Matriz 2-D
+
+        Returns:
+            PackedBinaryImage
+        """
+        if mask.ndim != 2:
+            raise ValueError("A máscara binária deve ser 2-D")
+        height, width = mask.shape
+        words_per_row = -(-width // WORD_BITS)
+
+        packed = np.zeros((height, words_per_row * 8), dtype=np.uint8)
+        packed[:, :-(-width // 8)] = np.packbits(mask != 0, axis=1, bitorder="little")
+        return cls(packed.view("<u8"), width)
+
+    def to_mask(self, on_value=255):
+        """
+        Descompacta para uma máscara uint8
+
+        Args:
+            on_value: Valor dos pixels ativos
+
+        Returns:
+            Matriz uint8 (altura x largura) com 0 e on_value
+        """
+        bits = np.unpackbits(self.words.view(np.uint8), axis=1, count=self.width, bitorder="little")
+        if on_value != 1:
+            bits *= np.uint8(on_value)
+        return bits
+
+    def count(self):
+        """Número de pixels ativos (contagem de população)"""
+        if hasattr(np, "bitwise_count"):
+            return int(np.bitwise_count(self.words).sum(dtype=np.int64))
+        return int(_BYTE_POPCOUNT[self.words.view(np.uint8)].sum(dtype=np.int64))
+
+    def copy(self):
+        """Cópia independente"""
+        return PackedBinaryImage(self.words.copy(), self.width)
+
+    # Operações lógicas
+
+    def __and__(self, other):
+        return PackedBinaryImage(self.words & other.words, self.width)
+
+    def __or__(self, other):
+        return PackedBinaryImage(self.words | other.words, self.width)
+
+    def __xor__(self, other):
+        return PackedBinaryImage(self.words ^ other.words, self.width)
+
+    def __invert__(self):
+        return PackedBinaryImage(self._clear_padding(~self.words), self.width)
+
+    def and_not(self, other):
+        """Pixels ativos aqui e inativos em other"""
+        return PackedBinaryImage(self.words & ~other.words, self.width)
+
+    def __eq__(self, other):
+        return (isinstance(other, PackedBinaryImage) and self.width == other.width
+                and np.array_equal(self.words, other.words))
+
+    # Morfologia
+
+    def dilate(self, size, origin=0):
+        """
+        Dilatação por uma janela retangular
+
+        Args:
+            size: Tamanho da janela (inteiro ou tupla (linhas, colunas))
+            origin: Deslocamento da janela, como em scipy.ndimage
+
+        Returns:
+            Nova PackedBinaryImage
+        """
+        sizes = (size, size) if np.isscalar(size) else tuple(size)
+        origins = (origin, origin) if np.isscalar(origin) else tuple(origin)
+
+        words = self.words
+        for axis in (0, 1):
+            # Janela da posição i: [i - left, i - left + size - 1]
+            left = sizes[axis] // 2 + origins[axis]
+            if not 0 <= left < sizes[axis]:
+                raise ValueError(f"Origem {origins[axis]} fora da janela de tamanho {sizes[axis]}")
+            words = self._offset_or(words, axis, -left, sizes[axis] - 1 - left)
+        return PackedBinaryImage(self._clear_padding(words), self.width)
+
+    def erode(self, size, origin=0):
+        """
+        Erosão por uma janela retangular (dual da dilatação do complemento)
+
+        Args:
+            size: Tamanho da janela (inteiro ou tupla (linhas, colunas))
+            origin: Deslocamento da janela, como em scipy.ndimage
+
+        Returns:
+            Nova PackedBinaryImage
+        """
+        # Fora da imagem o complemento vale 0, ou seja, a imagem vale 1 (neutro)
+        return ~((~self).dilate(size, origin))
+
+    def dilate_element(self, element):
+        """
+        Dilatação por um elemento estruturante qualquer, com âncora no centro
+
+        O elemento é lido como trechos contínuos por linha. Cada trecho
+        horizontal distinto é calculado uma vez, estendendo o maior trecho
+        já calculado contido nele (na elipse, cada linha custa poucos
+        deslocamentos a mais que a anterior); linhas vizinhas com os mesmos
+        trechos viram uma única janela vertical.
+
+        Args:
+            element: Matriz 2-D (valores diferentes de zero pertencem ao elemento)
+
+        Returns:
+            Nova PackedBinaryImage
+        """
+        element = np.asarray(element) != 0
+        center_row, center_col = element.shape[0] // 2, element.shape[1] // 2
+
+        # Linhas consecutivas com os mesmos trechos: (primeira, última, trechos)
+        groups = []
+        for row in range(element.shape[0]):
+            runs = tuple((first - center_col, last - center_col) for first, last in _runs(element[row]))
+            if groups and groups[-1][2] == runs and groups[-1][1] == row - 1:
+                groups[-1][1] = row
+            elif runs:
+                groups.append([row, row, runs])
+
+        horizontal = {}
+        for run in sorted({run for _, _, runs in groups for run in runs}, key=lambda run: run[1] - run[0]):
+            horizontal[run] = self._extend_run(run, horizontal)
+
+        result = np.zeros_like(self.words)
+        for first_row, last_row, runs in groups:
+            for run in runs:
+                result |= self._offset_or(horizontal[run], 0, first_row - center_row, last_row - center_row)
+        return PackedBinaryImage(self._clear_padding(result), self.width)
+
+    def erode_element(self, element):
+        """Erosão por um elemento estruturante qualquer, com âncora no centro"""
+        return ~((~self).dilate_element(element))
+
+    def opening(self, size):
+        """Abertura por uma janela retangular"""
+        return self.erode(size).dilate(size)
+
+    def closing(self, size):
+        """Fechamento por uma janela retangular"""
+        return self.dilate(size).erode(size)
+
+    def _extend_run(self, run, known):
+        """OR horizontal de um trecho, a partir do maior trecho conhecido contido nele"""
+        first, last = run
+        contained = [other for other in known if first <= other[0] and other[1] <= last]
+        if not contained:
+            return self._offset_or(self.words, 1, first, last)
+
+        inner_first, inner_last = max(contained, key=lambda other: other[1] - other[0])
+        words = known[(inner_first, inner_last)].copy()
+        if first < inner_first:
+            words |= self._offset_or(self.words, 1, first, inner_first - 1)
+        if inner_last < last:
+            words |= self._offset_or(self.words, 1, inner_last + 1, last)
+        return words
+
+    def _offset_or(self, words, axis, first, last):
+        """OR dos pixels nas posições x + [first, last] ao longo do eixo"""
+        if first <= 0 <= last:
+            # Compor [first, 0] e [0, last]: cada etapa só lê pixels existentes
+            words = self._window_or(words, axis, 1 - first, -1)
+            return self._window_or(words, axis, last + 1, 1)
+        if first > 0:
+            return self._shift(self._window_or(words, axis, last - first + 1, 1), axis, first)
+        return self._shift(self._window_or(words, axis, last - first + 1, -1), axis, last)
+
+    def _window_or(self, words, axis, size, direction):
+        """OR dos pixels nas posições x + direction * [0, size) ao longo do eixo"""
+        if size == 1:
+            return words
+        # Dobrar o alcance a cada passo: o acumulado cobre direction * [0, span)
+        accumulated = words
+        span = 1
+        while span * 2 <= size:
+            accumulated = accumulated | self._shift(accumulated, axis, direction * span)
+            span *= 2
+        if span < size:
+            accumulated = accumulated | self._shift(accumulated, axis, direction * (size - span))
+        return accumulated
+
+    def _shift(self, words, axis, offset):
+        """Resultado no pixel x = valor no pixel x + offset (zero fora da imagem)"""
+        if axis == 0:
+            result = np.zeros_like(words)
+            if abs(offset) >= words.shape[0]:
+                return result
+            if offset >= 0:
+                result[:words.shape[0] - offset] = words[offset:]
+            else:
+                result[-offset:] = words[:words.shape[0] + offset]
+            return result
+
+        word_offset, bit_offset = divmod(abs(offset), WORD_BITS)
+        count = words.shape[1] - word_offset
+        if count <= 0:
+            return np.zeros_like(words)
+        # Só as palavras que não recebem dados precisam ser zeradas
+        result = np.empty_like(words)
+        if offset >= 0:
+            result[:, count:] = 0
+        else:
+            result[:, :word_offset] = 0
+        bits = np.uint64(bit_offset)
+        carry = np.uint64(WORD_BITS - bit_offset)
+
+        if offset >= 0:
+            # Pixels de posições maiores descem para posições menores
+            source = words[:, word_offset:]
+            target = result[:, :count]
+            if not bit_offset:
+                target[...] = source
+                return result
+            np.right_shift(source, bits, out=target)
+            if count > 1:
+                target = target[:, :-1]
+                target |= np.left_shift(source[:, 1:], carry)
+        else:
+            source = words[:, :count]
+            target = result[:, word_offset:]
+            if not bit_offset:
+                target[...] = source
+                return result
+            np.left_shift(source, bits, out=target)
+            if count > 1:
+                target = target[:, 1:]
+                target |= np.right_shift(source[:, :-1], carry)
+        return result
+
+    def _clear_padding(self, words):
+        """Zera os bits além da largura da imagem na última palavra"""
+        extra = words.shape[1] * WORD_BITS - self.width
+        if extra:
+            words[:, -1] &= np.uint64((1 << (WORD_BITS - extra)) - 1)
+        return words
@@ -7,54 +7,214 @@ Operações morfológicas para processamento de imagens
 import cv2
 import numpy as np
 
+from src.tiling.tile_engine import TileEngine
+from src.filters.extrema_engine import get_extrema_engine
+from .structuring_elements import structuring_element, decompose
+from .binary_image import PackedBinaryImage, is_binary_mask
+
+# Operações aceitas por MorphologicalOps.compute
+COMPOUND_OPERATIONS = ("erosion", "dilation", "opening", "closing", "gradient", "tophat", "blackhat")
+
 class MorphologicalOps:
     """Classe para operações morfológicas"""
-    
+
+    # A partir deste tamanho o elemento é decomposto em retângulos separáveis;
+    # abaixo dele, o kernel completo do OpenCV é mais rápido
+    DECOMPOSE_MIN_SIZE = 25
+
+    # Alcance (iterações incluídas) a partir do qual máscaras 0/255 são
+    # compactadas em bits; abaixo dele, o OpenCV em bytes é mais rápido
+    PACKED_MIN_SIZE = 11
+
     def __init__(self):
-        pass
-        
-    def erosion(self, image, kernel_size=3):
+        # Imagens grandes são processadas em blocos com halo igual ao raio do kernel
+        self.tile_engine = TileEngine()
+        self.extrema_engine = get_extrema_engine()
+
+    def erosion(self, image, kernel_size=3, shape="ellipse", iterations=1):
         """
         Aplica operação de erosão
-        
+
         Args:
             image: Imagem de entrada
             kernel_size: Tamanho do kernel (deve ser ímpar)
-            
+            shape: Forma do elemento estruturante ("ellipse", "rect" ou "cross")
+            iterations: Número de repetições
+
         Returns:
             Imagem erodida
         """
-        # Garantir que o kernel seja ímpar
-        if kernel_size % 2 == 0:
-            kernel_size += 1
-            
-        # Criar kernel estruturante
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (kernel_size, kernel_size))
-        
-        # Aplicar erosão
-        result = cv2.erode(image, kernel, iterations=1)
-        
-        return result
-        
-    def dilation(self, image, kernel_size=3):
+        return self.compute(image, ["erosion"], kernel_size, shape, iterations)["erosion"]
+
+    def dilation(self, image, kernel_size=3, shape="ellipse", iterations=1):
         """
         Aplica operação de dilatação
-        
+
         Args:
             image: Imagem de entrada
             kernel_size: Tamanho do kernel (deve ser ímpar)
-            
+            shape: Forma do elemento estruturante ("ellipse", "rect" ou "cross")
+            iterations: Número de repetições
+
         Returns:
             Imagem dilatada
         """
+        return self.compute(image, ["dilation"], kernel_size, shape, iterations)["dilation"]
+
+    def opening(self, image, kernel_size=3, shape="ellipse", iterations=1):
+        """Abertura: erosão seguida de dilatação (remove detalhes claros menores que o elemento)"""
+        return self.compute(image, ["opening"], kernel_size, shape, iterations)["opening"]
+
+    def closing(self, image, kernel_size=3, shape="ellipse", iterations=1):
+        """Fechamento: dilatação seguida de erosão (preenche detalhes escuros menores que o elemento)"""
+        return self.compute(image, ["closing"], kernel_size, shape, iterations)["closing"]
+
+    def gradient(self, image, kernel_size=3, shape="ellipse", iterations=1):
+        """Gradiente morfológico: dilatação menos erosão (contornos)"""
+        return self.compute(image, ["gradient"], kernel_size, shape, iterations)["gradient"]
+
+    def tophat(self, image, kernel_size=3, shape="ellipse", iterations=1):
+        """Top-hat: imagem menos a abertura (detalhes claros menores que o elemento)"""
+        return self.compute(image, ["tophat"], kernel_size, shape, iterations)["tophat"]
+
+    def blackhat(self, image, kernel_size=3, shape="ellipse", iterations=1):
+        """Black-hat: fechamento menos a imagem (detalhes escuros menores que o elemento)"""
+        return self.compute(image, ["blackhat"], kernel_size, shape, iterations)["blackhat"]
+
+    def compute(self, image, operations, kernel_size=3, shape="ellipse", iterations=1):
+        """
+        Calcula várias operações morfológicas reaproveitando os resultados intermediários
+
+        Ex.: pedir "gradient" e "tophat" calcula a erosão uma única vez, e a
+        abertura do top-hat reaproveita essa mesma erosão.
+
+        Args:
+            image: Imagem de entrada
+            operations: Nomes das operações (ver COMPOUND_OPERATIONS)
+            kernel_size: Tamanho do kernel (deve ser ímpar)
+            shape: Forma do elemento estruturante ("ellipse", "rect" ou "cross")
+            iterations: Número de repetições de cada erosão/dilatação
+
+        Returns:
+            Dicionário nome da operação -> imagem processada
+        """
+        unknown = [name for name in operations if name not in COMPOUND_OPERATIONS]
+        if unknown:
+            raise ValueError(f"Operações morfológicas desconhecidas: {', '.join(unknown)}")
+
         # Garantir que o kernel seja ímpar
         if kernel_size % 2 == 0:
             kernel_size += 1
-            
-        # Criar kernel estruturante
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (kernel_size, kernel_size))
-        
-        # Aplicar dilatação
-        result = cv2.dilate(image, kernel, iterations=1)
-        
-        return result 
\ No newline at end of file
+        iterations = max(int(iterations), 1)
+        structuring_element(shape, kernel_size)  # valida a forma
+
+        # Operações compostas aplicam até duas etapas, cada uma com o raio total das iterações
+        steps = 2 if any(name not in ("erosion", "dilation") for name in operations) else 1
+        halo = steps * iterations * (kernel_size // 2)
+
+        reach = iterations * (kernel_size - 1) + 1
+        if reach >= self.PACKED_MIN_SIZE and is_binary_mask(image):
+            # Máscaras 0/255 ocupam 1 bit por pixel: sem blocos, 64 pixels por operação
+            results = _MorphologyResults(self, PackedBinaryImage.from_mask(image), kernel_size, shape, iterations)
+            return {name: results.get(name).to_mask() for name in operations}
+
+        def process(tile):
+            results = _MorphologyResults(self, tile, kernel_size, shape, iterations)
+            if len(operations) == 1:
+                return results.get(operations[0])
+            return np.stack([results.get(name) for name in operations], axis=-1)
+
+        processed = self.tile_engine.apply(image, process, halo)
+        if len(operations) == 1:
+            return {operations[0]: processed}
+        return {name: processed[..., i] for i, name in enumerate(operations)}
+
+    def extrema(self, image, kernel_size, shape, iterations, maximum):
+        """
+        Dilatação (maximum=True) ou erosão iterada pelo elemento estruturante
+
+        Elementos grandes são decompostos em retângulos, cada um processado
+        em passadas 1-D de custo independente do tamanho. Máscaras compactadas
+        (PackedBinaryImage) usam deslocamentos de palavras por linha do elemento.
+        """
+        if isinstance(image, PackedBinaryImage):
+            return self._packed_extrema(image, kernel_size, shape, iterations, maximum)
+
+        if shape == "rect":
+            # Iterações de um retângulo equivalem a um único retângulo maior
+            size = iterations * (kernel_size - 1) + 1
+            filter_rect = self.extrema_engine.maximum if maximum else self.extrema_engine.minimum
+            return filter_rect(image, size)
+
+        rectangles = decompose(shape, kernel_size) if kernel_size >= self.DECOMPOSE_MIN_SIZE else None
+        if rectangles is None:
+            kernel = structuring_element(shape, kernel_size)
+            operation = cv2.dilate if maximum else cv2.erode
+            return operation(image, kernel, iterations=iterations).reshape(image.shape)
+
+        filter_rect = self.extrema_engine.maximum if maximum else self.extrema_engine.minimum
+        combine = np.maximum if maximum else np.minimum
+        result = image
+        for _ in range(iterations):
+            current = result
+            result = None
+            for size, origin in rectangles:
+                partial = filter_rect(current, size, origin)
+                result = partial if result is None else combine(result, partial, out=result)
+        return result
+
+    def _packed_extrema(self, packed, kernel_size, shape, iterations, maximum):
+        """Dilatação/erosão iterada de uma máscara compactada"""
+        if shape == "rect":
+            size = iterations * (kernel_size - 1) + 1
+            return packed.dilate(size) if maximum else packed.erode(size)
+
+        kernel = structuring_element(shape, kernel_size)
+        result = packed
+        for _ in range(iterations):
+            result = result.dilate_element(kernel) if maximum else result.erode_element(kernel)
+        return result
+
+class _MorphologyResults:
+    """Resultados de uma imagem, calculados sob demanda e reaproveitados"""
+
+    def __init__(self, ops, image, kernel_size, shape, iterations):
+        self.ops = ops
+        self.image = image
+        self.params = (kernel_size, shape, iterations)
+        self.cache = {}
+
+    def get(self, name):
+        """Retorna (calculando uma única vez) o resultado da operação"""
+        if name not in self.cache:
+            self.cache[name] = getattr(self, "_" + name)()
+        return self.cache[name]
+
+    def _erosion(self):
+        return self.ops.extrema(self.image, *self.params, maximum=False)
+
+    def _dilation(self):
+        return self.ops.extrema(self.image, *self.params, maximum=True)
+
+    def _opening(self):
+        return self.ops.extrema(self.get("erosion"), *self.params, maximum=True)
+
+    def _closing(self):
+        return self.ops.extrema(self.get("dilation"), *self.params, maximum=False)
+
+    def _gradient(self):
+        # Dilatação >= erosão, então a subtração não transborda
+        return self._difference(self.get("dilation"), self.get("erosion"))
+
+    def _tophat(self):
+        return self._difference(self.image, self.get("opening"))
+
+    def _blackhat(self):
+        return self._difference(self.get("closing"), self.image)
+
+    @staticmethod
+    def _difference(larger, smaller):
+        """Subtração; em máscaras compactadas, larger AND NOT smaller"""
+        if isinstance(larger, PackedBinaryImage):
+            return larger.and_not(smaller)
+        return np.subtract(larger, smaller)
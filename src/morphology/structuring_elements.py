@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Elementos estruturantes cacheados e sua decomposição em retângulos
+"""
+
+from functools import lru_cache
+
+import cv2
+import numpy as np
+
+SHAPES = {
+    "rect": cv2.MORPH_RECT,
+    "ellipse": cv2.MORPH_ELLIPSE,
+    "cross": cv2.MORPH_CROSS,
+}
+
+@lru_cache(maxsize=64)
+def structuring_element(shape, size):
+    """
+    Elemento estruturante quadrado de lado size (cacheado por forma e tamanho)
+
+    Args:
+        shape: "rect", "ellipse" ou "cross"
+        size: Lado do elemento (ímpar)
+
+    Returns:
+        Matriz uint8 somente leitura, com o centro como âncora
+    """
+    if shape not in SHAPES:
+        raise ValueError(f"Forma de elemento estruturante desconhecida: {shape}")
+
+    kernel = cv2.getStructuringElement(SHAPES[shape], (size, size))
+    kernel.setflags(write=False)
+    return kernel
+
+@lru_cache(maxsize=64)
+def decompose(shape, size):
+    """
+    Decompõe o elemento estruturante em uma união de retângulos
+
+    A dilatação (erosão) por uma união de elementos é o máximo (mínimo) das
+    dilatações (erosões) por cada um deles, e cada retângulo é separável em
+    duas passadas 1-D de custo independente do tamanho. Um elemento
+    convexo e simétrico como a elipse vira um retângulo por largura de linha
+    distinta; a cruz vira uma linha horizontal e uma vertical.
+
+    Args:
+        shape: "rect", "ellipse" ou "cross"
+        size: Lado do elemento (ímpar)
+
+    Returns:
+        Tupla de retângulos ((linhas, colunas), (origem_linhas, origem_colunas)),
+        com origens no formato de scipy.ndimage, ou None se o elemento não
+        puder ser decomposto
+    """
+    kernel = structuring_element(shape, size).astype(bool)
+    center = size // 2
+
+    rectangles = []
+    for width in sorted(set(kernel.sum(axis=1)) - {0}):
+        # Linhas com pelo menos esta largura, e colunas comuns a todas elas
+        rows = np.flatnonzero(kernel.sum(axis=1) >= width)
+        cols = np.flatnonzero(kernel[rows].all(axis=0))
+        if len(cols) == 0:
+            return None
+        top, bottom = rows[0], rows[-1]
+        left, right = cols[0], cols[-1]
+        height, span = bottom - top + 1, right - left + 1
+        # Origem: deslocamento entre o centro do retângulo e a âncora do elemento
+        origin = (center - top - height // 2, center - left - span // 2)
+        rectangles.append(((int(height), int(span)), (int(origin[0]), int(origin[1]))))
+
+    # A união precisa reproduzir exatamente o elemento
+    union = np.zeros_like(kernel)
+    for (height, span), (origin_row, origin_col) in rectangles:
+        top = center - height // 2 - origin_row
+        left = center - span // 2 - origin_col
+        union[top:top + height, left:left + span] = True
+    if not np.array_equal(union, kernel):
+        return None
+
+    return tuple(rectangles)
@@ -0,0 +1 @@
+# Pipeline de operações independente da interface gráfica
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Processamento em lote de imagens sem interface gráfica
+"""
+
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.utils.dtype_utils import to_saveable, to_supported
+from .operations import apply_operation
+from .result_cache import get_result_cache
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff")
+
+def collect_inputs(patterns):
+    """
+    Expande diretórios e padrões glob em uma lista de imagens
+
+    Args:
+        patterns: Lista de diretórios, arquivos ou padrões glob
+
+    Returns:
+        Lista de tuplas (caminho da imagem, caminho relativo de saída)
+
+    Raises:
+        ValueError: Se duas imagens diferentes tiverem o mesmo caminho de saída
+    """
+    inputs = []
+    seen = set()
+
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            # Percorrer o diretório preservando a estrutura de subpastas
+            for root, _, files in os.walk(pattern):
+                for name in sorted(files):
+                    if name.lower().endswith(IMAGE_EXTENSIONS):
+                        path = os.path.join(root, name)
+                        inputs.append((path, os.path.relpath(path, pattern)))
+        else:
+            # Como nos diretórios, a saída preserva o caminho a partir da
+            # parte do padrão sem curingas ("scans/*/x.png" -> "a/x.png")
+            root = _glob_root(pattern)
+            for path in sorted(glob.glob(pattern, recursive=True)):
+                if os.path.isfile(path) and path.lower().endswith(IMAGE_EXTENSIONS):
+                    inputs.append((path, os.path.relpath(path, root)))
+
+    # Remover entradas repetidas mantendo a ordem
+    unique = []
+    outputs = {}
+    for path, relative in inputs:
+        key = os.path.abspath(path)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        # Entradas de padrões diferentes ainda podem cair na mesma saída
+        output = os.path.normcase(os.path.normpath(relative))
+        if output in outputs:
+            raise ValueError(f"{outputs[output]} e {path} seriam salvas no mesmo "
+                             f"arquivo de saída ({relative})")
+        outputs[output] = path
+        unique.append((path, relative))
+
+    return unique
+
+def _glob_root(pattern):
+    """Diretório formado pelos componentes do padrão anteriores ao primeiro curinga"""
+    parts = []
+    for part in os.path.dirname(pattern).split(os.sep):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return os.sep.join(parts) or os.curdir
+
+def is_up_to_date(input_path, output_path):
+    """Verifica se a saída já existe e é mais recente que a entrada"""
+    return (os.path.exists(output_path)
+            and os.path.getmtime(output_path) >= os.path.getmtime(input_path))
+
+def _init_worker(cache_bytes=0):
+    """
+    Evita que cada processo crie o seu próprio pool de threads do OpenCV e
+    ajusta o limite do cache de resultados do processo
+    """
+    import cv2
+    cv2.setNumThreads(1)
+    get_result_cache().max_bytes = cache_bytes
+
+def process_image(input_path, output_path, operations, keep_color=False, use_cache=False):
+    """
+    Carrega, processa e salva uma imagem (executado nos processos do pool)
+
+    Args:
+        input_path: Caminho da imagem de entrada
+        output_path: Caminho da imagem de saída
+        operations: Lista ordenada de tuplas (nome, parâmetros)
+        keep_color: Processar a imagem em RGB em vez de escala de cinza
+        use_cache: Reaproveitar resultados já calculados neste processo
+                   (imagens repetidas ou prefixos comuns da sequência)
+
+    Returns:
+        Tupla (tempo em segundos, megapixels processados, acertos no cache)
+    """
+    import cv2
+
+    start = time.perf_counter()
+
+    # Carregar preservando a profundidade, como na interface gráfica
+    image = cv2.imread(input_path, cv2.IMREAD_UNCHANGED)
+    if image is None:
+        raise ValueError("Não foi possível carregar a imagem")
+    image = to_supported(image, keep_color)
+    megapixels = image.shape[0] * image.shape[1] / 1e6
+
+    cache = get_result_cache() if use_cache else None
+    hits_before = cache.hits if cache else 0
+    for name, params in operations:
+        image = apply_operation(image, name, params, cache)
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    if not cv2.imwrite(output_path, to_saveable(image, output_path)):
+        raise ValueError("Não foi possível salvar a imagem")
+
+    hits = cache.hits - hits_before if cache else 0
+    return time.perf_counter() - start, megapixels, hits
+
+class BatchProcessor:
+    """Classe para processamento de imagens em lote com um pool de processos"""
+
+    def __init__(self, workers=None, overwrite=False, keep_color=False, cache_bytes=0):
+        self.workers = workers or os.cpu_count() or 1
+        self.overwrite = overwrite
+        self.keep_color = keep_color
+        # Limite do cache de resultados de cada processo (0 desativa)
+        self.cache_bytes = cache_bytes
+
+    def run(self, inputs, operations, output_dir, log=print):
+        """
+        Processa as imagens aplicando as operações em ordem
+
+        Args:
+            inputs: Lista de tuplas (caminho da imagem, caminho relativo de saída)
+            operations: Lista ordenada de tuplas (nome, parâmetros)
+            output_dir: Diretório onde as imagens processadas são salvas
+            log: Função usada para exibir o progresso
+
+        Returns:
+            Dicionário com o resumo da execução
+        """
+        summary = {"processed": 0, "skipped": 0, "failed": 0,
+                   "megapixels": 0.0, "image_seconds": 0.0, "cache_hits": 0}
+
+        # Separar as imagens que já foram processadas
+        tasks = []
+        for input_path, relative in inputs:
+            output_path = os.path.join(output_dir, relative)
+            if not self.overwrite and is_up_to_date(input_path, output_path):
+                summary["skipped"] += 1
+                log(f"[ignorada] {input_path}")
+            else:
+                tasks.append((input_path, output_path))
+
+        start = time.perf_counter()
+
+        if tasks:
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                     initargs=(self.cache_bytes,)) as executor:
+                futures = {
+                    executor.submit(process_image, input_path, output_path, operations,
+                                    self.keep_color, self.cache_bytes > 0): input_path
+                    for input_path, output_path in tasks
+                }
+                for future in as_completed(futures):
+                    input_path = futures[future]
+                    try:
+                        seconds, megapixels, hits = future.result()
+                    except Exception as e:
+                        summary["failed"] += 1
+                        log(f"[erro] {input_path}: {str(e)}")
+                        continue
+
+                    summary["processed"] += 1
+                    summary["megapixels"] += megapixels
+                    summary["image_seconds"] += seconds
+                    summary["cache_hits"] += hits
+                    log(f"[ok] {input_path}: {seconds * 1000:.1f} ms "
+                        f"({megapixels / seconds if seconds > 0 else 0:.2f} MP/s)")
+
+        summary["wall_seconds"] = time.perf_counter() - start
+        return summary
+
+def format_summary(summary):
+    """Formata o resumo de uma execução em lote"""
+    wall = summary["wall_seconds"]
+    processed = summary["processed"]
+    lines = [
+        f"Processadas: {processed}  Ignoradas: {summary['skipped']}  Falhas: {summary['failed']}",
+        f"Tempo total: {wall:.2f} s",
+    ]
+    if processed and wall > 0:
+        lines.append(f"Vazão: {processed / wall:.2f} imagens/s, {summary['megapixels'] / wall:.2f} MP/s")
+        lines.append(f"Tempo médio por imagem: {summary['image_seconds'] / processed * 1000:.1f} ms")
+    if summary["cache_hits"]:
+        lines.append(f"Operações reaproveitadas do cache: {summary['cache_hits']}")
+    return "\n".join(lines)
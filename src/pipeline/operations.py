@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Registro das operações de processamento de imagens
+
+Permite aplicar qualquer operação dos módulos de processamento pelo nome,
+sem depender da interface gráfica.
+"""
+
+import importlib
+
+# Parâmetros comuns às operações morfológicas
+MORPHOLOGY_DEFAULTS = {"kernel_size": 3, "shape": "ellipse", "iterations": 1}
+
+# Nome da operação -> (módulo, classe, método, parâmetros padrão)
+# Quando os parâmetros padrão são None, o método recebe o dicionário completo
+OPERATIONS = {
+    "mean": ("src.filters.spatial_filters", "SpatialFilters", "mean_filter", {"kernel_size": 3}),
+    "median": ("src.filters.spatial_filters", "SpatialFilters", "median_filter", {"kernel_size": 3}),
+    "gaussian": ("src.filters.spatial_filters", "SpatialFilters", "gaussian_filter",
+                 {"sigma": 1.0, "method": "auto"}),
+    "max": ("src.filters.spatial_filters", "SpatialFilters", "max_filter", {"kernel_size": 3}),
+    "min": ("src.filters.spatial_filters", "SpatialFilters", "min_filter", {"kernel_size": 3}),
+    "laplacian": ("src.filters.spatial_filters", "SpatialFilters", "laplacian_filter", {}),
+    "roberts": ("src.filters.spatial_filters", "SpatialFilters", "roberts_filter", {}),
+    "prewitt": ("src.filters.spatial_filters", "SpatialFilters", "prewitt_filter", {}),
+    "sobel": ("src.filters.spatial_filters", "SpatialFilters", "sobel_filter", {}),
+    "wiener": ("src.filters.adaptive_filters", "AdaptiveFilters", "wiener_filter",
+               {"window_size": 5, "noise": None}),
+    "lee": ("src.filters.adaptive_filters", "AdaptiveFilters", "lee_filter", {"window_size": 7, "noise": None}),
+    "local_contrast": ("src.filters.adaptive_filters", "AdaptiveFilters", "local_contrast_normalization",
+                       {"window_size": 31, "contrast": 3.0}),
+    "low_pass": ("src.frequency.frequency_filters", "FrequencyFilters", "low_pass_filter",
+                 {"cutoff": 30, "filter_shape": "ideal", "order": 2}),
+    "high_pass": ("src.frequency.frequency_filters", "FrequencyFilters", "high_pass_filter",
+                  {"cutoff": 30, "filter_shape": "ideal", "order": 2}),
+    "band_pass": ("src.frequency.frequency_filters", "FrequencyFilters", "band_pass_filter",
+                  {"cutoff": 30, "width": 10, "filter_shape": "ideal", "order": 2}),
+    "band_reject": ("src.frequency.frequency_filters", "FrequencyFilters", "band_reject_filter",
+                    {"cutoff": 30, "width": 10, "filter_shape": "ideal", "order": 2}),
+    "erosion": ("src.morphology.morphological_ops", "MorphologicalOps", "erosion", MORPHOLOGY_DEFAULTS),
+    "dilation": ("src.morphology.morphological_ops", "MorphologicalOps", "dilation", MORPHOLOGY_DEFAULTS),
+    "opening": ("src.morphology.morphological_ops", "MorphologicalOps", "opening", MORPHOLOGY_DEFAULTS),
+    "closing": ("src.morphology.morphological_ops", "MorphologicalOps", "closing", MORPHOLOGY_DEFAULTS),
+    "gradient": ("src.morphology.morphological_ops", "MorphologicalOps", "gradient", MORPHOLOGY_DEFAULTS),
+    "tophat": ("src.morphology.morphological_ops", "MorphologicalOps", "tophat", MORPHOLOGY_DEFAULTS),
+    "blackhat": ("src.morphology.morphological_ops", "MorphologicalOps", "blackhat", MORPHOLOGY_DEFAULTS),
+    "contrast_stretch": ("src.transforms.intensity_transforms", "IntensityTransforms", "contrast_stretch", None),
+    "histogram_equalization": ("src.transforms.intensity_transforms", "IntensityTransforms",
+                               "histogram_equalization", {}),
+    "otsu": ("src.segmentation.segmentation_methods", "SegmentationMethods", "otsu_thresholding", {}),
+    "multi_otsu": ("src.segmentation.segmentation_methods", "SegmentationMethods", "multi_otsu_thresholding",
+                   {"classes": 3}),
+    "adaptive_threshold": ("src.segmentation.segmentation_methods", "SegmentationMethods",
+                           "adaptive_thresholding", {"method": "mean", "window_size": 31, "k": 0.2, "offset": 0}),
+}
+
+def available_operations():
+    """Retorna a lista de operações disponíveis"""
+    return sorted(OPERATIONS)
+
+def operation_modules():
+    """Retorna os módulos de processamento usados pelas operações"""
+    return sorted({module_name for module_name, _, _, _ in OPERATIONS.values()})
+
+def apply_operation(image, name, params=None, cache=None):
+    """
+    Aplica uma operação registrada à imagem
+
+    Args:
+        image: Imagem de entrada
+        name: Nome da operação (ex.: "mean", "sobel", "low_pass")
+        params: Dicionário com os parâmetros da operação
+        cache: ResultCache consultado antes de calcular (opcional); com
+               cache, o resultado é somente leitura
+
+    Returns:
+        Imagem processada
+    """
+    if name not in OPERATIONS:
+        raise ValueError(f"Operação desconhecida: {name}")
+
+    module_name, class_name, method_name, defaults = OPERATIONS[name]
+    params = params or {}
+
+    if defaults is None:
+        kwargs = params
+    else:
+        _check_params(name, params)
+        kwargs = {key: params.get(key, value) for key, value in defaults.items()}
+
+    # Parâmetros completados com os padrões: omitir um parâmetro ou passar o
+    # valor padrão leva ao mesmo resultado guardado
+    if cache is not None:
+        key = cache.make_key(image, name, kwargs)
+        result = cache.get(key)
+        if result is not None:
+            return result
+
+    # Importar o módulo somente quando a operação é usada
+    module = importlib.import_module(module_name)
+    method = getattr(getattr(module, class_name)(), method_name)
+
+    if defaults is None:
+        result = method(image, params)
+    else:
+        result = method(image, **kwargs)
+
+    if cache is not None:
+        result = cache.put(key, result)
+    return result
+
+def parse_operation(spec):
+    """
+    Converte uma especificação textual em operação e parâmetros
+
+    Args:
+        spec: Texto no formato "nome" ou "nome:chave=valor,chave=valor"
+
+    Returns:
+        Tupla (nome, parâmetros)
+    """
+    name, _, args = spec.partition(":")
+    name = name.strip()
+    if name not in OPERATIONS:
+        raise ValueError(f"Operação desconhecida: {name}")
+
+    params = {}
+    for item in filter(None, (arg.strip() for arg in args.split(","))):
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"Parâmetro inválido em '{spec}': {item}")
+        params[key.strip()] = _parse_value(value.strip())
+
+    _check_params(name, params)
+    return name, params
+
+def _check_params(name, params):
+    """Rejeita parâmetros que a operação não aceita"""
+    defaults = OPERATIONS[name][3]
+    if defaults is None:
+        return
+
+    unknown = set(params) - set(defaults)
+    if unknown:
+        raise ValueError(f"Parâmetros inválidos para '{name}': {', '.join(sorted(unknown))}")
+
+def _parse_value(value):
+    """Converte o texto de um parâmetro para int, float ou string"""
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
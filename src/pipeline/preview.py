@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pré-visualização de operações em uma versão reduzida (proxy) da imagem
+"""
+
+from src.utils.lazy_import import lazy_import
+from .operations import OPERATIONS, apply_operation
+
+cv2 = lazy_import("cv2")
+
+# Parâmetros medidos em pixels, que precisam acompanhar a escala do proxy.
+# Frequências de corte (cutoff/width) são medidas em ciclos por imagem e
+# não mudam com a resolução.
+ODD_SIZE_PARAMS = ("kernel_size", "window_size")
+LENGTH_PARAMS = ("sigma",)
+
+# Menores valores que ainda representam a operação no proxy: abaixo deles
+# scale_params arredonda para cima e o proxy exagera a vizinhança
+MIN_PROXY_SIZE = 3
+MIN_PROXY_LENGTH = 0.3
+
+def make_proxy(image, viewport):
+    """
+    Reduz a imagem para caber na área de visualização
+
+    Args:
+        image: Imagem em resolução total
+        viewport: Tupla (largura, altura) da área de visualização
+
+    Returns:
+        Tupla (proxy, escala), com escala <= 1
+    """
+    height, width = image.shape[:2]
+    scale = min(viewport[0] / width, viewport[1] / height, 1.0)
+    if scale >= 1.0:
+        return image, 1.0
+
+    size = (max(int(width * scale), 1), max(int(height * scale), 1))
+    proxy = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    return proxy, size[0] / width
+
+def scale_params(params, scale):
+    """
+    Ajusta os parâmetros espaciais de uma operação para a escala do proxy
+
+    Args:
+        params: Parâmetros em resolução total
+        scale: Escala do proxy em relação à imagem original
+
+    Returns:
+        Novo dicionário de parâmetros
+    """
+    scaled = dict(params)
+    for key in ODD_SIZE_PARAMS:
+        if key in scaled:
+            # Manter o kernel ímpar e com pelo menos 3 pixels
+            size = int(round(scaled[key] * scale))
+            scaled[key] = max(size | 1, MIN_PROXY_SIZE)
+    for key in LENGTH_PARAMS:
+        if key in scaled:
+            scaled[key] = max(scaled[key] * scale, MIN_PROXY_LENGTH)
+    return scaled
+
+def proxy_is_faithful(name, params, scale):
+    """
+    Indica se o proxy representa a operação sem exagerar a vizinhança
+
+    Um kernel de 5 pixels em um proxy com escala 1/4 teria pouco mais de um
+    pixel; scale_params o limita a 3, uma vizinhança relativa 2 a 3 vezes
+    maior, e a pré-visualização sai mais borrada que o resultado final.
+    Nesses casos a pré-visualização continua no proxy (a resolução total só
+    é processada em segundo plano, ao aplicar), mas deve ser indicada como
+    aproximada.
+
+    Args:
+        name: Nome da operação
+        params: Parâmetros em resolução total (os omitidos usam os padrões)
+        scale: Escala do proxy em relação à imagem original
+
+    Returns:
+        True se o proxy representa a operação fielmente
+    """
+    defaults = OPERATIONS[name][3] if name in OPERATIONS else None
+    values = dict(defaults or {}, **params)
+    for key in ODD_SIZE_PARAMS:
+        if isinstance(values.get(key), (int, float)) and values[key] * scale < MIN_PROXY_SIZE:
+            return False
+    for key in LENGTH_PARAMS:
+        if isinstance(values.get(key), (int, float)) and values[key] * scale < MIN_PROXY_LENGTH:
+            return False
+    return True
+
+def preview_operation(proxy, scale, name, params, cache=None):
+    """Aplica a operação ao proxy com os parâmetros ajustados à escala"""
+    return apply_operation(proxy, name, scale_params(params, scale), cache)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache dos resultados das operações, indexado pelo conteúdo da imagem
+"""
+
+import threading
+from collections import OrderedDict
+
+from src.utils.image_key import image_key
+
+class ResultCache:
+    """
+    Cache LRU de resultados de operações limitado em bytes
+
+    A chave é (conteúdo da imagem de entrada, nome da operação, parâmetros já
+    completados com os valores padrão), então repetir uma operação depois de
+    desfazer, ou processar duas vezes o mesmo arquivo, devolve o resultado
+    guardado sem recalcular. Os resultados são marcados como somente leitura:
+    o mesmo objeto é devolvido a cada acerto e não pode ser alterado por quem
+    o recebeu.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def make_key(image, name, params):
+        """
+        Chave de um resultado
+
+        Args:
+            image: Imagem de entrada
+            name: Nome da operação
+            params: Dicionário com todos os parâmetros da operação
+
+        Returns:
+            Tupla que pode ser usada como chave de dicionário
+        """
+        return image_key(image), name, _freeze(params)
+
+    def get(self, key):
+        """Retorna o resultado guardado para a chave, ou None"""
+        with self.lock:
+            result = self.entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return result
+
+    def put(self, key, result):
+        """
+        Guarda um resultado (resultados maiores que o limite não são guardados)
+
+        Returns:
+            O próprio resultado, agora somente leitura
+        """
+        if result.nbytes > self.max_bytes:
+            return result
+        result.setflags(write=False)
+
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous.nbytes
+            self.entries[key] = result
+            self.nbytes += result.nbytes
+            self._evict()
+        return result
+
+    def stats(self):
+        """Contadores de acertos e falhas e ocupação atual"""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses,
+                    "hit_rate": self.hits / lookups if lookups else 0.0,
+                    "entries": len(self.entries), "bytes": self.nbytes}
+
+    def clear(self):
+        """Remove todos os resultados (os contadores são mantidos)"""
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = 0
+
+    def _evict(self):
+        """Remove os resultados menos usados até caber no limite"""
+        while self.entries and self.nbytes > self.max_bytes:
+            _, result = self.entries.popitem(last=False)
+            self.nbytes -= result.nbytes
+
+def _freeze(value):
+    """Converte parâmetros (dicionários e listas) em tuplas comparáveis"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+_shared_cache = ResultCache()
+
+def get_result_cache():
+    """Cache de resultados compartilhado por toda a aplicação"""
+    return _shared_cache
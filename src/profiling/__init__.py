@@ -0,0 +1 @@
+# Medição de tempo das etapas de processamento e exibição
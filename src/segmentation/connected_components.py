@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rotulação de componentes conexos em faixas, com estatísticas por região
+"""
+
+import cv2
+import numpy as np
+
+from src.utils.cancellation import check_cancelled
+from src.utils.channels import to_gray
+
+# Estatísticas de cada região (uma linha por objeto)
+REGION_DTYPE = np.dtype([
+    ("label", np.int32),
+    ("area", np.int64),
+    ("left", np.int32),
+    ("top", np.int32),
+    ("width", np.int32),
+    ("height", np.int32),
+    ("centroid_x", np.float64),
+    ("centroid_y", np.float64),
+    ("mean_intensity", np.float64),
+])
+
+class _UnionFind:
+    """Conjuntos disjuntos de rótulos, com a menor raiz representando cada conjunto"""
+
+    def __init__(self):
+        self.parent = np.zeros(1, dtype=np.int64)
+        self.size = 1
+
+    def add(self, count):
+        """Cria count rótulos novos e retorna o primeiro"""
+        first = self.size
+        self.size += count
+        if self.size > len(self.parent):
+            grown = np.arange(max(self.size, 2 * len(self.parent)), dtype=np.int64)
+            grown[:len(self.parent)] = self.parent
+            self.parent = grown
+        else:
+            self.parent[first:self.size] = np.arange(first, self.size)
+        return first
+
+    def find(self, label):
+        """Raiz do conjunto (com compressão de caminho por divisão)"""
+        parent = self.parent
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    def union(self, first, second):
+        """Une os dois conjuntos, mantendo a menor raiz"""
+        first, second = self.find(first), self.find(second)
+        if first != second:
+            self.parent[max(first, second)] = min(first, second)
+
+    def roots(self):
+        """Raiz de todos os rótulos"""
+        parent = self.parent[:self.size].copy()
+        # Saltos de ponteiro: a distância até a raiz cai pela metade a cada passada
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                return parent
+            parent = grandparent
+
+class ConnectedComponents:
+    """
+    Rotula objetos de uma máscara binária processando uma faixa de linhas por vez
+
+    Cada faixa é rotulada com o OpenCV; rótulos que se tocam na fronteira
+    entre duas faixas são unidos por union-find. Só a última linha da faixa
+    anterior precisa ficar em memória, então a máscara pode ser um
+    numpy.memmap maior que a memória disponível. Os rótulos finais seguem a
+    ordem de varredura do primeiro pixel de cada objeto, como no algoritmo
+    SAUF do OpenCV aplicado à imagem inteira.
+    """
+
+    def __init__(self, strip_height=1024, connectivity=8):
+        if connectivity not in (4, 8):
+            raise ValueError("A conectividade deve ser 4 ou 8")
+        self.strip_height = strip_height
+        self.connectivity = connectivity
+
+    def measure(self, mask, intensity=None):
+        """
+        Mede as regiões sem montar a imagem de rótulos
+
+        Args:
+            mask: Máscara 2-D (pixels diferentes de zero são objeto)
+            intensity: Imagem 2-D de mesmo tamanho para a intensidade média
+                       (opcional; sem ela, mean_intensity fica NaN)
+
+        Returns:
+            Array estruturado REGION_DTYPE com uma linha por região
+        """
+        return self._run(mask, intensity, labels_out=None)
+
+    def label(self, mask, intensity=None):
+        """
+        Rotula a máscara inteira
+
+        Args:
+            mask: Máscara 2-D (pixels diferentes de zero são objeto)
+            intensity: Imagem 2-D de mesmo tamanho (opcional)
+
+        Returns:
+            Tupla (imagem de rótulos int32 com 0 no fundo, estatísticas REGION_DTYPE)
+        """
+        labels = np.zeros(mask.shape[:2], dtype=np.int32)
+        regions = self._run(mask, intensity, labels_out=labels)
+        return labels, regions
+
+    def _run(self, mask, intensity, labels_out):
+        """Rotula faixa a faixa, acumulando as estatísticas de cada rótulo provisório"""
+        if mask.ndim != 2:
+            raise ValueError("A rotulação requer uma máscara 2-D")
+        if intensity is not None and intensity.shape[:2] != mask.shape:
+            raise ValueError("A imagem de intensidade deve ter o tamanho da máscara")
+
+        height = mask.shape[0]
+        sets = _UnionFind()
+        partial = []
+        previous_row = None
+        offsets = []
+
+        for y0 in range(0, height, self.strip_height):
+            # Um trabalho cancelado na interface para na próxima faixa
+            check_cancelled()
+            y1 = min(y0 + self.strip_height, height)
+            strip = (np.asarray(mask[y0:y1]) != 0).astype(np.uint8)
+
+            # SAUF numera os rótulos na ordem de varredura (linha a linha)
+            count, local, stats, centroids = cv2.connectedComponentsWithStatsWithAlgorithm(
+                strip, self.connectivity, cv2.CV_32S, cv2.CCL_SAUF)
+            count -= 1  # rótulo 0 é o fundo
+
+            # Rótulos provisórios globais: local + deslocamento da faixa
+            offset = sets.add(count) - 1 if count else 0
+            offsets.append((y0, y1, offset))
+            if count:
+                stats = stats[1:]
+                areas = stats[:, cv2.CC_STAT_AREA].astype(np.int64)
+                sums = np.zeros(count, dtype=np.float64)
+                if intensity is not None:
+                    weights = np.asarray(intensity[y0:y1], dtype=np.float64).ravel()
+                    sums = np.bincount(local.ravel(), weights=weights, minlength=count + 1)[1:]
+                partial.append(np.column_stack((
+                    np.arange(offset + 1, offset + count + 1), areas,
+                    stats[:, cv2.CC_STAT_LEFT], stats[:, cv2.CC_STAT_TOP] + y0,
+                    stats[:, cv2.CC_STAT_LEFT] + stats[:, cv2.CC_STAT_WIDTH],
+                    stats[:, cv2.CC_STAT_TOP] + y0 + stats[:, cv2.CC_STAT_HEIGHT],
+                    centroids[1:, 0] * areas, (centroids[1:, 1] + y0) * areas, sums,
+                )))
+
+            if previous_row is not None:
+                self._merge(previous_row, self._globalize(local[0], offset), sets)
+            previous_row = self._globalize(local[-1], offset)
+
+            if labels_out is not None:
+                labels_out[y0:y1] = self._globalize(local, offset)
+
+        return self._finish(sets, partial, offsets, intensity is not None, labels_out)
+
+    @staticmethod
+    def _globalize(local, offset):
+        """Converte rótulos locais da faixa em provisórios globais (fundo continua 0)"""
+        return np.where(local > 0, local + offset, 0).astype(np.int32)
+
+    def _merge(self, upper, lower, sets):
+        """Une rótulos que se tocam na fronteira entre duas faixas"""
+        pairs = [(upper, lower)]
+        if self.connectivity == 8:
+            # Vizinhos diagonais
+            pairs += [(upper[:-1], lower[1:]), (upper[1:], lower[:-1])]
+
+        touching = [np.column_stack((a, b))[(a > 0) & (b > 0)] for a, b in pairs]
+        for first, second in np.unique(np.concatenate(touching), axis=0):
+            sets.union(int(first), int(second))
+
+    def _finish(self, sets, partial, offsets, has_intensity, labels_out):
+        """Agrupa as estatísticas pela raiz de cada rótulo e numera as regiões"""
+        roots = sets.roots()
+        # Rótulo final: posição da raiz entre as raízes (ordem de varredura)
+        root_labels = np.flatnonzero(roots == np.arange(len(roots)))[1:]
+        final = np.zeros(len(roots), dtype=np.int32)
+        final[root_labels] = np.arange(1, len(root_labels) + 1)
+        final = final[roots]
+
+        if labels_out is not None:
+            for y0, y1, offset in offsets:
+                labels_out[y0:y1] = final[labels_out[y0:y1]]
+
+        regions = np.zeros(len(root_labels), dtype=REGION_DTYPE)
+        if not len(regions):
+            return regions
+
+        data = np.concatenate(partial)
+        index = final[data[:, 0].astype(np.int64)] - 1
+        count = len(regions)
+
+        area = np.bincount(index, weights=data[:, 1], minlength=count)
+        left = np.full(count, np.inf)
+        top = np.full(count, np.inf)
+        right = np.zeros(count)
+        bottom = np.zeros(count)
+        np.minimum.at(left, index, data[:, 2])
+        np.minimum.at(top, index, data[:, 3])
+        np.maximum.at(right, index, data[:, 4])
+        np.maximum.at(bottom, index, data[:, 5])
+
+        regions["label"] = np.arange(1, count + 1)
+        regions["area"] = area
+        regions["left"] = left
+        regions["top"] = top
+        regions["width"] = right - left
+        regions["height"] = bottom - top
+        regions["centroid_x"] = np.bincount(index, weights=data[:, 6], minlength=count) / area
+        regions["centroid_y"] = np.bincount(index, weights=data[:, 7], minlength=count) / area
+        if has_intensity:
+            regions["mean_intensity"] = np.bincount(index, weights=data[:, 8], minlength=count) / area
+        else:
+            regions["mean_intensity"] = np.nan
+        return regions
+
+def measure_image(image, intensity=None, connectivity=8):
+    """
+    Mede os objetos de uma imagem qualquer, tratada como máscara
+
+    Imagens coloridas são reduzidas à luminância, tanto a máscara quanto a
+    imagem de intensidade.
+
+    Returns:
+        Array estruturado REGION_DTYPE com uma linha por região
+    """
+    if intensity is not None:
+        intensity = to_gray(intensity)
+    return ConnectedComponents(connectivity=connectivity).measure(to_gray(image), intensity)
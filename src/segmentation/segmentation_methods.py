@@ -7,6 +7,15 @@ Métodos de segmentação de imagens
 import cv2
 import numpy as np
 
+from src.analysis.integral_image import IntegralImage, get_integral_cache
+from src.utils.channels import to_gray
+
+# Métodos aceitos por SegmentationMethods.adaptive_thresholding
+ADAPTIVE_METHODS = ("mean", "gaussian", "sauvola", "niblack")
+
+# Número de médias em janela usadas para aproximar a gaussiana
+GAUSSIAN_BOX_PASSES = 3
+
 class SegmentationMethods:
     """Classe para métodos de segmentação"""
     
@@ -23,7 +32,174 @@ class SegmentationMethods:
         Returns:
             Imagem segmentada (binária)
         """
+        # Imagens coloridas são segmentadas pela luminância
+        image = to_gray(image)
+        if image.dtype != np.uint8:
+            # O Otsu do OpenCV só aceita 8 bits: mesmo critério sobre o histograma de 256 faixas
+            return self.multi_otsu_thresholding(image, classes=2)
+            
         # Aplicar limiarização de Otsu
         _, result = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
         
-        return result 
\ No newline at end of file
+        return result
+        
+    def multi_otsu_thresholds(self, image, classes=3):
+        """
+        Limiares de Otsu multinível
+        
+        Maximiza a variância entre classes por programação dinâmica sobre o
+        histograma de 256 faixas: o custo depende do número de faixas e de
+        classes, não do tamanho da imagem.
+        
+        Args:
+            image: Imagem de entrada
+            classes: Número de classes (2 equivale ao Otsu binário)
+            
+        Returns:
+            Tupla (limiares, faixas), com os limiares como índices de faixa
+            (a faixa do limiar pertence à classe inferior) e a faixa de cada pixel
+        """
+        image = to_gray(image)
+        classes = int(classes)
+        if classes < 2:
+            raise ValueError("O Otsu multinível requer pelo menos 2 classes")
+            
+        bins = self._histogram_bins(image)
+        counts = cv2.calcHist([bins], [0], None, [256], [0, 256]).ravel().astype(np.float64)
+        levels = len(counts)
+        
+        # Somas acumuladas: a classe com as faixas [i, j) tem peso P[j] - P[i]
+        weight = np.concatenate(([0.0], np.cumsum(counts)))
+        moment = np.concatenate(([0.0], np.cumsum(counts * np.arange(levels))))
+        
+        # Contribuição de cada classe [i, j) para a variância entre classes: S²/P
+        class_weight = weight[None, :] - weight[:, None]
+        class_moment = moment[None, :] - moment[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            contribution = np.where(class_weight > 0, class_moment ** 2 / class_weight, 0.0)
+        contribution[np.tril_indices(levels + 1)] = -np.inf
+        
+        # best[j]: melhor soma das contribuições dividindo as faixas [0, j) em c classes
+        best = contribution[0]
+        choices = []
+        for _ in range(classes - 1):
+            candidates = best[:, None] + contribution
+            choices.append(np.argmax(candidates, axis=0))
+            best = candidates[choices[-1], np.arange(levels + 1)]
+            
+        # Recuperar os pontos de corte a partir da última faixa
+        thresholds = []
+        end = levels
+        for choice in reversed(choices):
+            end = int(choice[end])
+            thresholds.append(end - 1)
+        return sorted(thresholds), bins
+        
+    def multi_otsu_thresholding(self, image, classes=3):
+        """
+        Aplica limiarização de Otsu multinível
+        
+        Args:
+            image: Imagem de entrada
+            classes: Número de classes
+            
+        Returns:
+            Imagem uint8 com as classes em níveis de cinza igualmente espaçados
+        """
+        thresholds, bins = self.multi_otsu_thresholds(image, classes)
+        
+        # Tabela faixa -> nível de cinza da classe
+        class_index = np.searchsorted(thresholds, np.arange(256), side="left")
+        lut = np.round(class_index * 255.0 / len(thresholds)).astype(np.uint8)
+        return lut[bins]
+        
+    def adaptive_thresholding(self, image, method="mean", window_size=31, k=0.2, offset=0):
+        """
+        Aplica limiarização local (adaptativa)
+        
+        Limiar de cada pixel, a partir da média m e do desvio padrão s na janela:
+        - mean: m - offset
+        - gaussian: média ponderada gaussiana - offset
+        - niblack: m - k * s
+        - sauvola: m * (1 + k * (s / R - 1)), com R = metade da faixa dinâmica
+        
+        Médias e desvios vêm de imagens integrais, então qualquer tamanho de
+        janela custa o mesmo; a gaussiana é aproximada por médias em janela
+        sucessivas.
+        
+        Args:
+            image: Imagem de entrada
+            method: "mean", "gaussian", "sauvola" ou "niblack"
+            window_size: Lado da janela (deve ser ímpar)
+            k: Peso do desvio padrão (Sauvola e Niblack)
+            offset: Constante subtraída do limiar (média e gaussiana), em
+                    níveis de 8 bits: é escalada para a faixa do tipo, como o
+                    R do Sauvola (x257 em uint16, fração da faixa da imagem
+                    em float)
+            
+        Returns:
+            Imagem segmentada (binária)
+        """
+        if method not in ADAPTIVE_METHODS:
+            raise ValueError(f"Método de limiarização adaptativa desconhecido: {method}")
+        image = to_gray(image)
+            
+        # Garantir que a janela seja ímpar
+        if window_size % 2 == 0:
+            window_size += 1
+            
+        if method in ("mean", "gaussian"):
+            offset = offset * 2 * self._dynamic_range(image) / 255
+            
+        if method == "gaussian":
+            threshold = self._box_gaussian(image, window_size) - offset
+        elif method == "mean":
+            threshold = get_integral_cache().get_integral(image).mean(window_size) - offset
+        else:
+            mean, std = get_integral_cache().get_integral(image).mean_std(window_size)
+            if method == "niblack":
+                threshold = mean - k * std
+            else:
+                threshold = mean * (1 + k * (std / self._dynamic_range(image) - 1))
+                
+        return np.where(image > threshold, 255, 0).astype(np.uint8)
+        
+    def _box_gaussian(self, image, window_size):
+        """Média gaussiana aproximada por GAUSSIAN_BOX_PASSES médias em janela"""
+        # Mesmo sigma que o OpenCV associa a um kernel gaussiano deste tamanho
+        sigma = 0.3 * ((window_size - 1) * 0.5 - 1) + 0.8
+        passes = GAUSSIAN_BOX_PASSES
+        
+        # Larguras ímpares cuja soma de variâncias ((w² - 1) / 12) reproduz sigma²
+        lower = int(np.sqrt(12 * sigma * sigma / passes + 1))
+        lower -= 1 - lower % 2
+        lower = max(lower, 1)
+        upper = lower + 2
+        wide = round((12 * sigma * sigma - passes * lower * lower - 4 * passes * lower - 3 * passes)
+                     / (-4 * lower - 4))
+        
+        result = image
+        for index in range(passes):
+            width = lower if index < wide else upper
+            result = IntegralImage(result).mean(width)
+        return result
+        
+    def _histogram_bins(self, image):
+        """Faixa do histograma de 256 posições de cada pixel"""
+        if image.dtype == np.uint8:
+            return image
+            
+        low, high = float(image.min()), float(image.max())
+        if high <= low:
+            return np.zeros(image.shape, dtype=np.uint8)
+        scaled = image.astype(np.float32) - np.float32(low)
+        scaled *= np.float32(256.0 / (high - low))
+        return np.clip(scaled, 0, 255, out=scaled).astype(np.uint8)
+        
+    @staticmethod
+    def _dynamic_range(image):
+        """Metade da faixa de valores do tipo (ou da imagem): R do Sauvola e escala do deslocamento"""
+        if np.issubdtype(image.dtype, np.integer):
+            info = np.iinfo(image.dtype)
+            return (float(info.max) - float(info.min)) / 2
+        return max(float(image.max()) - float(image.min()), 1e-12) / 2
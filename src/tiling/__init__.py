@@ -0,0 +1 @@
+# Execução em blocos para imagens grandes
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Execução de operações locais em blocos (tiles) com bordas de sobreposição
+"""
+
+import numpy as np
+
+from src.utils.cancellation import check_cancelled
+
+class TileEngine:
+    """
+    Divide a imagem em blocos, processa um bloco por vez e costura o resultado
+
+    Cada bloco é extraído com uma margem (halo) igual ao raio do kernel da
+    operação, de modo que os pixels internos do bloco enxergam exatamente a
+    mesma vizinhança que teriam na imagem inteira. Nas bordas reais da imagem
+    não há margem, e a própria operação aplica o seu tratamento de borda,
+    então o resultado é idêntico ao processamento da imagem inteira. O pico
+    de memória dos temporários passa a depender do tamanho do bloco.
+
+    Isso só vale para operações com raio finito. Filtros recursivos (IIR),
+    como a rota de Young-van Vliet do filtro gaussiano, dependem de todos os
+    pixels anteriores da linha e não devem passar por aqui.
+
+    Antes de cada bloco é verificado se a operação foi cancelada
+    (check_cancelled): um trabalho abandonado na interface libera a thread
+    no próximo bloco em vez de processar a imagem até o fim.
+    """
+
+    def __init__(self, tile_size=1024, min_pixels=None):
+        self.tile_size = tile_size
+        # Imagens menores que este limite são processadas de uma só vez
+        self.min_pixels = min_pixels if min_pixels is not None else 4 * tile_size * tile_size
+
+    def apply(self, image, func, halo):
+        """
+        Aplica uma operação local bloco a bloco
+
+        Args:
+            image: Imagem de entrada (altura x largura [x canais])
+            func: Função que recebe um bloco e retorna o bloco processado,
+                  com as mesmas dimensões espaciais
+            halo: Raio, em pixels, da vizinhança usada pela operação
+
+        Returns:
+            Imagem processada
+        """
+        height, width = image.shape[:2]
+        if height * width <= self.min_pixels:
+            return func(image)
+
+        # Blocos muito menores que o halo desperdiçariam processamento
+        tile = max(self.tile_size, 4 * halo)
+        result = None
+
+        for y0 in range(0, height, tile):
+            y1 = min(y0 + tile, height)
+            ya, yb = max(0, y0 - halo), min(height, y1 + halo)
+
+            for x0 in range(0, width, tile):
+                x1 = min(x0 + tile, width)
+                xa, xb = max(0, x0 - halo), min(width, x1 + halo)
+
+                check_cancelled()
+                processed = func(image[ya:yb, xa:xb])
+
+                # Alocar a saída com o tipo produzido pela operação
+                if result is None:
+                    result = np.empty((height, width) + processed.shape[2:], dtype=processed.dtype)
+
+                result[y0:y1, x0:x1] = processed[y0 - ya:y1 - ya, x0 - xa:x1 - xa]
+
+        return result
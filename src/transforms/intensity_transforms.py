@@ -6,7 +6,9 @@ Transformações de intensidade para imagens
 
 import cv2
 import numpy as np
-from skimage import exposure
+
+from src.utils.channels import apply_to_luminance
+from src.utils.dtype_utils import saturate, to_float32, value_range
 
 class IntensityTransforms:
     """Classe para transformações de intensidade de imagens"""
@@ -18,42 +20,85 @@ class IntensityTransforms:
         """
         Aplica alargamento de contraste à imagem
         
+        Em imagens coloridas apenas a luminância (Y de YCrCb) é alargada.
+        
         Args:
-            image: Imagem de entrada (numpy array)
+            image: Imagem de entrada (numpy array uint8, uint16 ou float32)
             params: Dicionário com parâmetros
-                - min_val: Valor mínimo para o alargamento
-                - max_val: Valor máximo para o alargamento
+                - min_val: Valor mínimo para o alargamento (padrão: mínimo do tipo)
+                - max_val: Valor máximo para o alargamento (padrão: máximo do tipo)
                 
         Returns:
-            Imagem com contraste alargado
+            Imagem com contraste alargado, do mesmo tipo da entrada
         """
-        min_val = params.get("min_val", 0)
-        max_val = params.get("max_val", 255)
-        
-        # Normalizar a imagem para o intervalo [0, 1]
-        image_norm = image.astype(np.float32) / 255.0
-        
-        # Aplicar alargamento de contraste
-        stretched = exposure.rescale_intensity(image_norm, 
-                                             in_range=(min_val/255.0, max_val/255.0),
-                                             out_range=(0, 1))
-        
-        # Converter de volta para uint8
-        result = (stretched * 255).astype(np.uint8)
-        
-        return result
+        low, high = value_range(image.dtype)
+        min_val = params.get("min_val", low)
+        max_val = params.get("max_val", high)
+        if max_val <= min_val:
+            raise ValueError("O valor máximo deve ser maior que o mínimo")
+            
+        if image.dtype in (np.uint8, np.uint16):
+            # Tabela com uma entrada por nível (256 ou 65536): uma leitura por pixel
+            levels = np.arange(high + 1, dtype=np.float32)
+            lut = saturate(self._stretch(levels, min_val, max_val, high), image.dtype)
+            return apply_to_luminance(lambda luminance: lut[luminance], image)
+            
+        return apply_to_luminance(
+            lambda luminance: self._stretch(to_float32(luminance), min_val, max_val, high), image)
         
     def histogram_equalization(self, image):
         """
         Aplica equalização de histograma à imagem
         
+        Em imagens coloridas apenas a luminância (Y de YCrCb) é equalizada,
+        preservando a cor.
+        
         Args:
-            image: Imagem de entrada (numpy array)
+            image: Imagem de entrada (numpy array uint8, uint16 ou float32)
             
         Returns:
-            Imagem com histograma equalizado
+            Imagem com histograma equalizado, do mesmo tipo da entrada
         """
-        # Aplicar equalização de histograma
-        equalized = cv2.equalizeHist(image)
+        return apply_to_luminance(self._equalize, image)
+        
+    def _equalize(self, image):
+        """Equalização de uma imagem em escala de cinza"""
+        if image.dtype == np.uint8:
+            # Aplicar equalização de histograma
+            return cv2.equalizeHist(image)
+            
+        if image.dtype == np.uint16:
+            # Mesma regra do OpenCV, com uma entrada da tabela por nível de 16 bits
+            counts = np.bincount(image.ravel(), minlength=65536)
+            return self._equalization_lut(counts, 65535).astype(np.uint16)[image]
+            
+        # Ponto flutuante: níveis em 65536 faixas entre o mínimo e o máximo
+        low, high = float(image.min()), float(image.max())
+        if high <= low:
+            return to_float32(image).copy()
+        bins = to_float32(image) - np.float32(low)
+        bins *= np.float32(65535 / (high - low))
+        bins = bins.astype(np.uint16)
+        counts = np.bincount(bins.ravel(), minlength=65536)
+        lut = self._equalization_lut(counts, 1.0).astype(np.float32)
+        return lut[bins]
+        
+    @staticmethod
+    def _stretch(values, min_val, max_val, high):
+        """Mapeia [min_val, max_val] linearmente em [0, high], limitando fora da faixa"""
+        scale = np.float32(high / (max_val - min_val))
+        stretched = (values - np.float32(min_val)) * scale
+        return np.clip(stretched, 0, high, out=stretched)
         
-        return equalized 
\ No newline at end of file
+    @staticmethod
+    def _equalization_lut(counts, high):
+        """Tabela de equalização a partir das contagens por nível (regra do cv2.equalizeHist)"""
+        cdf = np.cumsum(counts)
+        first = cdf[np.flatnonzero(counts)[0]]
+        total = cdf[-1]
+        if total == first:
+            # Imagem constante: o OpenCV mantém o valor
+            return np.arange(len(counts), dtype=np.float64) * (high / (len(counts) - 1))
+        scale = high / (total - first)
+        lut = np.clip(cdf - first, 0, None) * scale
+        return np.rint(lut) if high != 1.0 else lut
@@ -5,7 +5,7 @@ Aba de filtros espaciais
 """
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                             QLabel, QGroupBox, QScrollArea, QFrame)
+                             QLabel, QGroupBox, QScrollArea, QFrame, QSpinBox, QDoubleSpinBox)
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 
@@ -47,6 +47,9 @@ class FiltersTab(QWidget):
         # Grupo de filtros passa-alta
         self.create_high_pass_group(layout)
         
+        # Grupo de filtros adaptativos
+        self.create_adaptive_group(layout)
+        
         layout.addStretch()
         
         scroll.setWidget(main_widget)
@@ -58,7 +61,7 @@ class FiltersTab(QWidget):
     def create_low_pass_group(self, parent_layout):
         """Cria o grupo de filtros passa-baixa"""
         group = QGroupBox("Filtros Passa-Baixa (Suavização)")
-        group.setStyleSheet("""
+        self.group_style = """
             QGroupBox {
                 font-weight: bold;
                 color: #8cd05a;
@@ -72,17 +75,60 @@ class FiltersTab(QWidget):
                 left: 10px;
                 padding: 0 5px 0 5px;
             }
-        """)
+        """
+        group.setStyleSheet(self.group_style)
         
         layout = QVBoxLayout(group)
         
+        # Controles para tamanho do kernel (média, mediana, máximo e mínimo)
+        kernel_layout = QHBoxLayout()
+        kernel_label = QLabel("Tamanho do Kernel:")
+        kernel_label.setStyleSheet("color: #c9efb2;")
+        
+        self.kernel_size_spinbox = QSpinBox()
+        self.kernel_size_spinbox.setRange(3, 99)
+        self.kernel_size_spinbox.setValue(3)
+        self.kernel_size_spinbox.setSingleStep(2)  # Apenas valores ímpares
+        self.kernel_size_spinbox.setStyleSheet("""
+            QSpinBox {
+                background: #2c3825;
+                border: 1px solid #324624;
+                border-radius: 4px;
+                color: #c9efb2;
+                padding: 4px;
+            }
+        """)
+        
+        kernel_layout.addWidget(kernel_label)
+        kernel_layout.addWidget(self.kernel_size_spinbox)
+        kernel_layout.addStretch()
+        
+        layout.addLayout(kernel_layout)
+        
+        # Controle do desvio padrão do filtro gaussiano
+        sigma_layout = QHBoxLayout()
+        sigma_label = QLabel("Sigma (Gaussiano):")
+        sigma_label.setStyleSheet("color: #c9efb2;")
+        
+        self.sigma_spinbox = QDoubleSpinBox()
+        self.sigma_spinbox.setRange(0.5, 100.0)
+        self.sigma_spinbox.setSingleStep(0.5)
+        self.sigma_spinbox.setValue(1.0)
+        self.sigma_spinbox.setStyleSheet(self.kernel_size_spinbox.styleSheet().replace("QSpinBox", "QDoubleSpinBox"))
+        
+        sigma_layout.addWidget(sigma_label)
+        sigma_layout.addWidget(self.sigma_spinbox)
+        sigma_layout.addStretch()
+        
+        layout.addLayout(sigma_layout)
+        
         # Descrição dos filtros
         desc_label = QLabel("""
         <b>Filtros Passa-Baixa:</b> Suavizam a imagem removendo ruído e detalhes finos.<br>
-        • <b>Média:</b> Kernel 3x3<br>
-        • <b>Mediana:</b> Kernel 3x3<br>
-        • <b>Gaussiano:</b> Sigma = 1.0<br>
-        • <b>Máximo/Mínimo:</b> Kernel 3x3
+        • <b>Média:</b> Kernel NxN<br>
+        • <b>Mediana:</b> Kernel NxN (custo constante por pixel, mesmo com kernels grandes)<br>
+        • <b>Gaussiano:</b> Sigma ajustável (filtro recursivo para sigmas grandes: custo independente de sigma)<br>
+        • <b>Máximo/Mínimo:</b> Kernel NxN
         """)
         desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         desc_label.setStyleSheet("color: #c9efb2; padding: 8px; background: #2c3825; border-radius: 4px;")
@@ -325,29 +371,89 @@ class FiltersTab(QWidget):
         
         parent_layout.addWidget(group)
         
+    def create_adaptive_group(self, parent_layout):
+        """Cria o grupo de filtros adaptativos"""
+        group = QGroupBox("Filtros Adaptativos (Estatísticas Locais)")
+        group.setStyleSheet(self.group_style)
+        
+        layout = QVBoxLayout(group)
+        
+        # Janela das estatísticas locais
+        window_layout = QHBoxLayout()
+        window_label = QLabel("Janela:")
+        window_label.setStyleSheet("color: #c9efb2;")
+        
+        self.window_size_spinbox = QSpinBox()
+        self.window_size_spinbox.setRange(3, 255)
+        self.window_size_spinbox.setValue(7)
+        self.window_size_spinbox.setSingleStep(2)  # Apenas valores ímpares
+        self.window_size_spinbox.setStyleSheet(self.kernel_size_spinbox.styleSheet())
+        
+        window_layout.addWidget(window_label)
+        window_layout.addWidget(self.window_size_spinbox)
+        window_layout.addStretch()
+        
+        layout.addLayout(window_layout)
+        
+        # Descrição dos filtros
+        desc_label = QLabel("""
+        <b>Filtros Adaptativos:</b> Suavizam mais onde a vizinhança é homogênea.<br>
+        • <b>Wiener:</b> Ruído aditivo, preservando bordas<br>
+        • <b>Lee:</b> Ruído multiplicativo (speckle)<br>
+        • <b>Contraste Local:</b> Normaliza média e desvio padrão de cada vizinhança<br>
+        Qualquer janela custa o mesmo (imagens integrais calculadas uma vez por imagem)
+        """)
+        desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        desc_label.setStyleSheet("color: #c9efb2; padding: 8px; background: #2c3825; border-radius: 4px;")
+        desc_label.setWordWrap(True)
+        layout.addWidget(desc_label)
+        
+        # Botões para filtros adaptativos
+        buttons_layout = QHBoxLayout()
+        
+        self.wiener_btn = QPushButton("Wiener")
+        self.wiener_btn.clicked.connect(self.apply_wiener_filter)
+        self.wiener_btn.setStyleSheet(self.mean_btn.styleSheet())
+        
+        self.lee_btn = QPushButton("Lee")
+        self.lee_btn.clicked.connect(self.apply_lee_filter)
+        self.lee_btn.setStyleSheet(self.mean_btn.styleSheet())
+        
+        self.lcn_btn = QPushButton("Contraste Local")
+        self.lcn_btn.clicked.connect(self.apply_local_contrast)
+        self.lcn_btn.setStyleSheet(self.mean_btn.styleSheet())
+        
+        buttons_layout.addWidget(self.wiener_btn)
+        buttons_layout.addWidget(self.lee_btn)
+        buttons_layout.addWidget(self.lcn_btn)
+        
+        layout.addLayout(buttons_layout)
+        
+        parent_layout.addWidget(group)
+        
     def apply_mean_filter(self):
         """Aplica filtro da média"""
-        params = {"kernel_size": 3}
+        params = {"kernel_size": self.kernel_size_spinbox.value()}
         self.filter_applied.emit("mean", params)
         
     def apply_median_filter(self):
         """Aplica filtro da mediana"""
-        params = {"kernel_size": 3}
+        params = {"kernel_size": self.kernel_size_spinbox.value()}
         self.filter_applied.emit("median", params)
         
     def apply_gaussian_filter(self):
         """Aplica filtro gaussiano"""
-        params = {"sigma": 1.0}
+        params = {"sigma": self.sigma_spinbox.value()}
         self.filter_applied.emit("gaussian", params)
         
     def apply_max_filter(self):
         """Aplica filtro máximo"""
-        params = {"kernel_size": 3}
+        params = {"kernel_size": self.kernel_size_spinbox.value()}
         self.filter_applied.emit("max", params)
         
     def apply_min_filter(self):
         """Aplica filtro mínimo"""
-        params = {"kernel_size": 3}
+        params = {"kernel_size": self.kernel_size_spinbox.value()}
         self.filter_applied.emit("min", params)
         
     def apply_laplacian_filter(self):
@@ -368,4 +474,19 @@ class FiltersTab(QWidget):
     def apply_sobel_filter(self):
         """Aplica filtro de Sobel"""
         params = {}
-        self.filter_applied.emit("sobel", params) 
\ No newline at end of file
+        self.filter_applied.emit("sobel", params)
+        
+    def apply_wiener_filter(self):
+        """Aplica filtro de Wiener"""
+        params = {"window_size": self.window_size_spinbox.value()}
+        self.filter_applied.emit("wiener", params)
+        
+    def apply_lee_filter(self):
+        """Aplica filtro de Lee"""
+        params = {"window_size": self.window_size_spinbox.value()}
+        self.filter_applied.emit("lee", params)
+        
+    def apply_local_contrast(self):
+        """Aplica normalização de contraste local"""
+        params = {"window_size": self.window_size_spinbox.value()}
+        self.filter_applied.emit("local_contrast", params)
@@ -5,15 +5,10 @@ Aba de filtros no domínio da frequência
 """
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                             QLabel, QGroupBox, QDialog,
+                             QLabel, QGroupBox, QDialog, QSpinBox, QComboBox,
                              QVBoxLayout as QVBoxLayoutDialog)
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import numpy as np
-import cv2
 
 class FrequencyTab(QWidget):
     """Aba para filtros no domínio da frequência"""
@@ -69,13 +64,73 @@ class FrequencyTab(QWidget):
         <b>Filtros de Frequência:</b> Operam no domínio da frequência usando a transformada de Fourier.<br>
         • <b>Passa-Baixa:</b> Remove altas frequências (suaviza a imagem)<br>
         • <b>Passa-Alta:</b> Remove baixas frequências (destaca bordas)<br>
-        • <b>Frequência de Corte:</b> 30 pixels
+        • <b>Passa-Faixa / Rejeita-Faixa:</b> Mantém ou remove uma faixa em torno da frequência de corte<br>
+        • <b>Formas:</b> Ideal, Butterworth (com ordem) e Gaussiana
         """)
         desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         desc_label.setStyleSheet("color: #c9efb2; padding: 8px; background: #2c3825; border-radius: 4px;")
         desc_label.setWordWrap(True)
         layout.addWidget(desc_label)
         
+        # Controles dos parâmetros da máscara
+        spinbox_style = """
+            QSpinBox, QComboBox {
+                background: #2c3825;
+                border: 1px solid #324624;
+                border-radius: 4px;
+                color: #c9efb2;
+                padding: 4px;
+            }
+        """
+        
+        shape_layout = QHBoxLayout()
+        shape_label = QLabel("Forma do Filtro:")
+        shape_label.setStyleSheet("color: #c9efb2;")
+        self.shape_combo = QComboBox()
+        self.shape_combo.addItem("Ideal", "ideal")
+        self.shape_combo.addItem("Butterworth", "butterworth")
+        self.shape_combo.addItem("Gaussiano", "gaussian")
+        self.shape_combo.setStyleSheet(spinbox_style)
+        self.shape_combo.currentIndexChanged.connect(self.update_order_enabled)
+        shape_layout.addWidget(shape_label)
+        shape_layout.addWidget(self.shape_combo)
+        shape_layout.addStretch()
+        layout.addLayout(shape_layout)
+        
+        params_layout = QHBoxLayout()
+        cutoff_label = QLabel("Corte:")
+        cutoff_label.setStyleSheet("color: #c9efb2;")
+        self.cutoff_spinbox = QSpinBox()
+        self.cutoff_spinbox.setRange(1, 4096)
+        self.cutoff_spinbox.setValue(30)
+        self.cutoff_spinbox.setSuffix(" px")
+        self.cutoff_spinbox.setStyleSheet(spinbox_style)
+        
+        order_label = QLabel("Ordem:")
+        order_label.setStyleSheet("color: #c9efb2;")
+        self.order_spinbox = QSpinBox()
+        self.order_spinbox.setRange(1, 10)
+        self.order_spinbox.setValue(2)
+        self.order_spinbox.setStyleSheet(spinbox_style)
+        
+        width_label = QLabel("Largura da Faixa:")
+        width_label.setStyleSheet("color: #c9efb2;")
+        self.width_spinbox = QSpinBox()
+        self.width_spinbox.setRange(1, 2048)
+        self.width_spinbox.setValue(10)
+        self.width_spinbox.setSuffix(" px")
+        self.width_spinbox.setStyleSheet(spinbox_style)
+        
+        params_layout.addWidget(cutoff_label)
+        params_layout.addWidget(self.cutoff_spinbox)
+        params_layout.addWidget(order_label)
+        params_layout.addWidget(self.order_spinbox)
+        params_layout.addWidget(width_label)
+        params_layout.addWidget(self.width_spinbox)
+        params_layout.addStretch()
+        layout.addLayout(params_layout)
+        self.update_order_enabled()
+        
         # Botões para filtros de frequência
         buttons_layout = QHBoxLayout()
         
@@ -117,10 +172,23 @@ class FrequencyTab(QWidget):
             }
         """)
         
+        self.band_pass_btn = QPushButton("Filtro Passa-Faixa")
+        self.band_pass_btn.clicked.connect(self.apply_band_pass_filter)
+        self.band_pass_btn.setStyleSheet(self.high_pass_btn.styleSheet())
+        
+        self.band_reject_btn = QPushButton("Filtro Rejeita-Faixa")
+        self.band_reject_btn.clicked.connect(self.apply_band_reject_filter)
+        self.band_reject_btn.setStyleSheet(self.high_pass_btn.styleSheet())
+        
         buttons_layout.addWidget(self.low_pass_btn)
         buttons_layout.addWidget(self.high_pass_btn)
         
+        band_buttons_layout = QHBoxLayout()
+        band_buttons_layout.addWidget(self.band_pass_btn)
+        band_buttons_layout.addWidget(self.band_reject_btn)
+        
         layout.addLayout(buttons_layout)
+        layout.addLayout(band_buttons_layout)
         
         parent_layout.addWidget(group)
         
@@ -175,16 +243,41 @@ class FrequencyTab(QWidget):
         
         parent_layout.addWidget(group)
         
+    def update_order_enabled(self):
+        """A ordem só se aplica ao filtro Butterworth"""
+        self.order_spinbox.setEnabled(self.shape_combo.currentData() == "butterworth")
+        
+    def filter_params(self, band=False):
+        """Parâmetros atuais da máscara"""
+        params = {
+            "cutoff": self.cutoff_spinbox.value(),
+            "filter_shape": self.shape_combo.currentData(),
+            "order": self.order_spinbox.value()
+        }
+        if band:
+            params["width"] = self.width_spinbox.value()
+        return params
+        
     def apply_low_pass_filter(self):
         """Aplica filtro passa-baixa"""
-        params = {"cutoff": 30}
+        params = self.filter_params()
         self.frequency_applied.emit("low_pass", params)
         
     def apply_high_pass_filter(self):
         """Aplica filtro passa-alta"""
-        params = {"cutoff": 30}
+        params = self.filter_params()
         self.frequency_applied.emit("high_pass", params)
         
+    def apply_band_pass_filter(self):
+        """Aplica filtro passa-faixa"""
+        params = self.filter_params(band=True)
+        self.frequency_applied.emit("band_pass", params)
+        
+    def apply_band_reject_filter(self):
+        """Aplica filtro rejeita-faixa"""
+        params = self.filter_params(band=True)
+        self.frequency_applied.emit("band_reject", params)
+        
     def show_fourier_spectrum(self):
         """Mostra o espectro de Fourier da imagem atual"""
         self.frequency_applied.emit("fourier_spectrum", {})
@@ -209,6 +302,10 @@ class FourierSpectrumDialog(QDialog):
         
         layout = QVBoxLayoutDialog(self)
         
+        # matplotlib só é carregado quando o espectro é exibido pela primeira vez
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        
         # Criar figura do matplotlib
         self.figure = Figure(figsize=(10, 8), facecolor='#242921')
         self.canvas = FigureCanvas(self.figure)
@@ -223,17 +320,19 @@ class FourierSpectrumDialog(QDialog):
         if self.image is None:
             return
             
-        # Calcular transformada de Fourier
-        f_transform = np.fft.fft2(self.image)
-        f_shift = np.fft.fftshift(f_transform)
-        magnitude_spectrum = np.log(np.abs(f_shift) + 1)
+        from src.frequency.spectrum_cache import get_spectrum_cache
+        from src.utils.dtype_utils import to_display
+        
+        # Espectro compartilhado com os filtros de frequência (calculado uma vez por imagem)
+        magnitude_spectrum = get_spectrum_cache().get_spectrum(self.image).magnitude_spectrum()
         
         # Criar subplots
         self.figure.clear()
         
         # Subplot 1: Imagem original
         ax1 = self.figure.add_subplot(221)
-        ax1.imshow(self.image, cmap='gray')
+        # Imagens coloridas de 16 bits ou ponto flutuante viram RGB de 8 bits
+        ax1.imshow(to_display(self.image), cmap='gray')
         ax1.set_title('Imagem Original', color='#c9efb2')
         ax1.axis('off')
         
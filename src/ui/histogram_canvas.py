@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Desenho rápido do histograma com QPainter
+"""
+
+import math
+
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import Qt, QPointF, QRectF
+from PyQt6.QtGui import QPainter, QPen, QColor, QBrush, QPolygonF, QFont
+
+from src.profiling.tracer import get_tracer
+
+class HistogramCanvas(QWidget):
+    """Desenha o histograma de 256 posições diretamente, sem matplotlib"""
+
+    BACKGROUND = QColor("#242921")
+    TEXT = QColor("#c9efb2")
+    GRID = QColor("#324624")
+    LINE = QColor("#77bb41")
+    FILL = QColor(0x42, 0x60, 0x2e, 77)  # alpha 0.3
+
+    # Margens da área do gráfico (esquerda, topo, direita, base)
+    MARGINS = (64, 32, 16, 44)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.histogram = None
+        self.x_min = 0
+        self.x_max = 255
+        self.setMinimumSize(320, 220)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+    def set_histogram(self, histogram, x_max=255, x_min=0):
+        """
+        Define o histograma a ser desenhado
+
+        Args:
+            histogram: Contagens das 256 posições (ou None)
+            x_max: Valor do último nível exibido no eixo horizontal
+            x_min: Valor do primeiro nível exibido no eixo horizontal
+        """
+        self.histogram = None if histogram is None else [float(v) for v in histogram]
+        self.x_min = x_min
+        self.x_max = x_max
+        self.update()
+
+    def paintEvent(self, event):
+        """Desenha eixos, grade e curva do histograma"""
+        with get_tracer().span("histogram.paint", "ui"):
+            self.paint_histogram()
+
+    def paint_histogram(self):
+        """Desenho propriamente dito, medido por paintEvent"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(self.rect(), self.BACKGROUND)
+        painter.setFont(QFont("Arial", 8))
+
+        if self.histogram is None:
+            painter.setPen(self.TEXT)
+            painter.setFont(QFont("Arial", 12))
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "Nenhuma imagem carregada")
+            return
+
+        left, top, right, bottom = self.MARGINS
+        plot = QRectF(left, top, max(self.width() - left - right, 1), max(self.height() - top - bottom, 1))
+        y_max = max(max(self.histogram) * 1.1, 1.0)
+        bins = len(self.histogram)
+
+        def to_x(value):
+            return plot.left() + plot.width() * (value - self.x_min) / (self.x_max - self.x_min)
+
+        def to_y(value):
+            return plot.bottom() - plot.height() * value / y_max
+
+        def to_point(index, value):
+            return QPointF(plot.left() + plot.width() * index / (bins - 1), to_y(value))
+
+        # Grade e rótulos do eixo vertical
+        for value in self.ticks(y_max):
+            y = to_y(value)
+            painter.setPen(QPen(self.GRID, 1))
+            painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+            painter.setPen(self.TEXT)
+            painter.drawText(QRectF(0, y - 8, left - 6, 16),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                             self.format_count(value))
+
+        # Grade e rótulos do eixo horizontal
+        for value in self.ticks(self.x_max, count=6, minimum=self.x_min):
+            x = to_x(value)
+            painter.setPen(QPen(self.GRID, 1))
+            painter.drawLine(QPointF(x, plot.top()), QPointF(x, plot.bottom()))
+            painter.setPen(self.TEXT)
+            painter.drawText(QRectF(x - 30, plot.bottom() + 4, 60, 14), Qt.AlignmentFlag.AlignCenter,
+                             f"{value:g}")
+
+        # Preenchimento e linha do histograma
+        line = QPolygonF([to_point(i, v) for i, v in enumerate(self.histogram)])
+        fill = QPolygonF(line)
+        fill.append(QPointF(plot.right(), plot.bottom()))
+        fill.append(QPointF(plot.left(), plot.bottom()))
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QBrush(self.FILL))
+        painter.drawPolygon(fill)
+        painter.setPen(QPen(self.LINE, 1.5))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawPolyline(line)
+
+        # Moldura, título e rótulos dos eixos
+        painter.setPen(QPen(self.TEXT, 1))
+        painter.drawRect(plot)
+        painter.drawText(QRectF(plot.left(), plot.bottom() + 20, plot.width(), 16),
+                         Qt.AlignmentFlag.AlignCenter, "Níveis de Cinza")
+        painter.setFont(QFont("Arial", 10))
+        painter.drawText(QRectF(plot.left(), 4, plot.width(), top - 8),
+                         Qt.AlignmentFlag.AlignCenter, "Histograma da Imagem")
+        painter.setFont(QFont("Arial", 8))
+        painter.save()
+        painter.translate(10, plot.center().y())
+        painter.rotate(-90)
+        painter.drawText(QRectF(-plot.height() / 2, -8, plot.height(), 16),
+                         Qt.AlignmentFlag.AlignCenter, "Frequência")
+        painter.restore()
+
+    @staticmethod
+    def ticks(maximum, count=5, minimum=0):
+        """Marcações em passos 1, 2 ou 5 × 10^n entre o mínimo e o máximo"""
+        raw_step = (maximum - minimum) / count
+        magnitude = 10 ** math.floor(math.log10(raw_step))
+        step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw_step)
+        first = math.ceil(minimum / step)
+        return [i * step for i in range(first, int(maximum // step) + 1)]
+
+    @staticmethod
+    def format_count(value):
+        """Formata contagens de forma compacta (ex.: 12k, 1.5M)"""
+        if value >= 1e6:
+            return f"{value / 1e6:g}M"
+        if value >= 1e3:
+            return f"{value / 1e3:g}k"
+        return f"{value:g}"
@@ -5,20 +5,29 @@ Widget para exibição do histograma da imagem
 """
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import numpy as np
-import cv2
+
+from src.analysis.stats_engine import get_stats_engine
+from src.utils.dtype_utils import value_range
+from .histogram_canvas import HistogramCanvas
 
 class HistogramWidget(QWidget):
     """Widget para exibição do histograma da imagem"""
     
+    # Intervalo mínimo entre redesenhos (ms)
+    REDRAW_INTERVAL = 50
+    
     def __init__(self):
         super().__init__()
+        self.pending = None
+        
+        # Temporizador que agrupa atualizações mais rápidas que a tela
+        self.redraw_timer = QTimer(self)
+        self.redraw_timer.setSingleShot(True)
+        self.redraw_timer.setInterval(self.REDRAW_INTERVAL)
+        self.redraw_timer.timeout.connect(self.flush_pending)
+        
         self.init_ui()
         
     def init_ui(self):
@@ -42,22 +51,10 @@ class HistogramWidget(QWidget):
             }
         """)
         
-        # Criar figura do matplotlib
-        self.figure = Figure(figsize=(6, 4), facecolor='#242921')
-        self.canvas = FigureCanvas(self.figure)
+        # Canvas desenhado diretamente com QPainter
+        self.canvas = HistogramCanvas()
         self.canvas.setStyleSheet("background: #242921; border: none;")
         
-        # Configurar subplot
-        self.ax = self.figure.add_subplot(111)
-        self.ax.set_facecolor('#242921')
-        self.ax.tick_params(colors='#c9efb2')
-        self.ax.spines['bottom'].set_color('#c9efb2')
-        self.ax.spines['top'].set_color('#c9efb2')
-        self.ax.spines['left'].set_color('#c9efb2')
-        self.ax.spines['right'].set_color('#c9efb2')
-        self.ax.xaxis.label.set_color('#c9efb2')
-        self.ax.yaxis.label.set_color('#c9efb2')
-        
         # Layout para o canvas
         canvas_layout = QVBoxLayout(self.histogram_frame)
         canvas_layout.addWidget(self.canvas)
@@ -80,70 +77,70 @@ class HistogramWidget(QWidget):
         """)
         layout.addWidget(self.stats_label)
         
-    def update_histogram(self, image):
-        """Atualiza o histograma com a imagem fornecida"""
-        if image is None:
-            self.ax.clear()
-            self.ax.text(0.5, 0.5, 'Nenhuma imagem carregada', 
-                        ha='center', va='center', transform=self.ax.transAxes,
-                        color='#c9efb2', fontsize=12)
-            self.canvas.draw()
-            return
-            
-        # Calcular histograma
-        hist = cv2.calcHist([image], [0], None, [256], [0, 256])
-        
-        # Limpar gráfico anterior
-        self.ax.clear()
-        
-        # Configurar cores do gráfico
-        self.ax.set_facecolor('#242921')
-        self.ax.tick_params(colors='#c9efb2')
-        self.ax.spines['bottom'].set_color('#c9efb2')
-        self.ax.spines['top'].set_color('#c9efb2')
-        self.ax.spines['left'].set_color('#c9efb2')
-        self.ax.spines['right'].set_color('#c9efb2')
-        self.ax.xaxis.label.set_color('#c9efb2')
-        self.ax.yaxis.label.set_color('#c9efb2')
-        
-        # Plotar histograma
-        self.ax.plot(hist, color='#77bb41', linewidth=1.5)
-        self.ax.fill_between(range(256), hist.flatten(), alpha=0.3, color='#42602e')
-        
-        # Configurar labels
-        self.ax.set_xlabel('Níveis de Cinza', color='#c9efb2')
-        self.ax.set_ylabel('Frequência', color='#c9efb2')
-        self.ax.set_title('Histograma da Imagem', color='#c9efb2', fontsize=12)
+    def update_histogram(self, image, stats=None):
+        """
+        Atualiza o histograma com a imagem fornecida
         
-        # Configurar limites
-        self.ax.set_xlim(0, 255)
-        self.ax.set_ylim(0, hist.max() * 1.1)
+        Atualizações que chegam em sequência rápida (ex.: desfazer/refazer
+        repetidos) são agrupadas: apenas a mais recente é desenhada.
         
-        # Adicionar grade
-        self.ax.grid(True, alpha=0.2, color='#324624')
+        Args:
+            image: Imagem atual
+            stats: Estatísticas já calculadas pelo StatsEngine (opcional)
+        """
+        self.pending = (image, stats)
+        if not self.redraw_timer.isActive():
+            self.flush_pending()
+            
+    def flush_pending(self):
+        """Desenha a atualização pendente e inicia o intervalo mínimo até a próxima"""
+        if self.pending is None:
+            return
+        image, stats = self.pending
+        self.pending = None
+        self.render_histogram(image, stats)
+        self.redraw_timer.start()
         
-        # Atualizar canvas
-        self.canvas.draw()
+    def render_histogram(self, image, stats=None):
+        """Desenha o histograma e as estatísticas"""
+        if image is None:
+            self.canvas.set_histogram(None)
+            self.update_statistics(None)
+            return
+            
+        # Histograma calculado uma vez por imagem pelo StatsEngine
+        if stats is None:
+            stats = get_stats_engine().compute(image)
+        
+        # Apenas os dados da curva mudam; o canvas redesenha sob demanda
+        # Inteiros: faixa completa do tipo; ponto flutuante: do mínimo ao
+        # máximo da imagem, a mesma faixa das posições do histograma
+        if image.dtype.kind in "ui":
+            x_min, x_max = value_range(image.dtype)
+        else:
+            x_min = stats["min"]
+            x_max = stats["max"] if stats["max"] > x_min else x_min + 1
+        self.canvas.set_histogram(stats["histogram"], x_max, x_min)
         
         # Atualizar estatísticas
-        self.update_statistics(image)
+        self.update_statistics(image, stats)
         
-    def update_statistics(self, image):
+    def update_statistics(self, image, stats=None):
         """Atualiza as informações estatísticas"""
         if image is None:
             self.stats_label.setText("Carregue uma imagem para ver as estatísticas")
             return
             
-        # Calcular estatísticas
-        mean_val = np.mean(image)
-        std_val = np.std(image)
-        min_val = np.min(image)
-        max_val = np.max(image)
-        median_val = np.median(image)
-        
-        # Calcular percentis
-        p25 = np.percentile(image, 25)
-        p75 = np.percentile(image, 75)
+        # Estatísticas derivadas do mesmo histograma
+        if stats is None:
+            stats = get_stats_engine().compute(image)
+        mean_val = stats["mean"]
+        std_val = stats["std"]
+        min_val = stats["min"]
+        max_val = stats["max"]
+        median_val = stats["median"]
+        p25 = stats["p25"]
+        p75 = stats["p75"]
         
         # Formatar texto das estatísticas
         stats_text = f"""
@@ -151,11 +148,11 @@ class HistogramWidget(QWidget):
         • Média: {mean_val:.2f}<br>
         • Mediana: {median_val:.2f}<br>
         • Desvio Padrão: {std_val:.2f}<br>
-        • Mínimo: {min_val:.0f}<br>
-        • Máximo: {max_val:.0f}<br>
+        • Mínimo: {min_val:g}<br>
+        • Máximo: {max_val:g}<br>
         • Percentil 25%: {p25:.2f}<br>
         • Percentil 75%: {p75:.2f}<br>
-        • Contraste: {max_val - min_val:.0f}
+        • Contraste: {max_val - min_val:g}
         """
         
         self.stats_label.setText(stats_text) 
\ No newline at end of file
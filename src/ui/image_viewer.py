@@ -7,14 +7,26 @@ Widget para visualização de imagens
 from PyQt6.QtWidgets import QLabel, QScrollArea, QWidget, QVBoxLayout
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QPixmap, QImage, QPainter, QPen, QColor
-import cv2
-import numpy as np
+from collections import OrderedDict
+
+from src.utils.dtype_utils import to_display
+from src.utils.image_key import image_key
+from src.utils.lazy_import import lazy_import
+
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
 
 class ImageViewer(QScrollArea):
     """Widget para visualização de imagens com zoom e scroll"""
     
+    # Quantidade de pixmaps reduzidos mantidos em cache
+    MAX_CACHED_PIXMAPS = 8
+    
     def __init__(self):
         super().__init__()
+        self.image = None
+        self.pixmap_cache = OrderedDict()
+        self._display_buffer = None
         self.image_label = QLabel()
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.image_label.setMinimumSize(400, 300)
@@ -68,45 +80,78 @@ class ImageViewer(QScrollArea):
         
     def set_image(self, image):
         """Define a imagem a ser exibida"""
+        self.image = image
         if image is None:
+            self.image_label.setPixmap(QPixmap())
             self.image_label.setText("Nenhuma imagem carregada")
             return
             
-        # Converter numpy array para QImage
-        if len(image.shape) == 2:  # Imagem em escala de cinza
-            height, width = image.shape
-            bytes_per_line = width
-            # Converter para bytes
-            image_bytes = image.tobytes()
-            q_image = QImage(image_bytes, width, height, bytes_per_line, QImage.Format.Format_Grayscale8)
-        else:  # Imagem colorida
-            height, width, channel = image.shape
-            bytes_per_line = 3 * width
-            # Converter para bytes
-            image_bytes = image.tobytes()
-            q_image = QImage(image_bytes, width, height, bytes_per_line, QImage.Format.Format_RGB888)
+        self.image_label.setPixmap(self.display_pixmap(image, self.viewport_size()))
+        
+    def viewport_size(self):
+        """Tamanho disponível para a imagem"""
+        size = self.image_label.size()
+        return max(size.width(), 1), max(size.height(), 1)
+        
+    def display_pixmap(self, image, viewport):
+        """
+        Retorna o pixmap da imagem já reduzida para a área de visualização
+        
+        O resultado é cacheado por versão da imagem e tamanho da área.
+        """
+        key = (image_key(image), viewport)
+        pixmap = self.pixmap_cache.get(key)
+        if pixmap is not None:
+            self.pixmap_cache.move_to_end(key)
+            return pixmap
             
-        # Criar pixmap e redimensionar se necessário
-        pixmap = QPixmap.fromImage(q_image)
+        # Reduzir com média por área antes de criar o pixmap
+        display = self.scale_to_viewport(image, viewport)
         
-        # Redimensionar para caber na área de visualização
-        scaled_pixmap = self.scale_pixmap(pixmap)
+        # Envolver o buffer em um QImage sem copiar; QPixmap.fromImage copia apenas a versão reduzida
+        q_image = self.to_qimage(display)
+        pixmap = QPixmap.fromImage(q_image)
         
-        self.image_label.setPixmap(scaled_pixmap)
+        self.pixmap_cache[key] = pixmap
+        while len(self.pixmap_cache) > self.MAX_CACHED_PIXMAPS:
+            self.pixmap_cache.popitem(last=False)
+        return pixmap
         
-    def scale_pixmap(self, pixmap):
-        """Redimensiona o pixmap para caber na área de visualização"""
-        label_size = self.image_label.size()
-        pixmap_size = pixmap.size()
+    def scale_to_viewport(self, image, viewport):
+        """Redimensiona a imagem para caber na área de visualização"""
+        height, width = image.shape[:2]
         
         # Calcular escala para caber na área
-        scale_x = label_size.width() / pixmap_size.width()
-        scale_y = label_size.height() / pixmap_size.height()
-        scale = min(scale_x, scale_y, 1.0)  # Não aumentar além do tamanho original
+        scale = min(viewport[0] / width, viewport[1] / height, 1.0)  # Não aumentar além do tamanho original
         
         if scale < 1.0:
-            new_width = int(pixmap_size.width() * scale)
-            new_height = int(pixmap_size.height() * scale)
-            return pixmap.scaled(new_width, new_height, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            new_width = max(int(width * scale), 1)
+            new_height = max(int(height * scale), 1)
+            return cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_AREA)
+        
+        return np.ascontiguousarray(image)
+        
+    def to_qimage(self, image):
+        """Cria um QImage que compartilha a memória do array (sem cópia)"""
+        # 16 bits é exibido direto; ponto flutuante vira 8 bits
+        image = np.ascontiguousarray(to_display(image))
+        height, width = image.shape[:2]
+        if image.ndim == 2:  # Imagem em escala de cinza
+            if image.dtype == np.uint16:
+                image_format = QImage.Format.Format_Grayscale16
+            else:
+                image_format = QImage.Format.Format_Grayscale8
+        else:  # Imagem colorida
+            image_format = QImage.Format.Format_RGB888
+            
+        q_image = QImage(image.data, width, height, image.strides[0], image_format)
+        
+        # Manter o array vivo enquanto o QImage existir
+        self._display_buffer = image
+        return q_image
         
-        return pixmap 
\ No newline at end of file
+    def resizeEvent(self, event):
+        """Reajusta a imagem ao novo tamanho da área de visualização"""
+        super().resizeEvent(event)
+        if self.image is not None:
+            self.image_label.setPixmap(self.display_pixmap(self.image, self.viewport_size()))
@@ -7,12 +7,10 @@ Janela principal do sistema de edição de imagens
 import os
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QTabWidget, QPushButton, QLabel, QFileDialog, 
-                             QMessageBox, QSplitter, QScrollArea, QFrame)
+                             QMessageBox, QSplitter, QScrollArea, QFrame,
+                             QProgressBar, QCheckBox)
 from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QPixmap, QImage, QPalette, QColor, QFont, QIcon
-import cv2
-import numpy as np
-
 from .image_viewer import ImageViewer
 from .histogram_widget import HistogramWidget
 from .filters_tab import FiltersTab
@@ -21,6 +19,30 @@ from .morphology_tab import MorphologyTab
 from .frequency_tab import FrequencyTab
 from .segmentation_tab import SegmentationTab
 from .stats_widget import StatsWidget
+from .operation_runner import OperationRunner
+from src.history.image_history import ImageHistory
+from src.analysis.stats_engine import get_stats_engine
+from src.pipeline.preview import make_proxy, preview_operation, proxy_is_faithful
+from src.pipeline.operations import operation_modules
+from src.pipeline.result_cache import get_result_cache
+from src.profiling.tracer import get_tracer, format_breakdown
+from src.utils.channels import is_color
+from src.utils.dtype_utils import to_supported, to_saveable
+from src.utils.lazy_import import lazy_import, warm_up
+
+cv2 = lazy_import("cv2")
+
+# Limite de memória do histórico de desfazer/refazer
+HISTORY_MAX_BYTES = 512 * 1024 * 1024
+
+# Rótulos das etapas exibidas na barra de status
+TIMING_LABELS = {
+    "compute": "cálculo",
+    "history": "histórico",
+    "display": "exibição",
+    "stats": "estatísticas",
+    "histogram": "histograma",
+}
 
 class MainWindow(QMainWindow):
     """Janela principal do sistema de edição de imagens"""
@@ -29,8 +51,26 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.original_image = None
         self.current_image = None
-        self.image_history = []
-        self.history_index = -1
+        self.history = ImageHistory(max_bytes=HISTORY_MAX_BYTES)
+        
+        # Versão da imagem atual, usada para descartar resultados obsoletos
+        self.image_version = 0
+        self.pending_operation = None
+        self.pending_measurement = None
+        
+        # Pré-visualização em resolução reduzida (proxy cacheado por versão e viewport)
+        self.proxy_key = None
+        self.proxy = None
+        self.pending_preview = None
+        
+        # Executor das operações em segundo plano
+        self.operation_runner = OperationRunner(parent=self)
+        self.operation_runner.finished.connect(self.on_operation_finished)
+        self.operation_runner.failed.connect(self.on_operation_failed)
+        self.operation_runner.busy_changed.connect(self.set_busy)
+        
+        # Pré-carregamento das bibliotecas, iniciado após a primeira pintura
+        self.warm_up_thread = None
         
         self.init_ui()
         self.apply_dark_theme()
@@ -65,6 +105,25 @@ class MainWindow(QMainWindow):
         # Barra de status
         self.statusBar().showMessage("Pronto para carregar uma imagem")
         
+        # Indicador de processamento e botão de cancelamento
+        self.busy_bar = QProgressBar()
+        self.busy_bar.setRange(0, 0)
+        self.busy_bar.setMaximumWidth(150)
+        self.busy_bar.setVisible(False)
+        self.statusBar().addPermanentWidget(self.busy_bar)
+        
+        self.cancel_btn = QPushButton("✖ Cancelar")
+        self.cancel_btn.clicked.connect(self.cancel_operation)
+        self.cancel_btn.setVisible(False)
+        self.statusBar().addPermanentWidget(self.cancel_btn)
+        
+        # Exportação dos tempos da sessão para análise externa
+        self.trace_btn = QPushButton("⏱ Exportar Trace")
+        self.trace_btn.setToolTip("Salva os tempos da sessão no formato Chrome trace "
+                                  "(abrir em chrome://tracing ou ui.perfetto.dev)")
+        self.trace_btn.clicked.connect(self.export_trace)
+        self.statusBar().addPermanentWidget(self.trace_btn)
+        
     def create_left_panel(self):
         """Cria o painel esquerdo com visualização da imagem"""
         left_widget = QWidget()
@@ -120,6 +179,27 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.reset_btn)
         
         layout.addStretch()
+        
+        # Manter as cores ao carregar (processamento em RGB)
+        self.color_checkbox = QCheckBox("🎨 Manter cores")
+        self.color_checkbox.setToolTip("Carrega as próximas imagens em RGB; filtros, morfologia e "
+                                       "frequência processam todos os canais, e contraste e "
+                                       "equalização atuam na luminância")
+        layout.addWidget(self.color_checkbox)
+        
+        # Modo de pré-visualização
+        self.preview_checkbox = QCheckBox("👁 Pré-visualizar")
+        self.preview_checkbox.setToolTip("Aplica as operações em uma versão reduzida da imagem; "
+                                         "use \"Aplicar\" para processar em resolução total")
+        self.preview_checkbox.toggled.connect(self.toggle_preview)
+        layout.addWidget(self.preview_checkbox)
+        
+        # Botão aplicar pré-visualização
+        self.commit_btn = QPushButton("✔ Aplicar")
+        self.commit_btn.clicked.connect(self.commit_preview)
+        self.commit_btn.setEnabled(False)
+        layout.addWidget(self.commit_btn)
+        
         return toolbar
         
     def create_right_panel(self):
@@ -140,35 +220,44 @@ class MainWindow(QMainWindow):
         self.histogram_widget = HistogramWidget()
         self.tab_widget.addTab(self.histogram_widget, "Histograma")
         
-        # Aba de transformações
-        self.transforms_tab = TransformsTab()
-        self.transforms_tab.transform_applied.connect(self.apply_transform)
-        self.tab_widget.addTab(self.transforms_tab, "Transformações")
-        
-        # Aba de filtros
-        self.filters_tab = FiltersTab()
-        self.filters_tab.filter_applied.connect(self.apply_filter)
-        self.tab_widget.addTab(self.filters_tab, "Filtros")
-        
-        # Aba de morfologia
-        self.morphology_tab = MorphologyTab()
-        self.morphology_tab.morphology_applied.connect(self.apply_morphology)
-        self.tab_widget.addTab(self.morphology_tab, "Morfologia")
-        
-        # Aba de frequência
-        self.frequency_tab = FrequencyTab()
-        self.frequency_tab.frequency_applied.connect(self.apply_frequency)
-        self.tab_widget.addTab(self.frequency_tab, "Frequência")
-        
-        # Aba de segmentação
-        self.segmentation_tab = SegmentationTab()
-        self.segmentation_tab.segmentation_applied.connect(self.apply_segmentation)
-        self.tab_widget.addTab(self.segmentation_tab, "Segmentação")
+        # Demais abas: construídas na primeira vez em que são exibidas
+        # (atributo, título, classe, sinal, slot)
+        self.deferred_tabs = {}
+        for attribute, title, tab_class, signal, slot in (
+                ("transforms_tab", "Transformações", TransformsTab, "transform_applied", self.apply_transform),
+                ("filters_tab", "Filtros", FiltersTab, "filter_applied", self.apply_filter),
+                ("morphology_tab", "Morfologia", MorphologyTab, "morphology_applied", self.apply_morphology),
+                ("frequency_tab", "Frequência", FrequencyTab, "frequency_applied", self.apply_frequency),
+                ("segmentation_tab", "Segmentação", SegmentationTab, "segmentation_applied",
+                 self.apply_segmentation)):
+            setattr(self, attribute, None)
+            index = self.tab_widget.addTab(QWidget(), title)
+            self.deferred_tabs[index] = (attribute, tab_class, signal, slot)
+        self.tab_widget.currentChanged.connect(self.build_tab)
         
         layout.addWidget(self.tab_widget)
         
         return right_widget
         
+    def build_tab(self, index):
+        """Substitui o marcador da aba pela aba real na primeira exibição"""
+        if index not in self.deferred_tabs:
+            return
+        attribute, tab_class, signal, slot = self.deferred_tabs.pop(index)
+        tab = tab_class()
+        getattr(tab, signal).connect(slot)
+        setattr(self, attribute, tab)
+        
+        # Trocar o widget sem disparar currentChanged novamente
+        title = self.tab_widget.tabText(index)
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, tab, title)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+        
     def apply_dark_theme(self):
         """Aplica o tema escuro personalizado"""
         palette = QPalette()
@@ -262,33 +351,32 @@ class MainWindow(QMainWindow):
         
         if file_path:
             try:
-                # Carregar imagem
-                image = cv2.imread(file_path)
+                # Carregar imagem preservando a profundidade (8/16 bits, ponto flutuante)
+                image = cv2.imread(file_path, cv2.IMREAD_UNCHANGED)
                 if image is None:
                     raise ValueError("Não foi possível carregar a imagem")
                 
-                # Converter BGR para RGB
-                image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+                # Converter para um tipo suportado (uint8, uint16, float32), em cinza ou RGB
+                loaded_image = to_supported(image, self.color_checkbox.isChecked())
                 
-                # Converter para escala de cinza se necessário
-                if len(image.shape) == 3:
-                    gray_image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
-                else:
-                    gray_image = image.copy()
+                # Descartar operações em andamento sobre a imagem anterior
+                self.operation_runner.cancel()
                 
                 # Armazenar imagens
-                self.original_image = gray_image.copy()
-                self.current_image = gray_image.copy()
+                self.original_image = loaded_image.copy()
+                self.current_image = loaded_image.copy()
                 
                 # Limpar histórico
-                self.image_history = [self.original_image.copy()]
-                self.history_index = 0
+                self.history.reset(self.current_image, "Imagem original")
+                self.image_version += 1
                 
                 # Atualizar interface
                 self.update_image_display()
                 self.update_controls()
                 
-                self.statusBar().showMessage(f"Imagem carregada: {os.path.basename(file_path)}")
+                self.statusBar().showMessage(
+                    f"Imagem carregada: {os.path.basename(file_path)} ({loaded_image.dtype.name}"
+                    f"{', RGB' if is_color(loaded_image) else ''})")
                 
             except Exception as e:
                 QMessageBox.critical(self, "Erro", f"Erro ao carregar imagem: {str(e)}")
@@ -307,218 +395,369 @@ class MainWindow(QMainWindow):
         
         if file_path:
             try:
-                cv2.imwrite(file_path, self.current_image)
+                # Formatos de 8 bits (JPEG, BMP) recebem uma cópia convertida
+                if not cv2.imwrite(file_path, to_saveable(self.current_image, file_path)):
+                    raise ValueError("Formato não suportado")
                 self.statusBar().showMessage(f"Imagem salva: {os.path.basename(file_path)}")
                 QMessageBox.information(self, "Sucesso", "Imagem salva com sucesso!")
             except Exception as e:
                 QMessageBox.critical(self, "Erro", f"Erro ao salvar imagem: {str(e)}")
                 
     def update_image_display(self):
-        """Atualiza a exibição da imagem"""
+        """
+        Atualiza a exibição da imagem
+        
+        Returns:
+            Lista de pares (etapa, segundos) com o tempo de exibição,
+            estatísticas e histograma
+        """
+        # A imagem exibida passa a ser a atual; uma pré-visualização pendente é descartada
+        self.discard_preview()
+        
+        timings = []
         if self.current_image is not None:
-            self.image_viewer.set_image(self.current_image)
-            self.histogram_widget.update_histogram(self.current_image)
-            self.stats_widget.update_stats(self.current_image)
+            tracer = get_tracer()
+            with tracer.span("display", "ui") as span:
+                self.image_viewer.set_image(self.current_image)
+            timings.append(("display", span.duration))
+            
+            # Histograma e estatísticas calculados uma única vez para os dois widgets
+            with tracer.span("stats", "ui") as span:
+                stats = get_stats_engine().compute(self.current_image)
+                self.stats_widget.update_stats(self.current_image, stats)
+            timings.append(("stats", span.duration))
+            
+            with tracer.span("histogram", "ui") as span:
+                self.histogram_widget.update_histogram(self.current_image, stats)
+            timings.append(("histogram", span.duration))
+        return timings
             
     def update_controls(self):
         """Atualiza o estado dos controles"""
         has_image = self.current_image is not None
         self.save_btn.setEnabled(has_image)
         self.reset_btn.setEnabled(has_image)
-        self.undo_btn.setEnabled(self.history_index > 0)
-        self.redo_btn.setEnabled(self.history_index < len(self.image_history) - 1)
-        
-    def add_to_history(self, image):
-        """Adiciona uma imagem ao histórico"""
-        # Remover imagens após o índice atual
-        self.image_history = self.image_history[:self.history_index + 1]
-        
-        # Adicionar nova imagem
-        self.image_history.append(image.copy())
-        self.history_index += 1
-        
-        # Limitar histórico a 20 imagens
-        if len(self.image_history) > 20:
-            self.image_history.pop(0)
-            self.history_index -= 1
-            
-        self.update_controls()
+        self.undo_btn.setEnabled(self.history.can_undo())
+        self.redo_btn.setEnabled(self.history.can_redo())
         
     def undo(self):
         """Desfaz a última operação"""
-        if self.history_index > 0:
-            self.history_index -= 1
-            self.current_image = self.image_history[self.history_index].copy()
+        if self.history.can_undo():
+            self.operation_runner.cancel()
+            label = self.history.current_label()
+            self.current_image = self.history.undo()
+            self.image_version += 1
             self.update_image_display()
             self.update_controls()
-            self.statusBar().showMessage("Operação desfeita")
+            self.statusBar().showMessage(f"Operação desfeita: {label}" if label else "Operação desfeita")
             
     def redo(self):
         """Refaz a última operação desfeita"""
-        if self.history_index < len(self.image_history) - 1:
-            self.history_index += 1
-            self.current_image = self.image_history[self.history_index].copy()
+        if self.history.can_redo():
+            self.operation_runner.cancel()
+            self.current_image = self.history.redo()
+            self.image_version += 1
             self.update_image_display()
             self.update_controls()
-            self.statusBar().showMessage("Operação refeita")
+            label = self.history.current_label()
+            self.statusBar().showMessage(f"Operação refeita: {label}" if label else "Operação refeita")
             
     def reset_image(self):
         """Retorna à imagem original"""
         if self.original_image is not None:
+            self.operation_runner.cancel()
             self.current_image = self.original_image.copy()
-            self.image_history = [self.original_image.copy()]
-            self.history_index = 0
+            self.image_version += 1
+            self.history.reset(self.current_image, "Imagem original")
             self.update_image_display()
             self.update_controls()
             self.statusBar().showMessage("Imagem resetada para original")
             
+    def get_proxy(self):
+        """Retorna a versão reduzida da imagem atual, cacheada por versão e viewport"""
+        viewport = self.image_viewer.viewport_size()
+        key = (self.image_version, viewport)
+        if key != self.proxy_key:
+            self.proxy = make_proxy(self.current_image, viewport)
+            self.proxy_key = key
+        return self.proxy
+        
+    def preview(self, name, params, message, error_prefix):
+        """Aplica a operação ao proxy e exibe o resultado imediatamente"""
+        tracer = get_tracer()
+        try:
+            with tracer.span("compute", "preview", operation=name) as compute_span:
+                proxy, scale = self.get_proxy()
+                result = preview_operation(proxy, scale, name, params, get_result_cache())
+        except Exception as e:
+            QMessageBox.critical(self, "Erro", f"{error_prefix}: {str(e)}")
+            return
+            
+        with tracer.span("display", "preview") as display_span:
+            self.image_viewer.set_image(result)
+        self.pending_preview = (name, params, message, error_prefix)
+        self.commit_btn.setEnabled(True)
+        timings = [("compute", compute_span.duration), ("display", display_span.duration)]
+        # Kernels pequenos demais para o proxy são ampliados: o resultado
+        # final sai mais nítido que a pré-visualização
+        label = "Pré-visualização" if proxy_is_faithful(name, params, scale) else \
+            "Pré-visualização aproximada (kernel ampliado no proxy)"
+        self.statusBar().showMessage(f"{label}: {message} — {format_breakdown(timings, TIMING_LABELS)} "
+                                     f"(clique em \"Aplicar\" para resolução total)")
+        
+    def commit_preview(self):
+        """Processa em resolução total a operação pré-visualizada"""
+        if self.pending_preview is None or self.current_image is None:
+            return
+        name, params, message, error_prefix = self.pending_preview
+        self.pending_preview = None
+        self.commit_btn.setEnabled(False)
+        self.submit_operation(name, params, message, error_prefix)
+        
+    def discard_preview(self):
+        """Descarta a pré-visualização pendente"""
+        self.pending_preview = None
+        self.commit_btn.setEnabled(False)
+        
+    def toggle_preview(self, enabled):
+        """Ativa ou desativa o modo de pré-visualização"""
+        if not enabled and self.pending_preview is not None:
+            # Voltar a exibir a imagem atual
+            self.update_image_display()
+            
+    def run_operation(self, name, params, message, error_prefix):
+        """Aplica uma operação, como pré-visualização ou em segundo plano"""
+        if self.preview_checkbox.isChecked():
+            self.preview(name, params, message, error_prefix)
+        else:
+            self.submit_operation(name, params, message, error_prefix)
+            
+    def submit_operation(self, name, params, message, error_prefix):
+        """Agenda uma operação em segundo plano sobre a imagem atual"""
+        # A compressão do novo estado do histórico roda junto com o cálculo
+        pending_push = self.history.begin_push(message, (name, params))
+        job_id = self.operation_runner.submit(self.current_image, name, params, pending_push)
+        self.pending_operation = (job_id, self.image_version, message, error_prefix, (name, params),
+                                  pending_push)
+        self.pending_measurement = None
+        self.statusBar().showMessage("Processando...")
+        
+    def on_operation_finished(self, job_id, result, compute_time):
+        """Confirma o resultado de uma operação concluída"""
+        if self.pending_measurement is not None and self.pending_measurement[0] == job_id:
+            version = self.pending_measurement[1]
+            self.pending_measurement = None
+            if version == self.image_version:
+                self.on_regions_measured(result, compute_time)
+            return
+        if self.pending_operation is None:
+            return
+        pending_job, version, message, _, operation, pending_push = self.pending_operation
+        
+        # Descartar resultados de pedidos antigos ou de outra versão da imagem
+        if job_id != pending_job or version != self.image_version:
+            return
+        self.pending_operation = None
+        
+        self.current_image = result
+        self.image_version += 1
+        
+        # Tempo de cada etapa, do cálculo até o histograma
+        timings = [("compute", compute_time)]
+        with get_tracer().span("history", "ui", operation=operation[0]) as span:
+            # Estado já comprimido na thread de trabalho: aqui só é anexado
+            pending_push.commit()
+            self.update_controls()
+        timings.append(("history", pending_push.seconds + span.duration))
+        timings += self.update_image_display()
+        self.statusBar().showMessage(f"{message} — {format_breakdown(timings, TIMING_LABELS)}")
+        
+    def on_operation_failed(self, job_id, error):
+        """Exibe o erro de uma operação que falhou"""
+        if self.pending_measurement is not None and self.pending_measurement[0] == job_id:
+            self.pending_measurement = None
+            self.statusBar().showMessage("Erro ao medir objetos")
+            QMessageBox.critical(self, "Erro", f"Erro ao medir objetos: {error}")
+            return
+        if self.pending_operation is None or self.pending_operation[0] != job_id:
+            return
+        error_prefix = self.pending_operation[3]
+        self.pending_operation = None
+        self.statusBar().showMessage(error_prefix)
+        QMessageBox.critical(self, "Erro", f"{error_prefix}: {error}")
+        
+    def cancel_operation(self):
+        """Cancela a operação em andamento"""
+        if self.operation_runner.is_busy():
+            self.operation_runner.cancel()
+            self.pending_operation = None
+            self.pending_measurement = None
+            self.statusBar().showMessage("Operação cancelada")
+            
+    def set_busy(self, busy):
+        """Mostra ou esconde o indicador de processamento"""
+        self.busy_bar.setVisible(busy)
+        self.cancel_btn.setVisible(busy)
+        
+    def paintEvent(self, event):
+        """Inicia o pré-carregamento das bibliotecas após a primeira pintura"""
+        super().paintEvent(event)
+        if self.warm_up_thread is None:
+            self.warm_up_thread = warm_up(["numpy", "cv2"] + operation_modules())
+            
+    def export_trace(self):
+        """Exporta os tempos coletados na sessão no formato Chrome trace"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Exportar Trace",
+            "trace.json",
+            "Chrome trace (*.json)"
+        )
+        
+        if file_path:
+            try:
+                get_tracer().export_chrome_trace(file_path)
+                self.statusBar().showMessage(f"Trace exportado: {os.path.basename(file_path)}")
+            except Exception as e:
+                QMessageBox.critical(self, "Erro", f"Erro ao exportar trace: {str(e)}")
+                
+    def closeEvent(self, event):
+        """Encerra o executor de operações ao fechar a janela"""
+        self.operation_runner.shutdown()
+        super().closeEvent(event)
+        
     def apply_transform(self, transform_type, params):
         """Aplica uma transformação à imagem"""
         if self.current_image is None:
             return
             
-        try:
-            from src.transforms.intensity_transforms import IntensityTransforms
-            transforms = IntensityTransforms()
-            
-            if transform_type == "contrast_stretch":
-                result = transforms.contrast_stretch(self.current_image, params)
-                message = "Alargamento de contraste aplicado"
-            elif transform_type == "histogram_equalization":
-                result = transforms.histogram_equalization(self.current_image)
-                message = "Equalização de histograma aplicada"
-            else:
-                return
-                
-            self.current_image = result
-            self.add_to_history(self.current_image)
-            self.update_image_display()
-            self.statusBar().showMessage(message)
+        if transform_type == "contrast_stretch":
+            message = "Alargamento de contraste aplicado"
+        elif transform_type == "histogram_equalization":
+            message = "Equalização de histograma aplicada"
+        else:
+            return
             
-        except Exception as e:
-            QMessageBox.critical(self, "Erro", f"Erro ao aplicar transformação: {str(e)}")
+        self.run_operation(transform_type, params, message, "Erro ao aplicar transformação")
             
     def apply_filter(self, filter_type, params):
         """Aplica um filtro à imagem"""
         if self.current_image is None:
             return
             
-        try:
-            from src.filters.spatial_filters import SpatialFilters
-            filters = SpatialFilters()
-            
-            if filter_type == "mean":
-                result = filters.mean_filter(self.current_image, params.get("kernel_size", 3))
-                message = "Filtro da média aplicado"
-            elif filter_type == "median":
-                result = filters.median_filter(self.current_image, params.get("kernel_size", 3))
-                message = "Filtro da mediana aplicado"
-            elif filter_type == "gaussian":
-                result = filters.gaussian_filter(self.current_image, params.get("sigma", 1.0))
-                message = "Filtro gaussiano aplicado"
-            elif filter_type == "max":
-                result = filters.max_filter(self.current_image, params.get("kernel_size", 3))
-                message = "Filtro máximo aplicado"
-            elif filter_type == "min":
-                result = filters.min_filter(self.current_image, params.get("kernel_size", 3))
-                message = "Filtro mínimo aplicado"
-            elif filter_type == "laplacian":
-                result = filters.laplacian_filter(self.current_image)
-                message = "Filtro laplaciano aplicado"
-            elif filter_type == "roberts":
-                result = filters.roberts_filter(self.current_image)
-                message = "Filtro de Roberts aplicado"
-            elif filter_type == "prewitt":
-                result = filters.prewitt_filter(self.current_image)
-                message = "Filtro de Prewitt aplicado"
-            elif filter_type == "sobel":
-                result = filters.sobel_filter(self.current_image)
-                message = "Filtro de Sobel aplicado"
-            else:
-                return
-                
-            self.current_image = result
-            self.add_to_history(self.current_image)
-            self.update_image_display()
-            self.statusBar().showMessage(message)
+        if filter_type == "mean":
+            message = "Filtro da média aplicado"
+        elif filter_type == "median":
+            message = "Filtro da mediana aplicado"
+        elif filter_type == "gaussian":
+            message = "Filtro gaussiano aplicado"
+        elif filter_type == "max":
+            message = "Filtro máximo aplicado"
+        elif filter_type == "min":
+            message = "Filtro mínimo aplicado"
+        elif filter_type == "laplacian":
+            message = "Filtro laplaciano aplicado"
+        elif filter_type == "roberts":
+            message = "Filtro de Roberts aplicado"
+        elif filter_type == "prewitt":
+            message = "Filtro de Prewitt aplicado"
+        elif filter_type == "sobel":
+            message = "Filtro de Sobel aplicado"
+        elif filter_type == "wiener":
+            message = "Filtro de Wiener aplicado"
+        elif filter_type == "lee":
+            message = "Filtro de Lee aplicado"
+        elif filter_type == "local_contrast":
+            message = "Normalização de contraste local aplicada"
+        else:
+            return
             
-        except Exception as e:
-            QMessageBox.critical(self, "Erro", f"Erro ao aplicar filtro: {str(e)}")
+        self.run_operation(filter_type, params, message, "Erro ao aplicar filtro")
             
     def apply_morphology(self, morph_type, params):
         """Aplica operação morfológica à imagem"""
         if self.current_image is None:
             return
             
-        try:
-            from src.morphology.morphological_ops import MorphologicalOps
-            morph = MorphologicalOps()
-            
-            if morph_type == "erosion":
-                result = morph.erosion(self.current_image, params.get("kernel_size", 3))
-                message = "Erosão aplicada"
-            elif morph_type == "dilation":
-                result = morph.dilation(self.current_image, params.get("kernel_size", 3))
-                message = "Dilatação aplicada"
-            else:
-                return
-                
-            self.current_image = result
-            self.add_to_history(self.current_image)
-            self.update_image_display()
-            self.statusBar().showMessage(message)
+        if morph_type == "erosion":
+            message = "Erosão aplicada"
+        elif morph_type == "dilation":
+            message = "Dilatação aplicada"
+        elif morph_type == "opening":
+            message = "Abertura aplicada"
+        elif morph_type == "closing":
+            message = "Fechamento aplicado"
+        elif morph_type == "gradient":
+            message = "Gradiente morfológico aplicado"
+        elif morph_type == "tophat":
+            message = "Top-hat aplicado"
+        elif morph_type == "blackhat":
+            message = "Black-hat aplicado"
+        else:
+            return
             
-        except Exception as e:
-            QMessageBox.critical(self, "Erro", f"Erro ao aplicar operação morfológica: {str(e)}")
+        self.run_operation(morph_type, params, message, "Erro ao aplicar operação morfológica")
             
     def apply_frequency(self, freq_type, params):
         """Aplica filtro no domínio da frequência"""
         if self.current_image is None:
             return
             
-        try:
-            from src.frequency.frequency_filters import FrequencyFilters
-            filters = FrequencyFilters()
-            
-            if freq_type == "low_pass":
-                result = filters.low_pass_filter(self.current_image, params.get("cutoff", 30))
-                message = "Filtro passa-baixa aplicado"
-            elif freq_type == "high_pass":
-                result = filters.high_pass_filter(self.current_image, params.get("cutoff", 30))
-                message = "Filtro passa-alta aplicado"
-            elif freq_type == "fourier_spectrum":
+        if freq_type == "low_pass":
+            message = "Filtro passa-baixa aplicado"
+        elif freq_type == "high_pass":
+            message = "Filtro passa-alta aplicado"
+        elif freq_type == "band_pass":
+            message = "Filtro passa-faixa aplicado"
+        elif freq_type == "band_reject":
+            message = "Filtro rejeita-faixa aplicado"
+        elif freq_type == "fourier_spectrum":
+            try:
                 self.frequency_tab.show_fourier_spectrum_dialog(self.current_image)
-                return
-            else:
-                return
-                
-            self.current_image = result
-            self.add_to_history(self.current_image)
-            self.update_image_display()
-            self.statusBar().showMessage(message)
+            except Exception as e:
+                QMessageBox.critical(self, "Erro", f"Erro ao aplicar filtro de frequência: {str(e)}")
+            return
+        else:
+            return
             
-        except Exception as e:
-            QMessageBox.critical(self, "Erro", f"Erro ao aplicar filtro de frequência: {str(e)}")
+        self.run_operation(freq_type, params, message, "Erro ao aplicar filtro de frequência")
             
     def apply_segmentation(self, seg_type, params):
         """Aplica segmentação à imagem"""
         if self.current_image is None:
             return
             
-        try:
-            from src.segmentation.segmentation_methods import SegmentationMethods
-            seg = SegmentationMethods()
+        if seg_type == "otsu":
+            message = "Limiarização de Otsu aplicada"
+        elif seg_type == "multi_otsu":
+            message = "Limiarização de Otsu multinível aplicada"
+        elif seg_type == "adaptive_threshold":
+            message = "Limiarização adaptativa aplicada"
+        elif seg_type == "measure_regions":
+            self.measure_regions(params)
+            return
+        else:
+            return
             
-            if seg_type == "otsu":
-                result = seg.otsu_thresholding(self.current_image)
-                message = "Limiarização de Otsu aplicada"
-            else:
-                return
-                
-            self.current_image = result
-            self.add_to_history(self.current_image)
-            self.update_image_display()
-            self.statusBar().showMessage(message)
+        self.run_operation(seg_type, params, message, "Erro ao aplicar segmentação")
+        
+    def measure_regions(self, params):
+        """Conta e mede os objetos da imagem atual (tratada como máscara) em segundo plano"""
+        from src.segmentation.connected_components import measure_image
+        
+        # Intensidade medida na imagem original, quando ela tem o mesmo tamanho
+        intensity = self.original_image
+        if intensity is not None and intensity.shape[:2] != self.current_image.shape[:2]:
+            intensity = None
             
-        except Exception as e:
-            QMessageBox.critical(self, "Erro", f"Erro ao aplicar segmentação: {str(e)}") 
\ No newline at end of file
+        job_id = self.operation_runner.submit_call(
+            measure_image, self.current_image, intensity, params.get("connectivity", 8))
+        # O novo trabalho substitui qualquer operação pendente
+        self.pending_operation = None
+        self.pending_measurement = (job_id, self.image_version)
+        self.statusBar().showMessage("Medindo objetos...")
+        
+    def on_regions_measured(self, regions, compute_time):
+        """Exibe as regiões medidas na thread de trabalho"""
+        self.statusBar().showMessage(f"{len(regions)} objetos encontrados ({compute_time * 1000:.0f} ms)")
+        self.segmentation_tab.show_regions_dialog(regions)
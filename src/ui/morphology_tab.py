@@ -61,7 +61,7 @@ class MorphologyTab(QWidget):
         kernel_label.setStyleSheet("color: #c9efb2;")
         
         self.kernel_size_spinbox = QSpinBox()
-        self.kernel_size_spinbox.setRange(3, 15)
+        self.kernel_size_spinbox.setRange(3, 101)
         self.kernel_size_spinbox.setValue(3)
         self.kernel_size_spinbox.setSingleStep(2)  # Apenas valores ímpares
         self.kernel_size_spinbox.setStyleSheet("""
@@ -74,8 +74,29 @@ class MorphologyTab(QWidget):
             }
         """)
         
+        # Forma do elemento estruturante
+        shape_label = QLabel("Forma:")
+        shape_label.setStyleSheet("color: #c9efb2;")
+        self.shape_combo = QComboBox()
+        self.shape_combo.addItem("Elipse", "ellipse")
+        self.shape_combo.addItem("Retângulo", "rect")
+        self.shape_combo.addItem("Cruz", "cross")
+        self.shape_combo.setStyleSheet(self.kernel_size_spinbox.styleSheet().replace("QSpinBox", "QComboBox"))
+        
+        # Número de iterações
+        iterations_label = QLabel("Iterações:")
+        iterations_label.setStyleSheet("color: #c9efb2;")
+        self.iterations_spinbox = QSpinBox()
+        self.iterations_spinbox.setRange(1, 20)
+        self.iterations_spinbox.setValue(1)
+        self.iterations_spinbox.setStyleSheet(self.kernel_size_spinbox.styleSheet())
+        
         kernel_layout.addWidget(kernel_label)
         kernel_layout.addWidget(self.kernel_size_spinbox)
+        kernel_layout.addWidget(shape_label)
+        kernel_layout.addWidget(self.shape_combo)
+        kernel_layout.addWidget(iterations_label)
+        kernel_layout.addWidget(self.iterations_spinbox)
         kernel_layout.addStretch()
         
         layout.addLayout(kernel_layout)
@@ -83,7 +104,10 @@ class MorphologyTab(QWidget):
         # Descrição das operações
         desc_label = QLabel("""
         <b>Erosão:</b> Reduz objetos brancos e expande objetos negros<br>
-        <b>Dilatação:</b> Expande objetos brancos e reduz objetos negros
+        <b>Dilatação:</b> Expande objetos brancos e reduz objetos negros<br>
+        <b>Abertura / Fechamento:</b> Removem detalhes claros / escuros menores que o elemento<br>
+        <b>Gradiente:</b> Contornos (dilatação − erosão)<br>
+        <b>Top-hat / Black-hat:</b> Realçam detalhes claros / escuros menores que o elemento
         """)
         desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         desc_label.setStyleSheet("color: #c9efb2; padding: 8px; background: #2c3825; border-radius: 4px;")
@@ -138,14 +162,64 @@ class MorphologyTab(QWidget):
         
         layout.addLayout(buttons_layout)
         
+        # Botões para operações compostas
+        compound_layout = QHBoxLayout()
+        for attribute, text, slot in (
+                ("opening_btn", "Abertura", self.apply_opening),
+                ("closing_btn", "Fechamento", self.apply_closing),
+                ("gradient_btn", "Gradiente", self.apply_gradient)):
+            button = QPushButton(text)
+            button.clicked.connect(slot)
+            button.setStyleSheet(self.erosion_btn.styleSheet())
+            setattr(self, attribute, button)
+            compound_layout.addWidget(button)
+        layout.addLayout(compound_layout)
+        
+        hat_layout = QHBoxLayout()
+        for attribute, text, slot in (
+                ("tophat_btn", "Top-hat", self.apply_tophat),
+                ("blackhat_btn", "Black-hat", self.apply_blackhat)):
+            button = QPushButton(text)
+            button.clicked.connect(slot)
+            button.setStyleSheet(self.erosion_btn.styleSheet())
+            setattr(self, attribute, button)
+            hat_layout.addWidget(button)
+        layout.addLayout(hat_layout)
+        
         parent_layout.addWidget(group)
         
+    def morphology_params(self):
+        """Parâmetros atuais do elemento estruturante"""
+        return {
+            "kernel_size": self.kernel_size_spinbox.value(),
+            "shape": self.shape_combo.currentData(),
+            "iterations": self.iterations_spinbox.value()
+        }
+        
     def apply_erosion(self):
         """Aplica operação de erosão"""
-        params = {"kernel_size": self.kernel_size_spinbox.value()}
-        self.morphology_applied.emit("erosion", params)
+        self.morphology_applied.emit("erosion", self.morphology_params())
         
     def apply_dilation(self):
         """Aplica operação de dilatação"""
-        params = {"kernel_size": self.kernel_size_spinbox.value()}
-        self.morphology_applied.emit("dilation", params) 
\ No newline at end of file
+        self.morphology_applied.emit("dilation", self.morphology_params())
+        
+    def apply_opening(self):
+        """Aplica abertura"""
+        self.morphology_applied.emit("opening", self.morphology_params())
+        
+    def apply_closing(self):
+        """Aplica fechamento"""
+        self.morphology_applied.emit("closing", self.morphology_params())
+        
+    def apply_gradient(self):
+        """Aplica gradiente morfológico"""
+        self.morphology_applied.emit("gradient", self.morphology_params())
+        
+    def apply_tophat(self):
+        """Aplica top-hat"""
+        self.morphology_applied.emit("tophat", self.morphology_params())
+        
+    def apply_blackhat(self):
+        """Aplica black-hat"""
+        self.morphology_applied.emit("blackhat", self.morphology_params()) 
\ No newline at end of file
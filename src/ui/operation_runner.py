@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Execução das operações de processamento em segundo plano
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from src.pipeline.operations import apply_operation
+from src.pipeline.result_cache import get_result_cache
+from src.profiling.tracer import get_tracer
+from src.utils.cancellation import OperationCancelled, cancellation_scope
+
+class OperationRunner(QObject):
+    """
+    Executa operações fora do loop de eventos do Qt, descartando resultados obsoletos
+
+    Um trabalho cancelado ou substituído também é interrompido: o seu evento
+    de cancelamento é sinalizado e as operações processadas em blocos param
+    no próximo bloco, liberando a thread para o pedido seguinte.
+    """
+
+    # Sinais (identificador do trabalho, resultado e tempo de cálculo em segundos, ou mensagem de erro)
+    finished = pyqtSignal(int, object, float)
+    failed = pyqtSignal(int, str)
+    busy_changed = pyqtSignal(bool)
+
+    # Sinal interno usado para voltar à thread da interface
+    _done = pyqtSignal(int, object, str, float)
+
+    def __init__(self, max_workers=2, parent=None):
+        super().__init__(parent)
+        # Mais de uma thread permite iniciar um novo pedido enquanto um obsoleto termina
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="operation")
+        self.job_ids = count(1)
+        self.current_job = None
+        self.current_future = None
+        self.current_cancel = None
+        self._done.connect(self._on_done)
+
+    def is_busy(self):
+        """Indica se há uma operação em andamento"""
+        return self.current_job is not None
+
+    def submit(self, image, name, params, pending_push=None):
+        """
+        Agenda uma operação, tornando obsoleta qualquer operação anterior
+
+        Resultados já calculados para a mesma imagem e os mesmos parâmetros
+        vêm do cache de resultados compartilhado.
+
+        Args:
+            image: Imagem de entrada
+            name: Nome da operação registrada
+            params: Dicionário com os parâmetros da operação
+            pending_push: PendingPush do histórico (opcional), codificado com o
+                          resultado na própria thread de trabalho
+
+        Returns:
+            Identificador do trabalho
+        """
+        after = pending_push.encode if pending_push is not None else None
+        return self.submit_call(apply_operation, image, name, params, get_result_cache(), after=after)
+
+    def submit_call(self, func, *args, after=None):
+        """
+        Agenda uma função qualquer, com as mesmas regras de submit
+
+        Args:
+            func: Função executada na thread de trabalho
+            *args: Argumentos da função
+            after: Função chamada com o resultado, ainda na thread de trabalho
+                   e fora da medição do cálculo (opcional)
+        """
+        was_busy = self.is_busy()
+        self._stop_current()
+
+        job_id = next(self.job_ids)
+        self.current_job = job_id
+        self.current_cancel = threading.Event()
+        self.current_future = self.executor.submit(self._run, job_id, func, args, self.current_cancel, after)
+        self.current_future.add_done_callback(lambda future: self._emit_done(job_id, future))
+
+        if not was_busy:
+            self.busy_changed.emit(True)
+        return job_id
+
+    def cancel(self):
+        """
+        Cancela a operação atual; se já estiver em execução, ela para no
+        próximo bloco (operações sem blocos terminam) e o resultado é descartado
+        """
+        if self.current_job is None:
+            return
+
+        self._stop_current()
+        self.current_job = None
+        self.current_future = None
+        self.current_cancel = None
+        self.busy_changed.emit(False)
+
+    def shutdown(self):
+        """Encerra o executor sem aguardar operações obsoletas"""
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _stop_current(self):
+        """Cancela o trabalho atual se ainda não começou, ou pede que pare se já começou"""
+        if self.current_future is not None:
+            self.current_future.cancel()
+        if self.current_cancel is not None:
+            self.current_cancel.set()
+
+    def _run(self, job_id, func, args, cancel_event, after):
+        """Executa a função na thread de trabalho, medindo o tempo de cálculo"""
+        tracer = get_tracer()
+        with tracer.span("compute", "operation", job=job_id) as span:
+            with cancellation_scope(cancel_event):
+                result = func(*args)
+        if after is not None:
+            with tracer.span("history", "operation", job=job_id):
+                after(result)
+        return result, span.duration
+        
+    def _emit_done(self, job_id, future):
+        """Chamado na thread de trabalho; repassa o resultado para a thread da interface"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if isinstance(error, OperationCancelled):
+            return
+        if error is not None:
+            self._done.emit(job_id, None, str(error) or type(error).__name__, 0.0)
+        else:
+            result, duration = future.result()
+            self._done.emit(job_id, result, "", duration)
+
+    def _on_done(self, job_id, result, error, duration):
+        """Entrega apenas o resultado do trabalho mais recente"""
+        if job_id != self.current_job:
+            return
+
+        self.current_job = None
+        self.current_future = None
+        self.current_cancel = None
+        self.busy_changed.emit(False)
+
+        if error:
+            self.failed.emit(job_id, error)
+        else:
+            self.finished.emit(job_id, result, duration)
@@ -5,7 +5,8 @@ Aba de segmentação de imagens
 """
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                             QLabel, QGroupBox)
+                             QLabel, QGroupBox, QSpinBox, QDoubleSpinBox, QComboBox,
+                             QDialog, QTableWidget, QTableWidgetItem, QHeaderView)
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 
@@ -32,6 +33,12 @@ class SegmentationTab(QWidget):
         # Grupo de limiarização
         self.create_thresholding_group(layout)
         
+        # Grupo de limiarização adaptativa
+        self.create_adaptive_group(layout)
+        
+        # Grupo de medição de objetos
+        self.create_regions_group(layout)
+        
         layout.addStretch()
         
     def create_thresholding_group(self, parent_layout):
@@ -87,9 +94,219 @@ class SegmentationTab(QWidget):
         """)
         layout.addWidget(self.otsu_btn)
         
+        # Otsu multinível: número de classes
+        classes_layout = QHBoxLayout()
+        classes_label = QLabel("Classes:")
+        classes_label.setStyleSheet("color: #c9efb2;")
+        self.classes_spinbox = QSpinBox()
+        self.classes_spinbox.setRange(2, 8)
+        self.classes_spinbox.setValue(3)
+        self.classes_spinbox.setStyleSheet("""
+            QSpinBox {
+                background: #2c3825;
+                border: 1px solid #324624;
+                border-radius: 4px;
+                color: #c9efb2;
+                padding: 4px;
+            }
+        """)
+        
+        self.multi_otsu_btn = QPushButton("Otsu Multinível")
+        self.multi_otsu_btn.clicked.connect(self.apply_multi_otsu_thresholding)
+        self.multi_otsu_btn.setStyleSheet(self.otsu_btn.styleSheet())
+        
+        classes_layout.addWidget(classes_label)
+        classes_layout.addWidget(self.classes_spinbox)
+        classes_layout.addWidget(self.multi_otsu_btn, 1)
+        layout.addLayout(classes_layout)
+        
+        self.group_style = group.styleSheet()
+        parent_layout.addWidget(group)
+        
+    def create_adaptive_group(self, parent_layout):
+        """Cria o grupo de limiarização adaptativa"""
+        group = QGroupBox("Limiarização Adaptativa")
+        group.setStyleSheet(self.group_style)
+        
+        layout = QVBoxLayout(group)
+        
+        desc_label = QLabel("""
+        <b>Limiar local:</b> Calculado na vizinhança de cada pixel, a partir da média
+        e do desvio padrão da janela (imagens integrais: qualquer janela custa o mesmo).<br>
+        • <b>Média / Gaussiana:</b> média local − deslocamento<br>
+        • <b>Niblack:</b> média − k · desvio<br>
+        • <b>Sauvola:</b> média · (1 + k · (desvio / R − 1))
+        """)
+        desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        desc_label.setStyleSheet("color: #c9efb2; padding: 8px; background: #2c3825; border-radius: 4px;")
+        desc_label.setWordWrap(True)
+        layout.addWidget(desc_label)
+        
+        params_layout = QHBoxLayout()
+        
+        method_label = QLabel("Método:")
+        method_label.setStyleSheet("color: #c9efb2;")
+        self.method_combo = QComboBox()
+        self.method_combo.addItem("Média", "mean")
+        self.method_combo.addItem("Gaussiana", "gaussian")
+        self.method_combo.addItem("Sauvola", "sauvola")
+        self.method_combo.addItem("Niblack", "niblack")
+        self.method_combo.setStyleSheet(self.classes_spinbox.styleSheet().replace("QSpinBox", "QComboBox"))
+        
+        window_label = QLabel("Janela:")
+        window_label.setStyleSheet("color: #c9efb2;")
+        self.window_size_spinbox = QSpinBox()
+        self.window_size_spinbox.setRange(3, 501)
+        self.window_size_spinbox.setValue(31)
+        self.window_size_spinbox.setSingleStep(2)  # Apenas valores ímpares
+        self.window_size_spinbox.setStyleSheet(self.classes_spinbox.styleSheet())
+        
+        k_label = QLabel("k:")
+        k_label.setStyleSheet("color: #c9efb2;")
+        self.k_spinbox = QDoubleSpinBox()
+        self.k_spinbox.setRange(-1.0, 1.0)
+        self.k_spinbox.setSingleStep(0.05)
+        self.k_spinbox.setValue(0.2)
+        self.k_spinbox.setStyleSheet(self.classes_spinbox.styleSheet().replace("QSpinBox", "QDoubleSpinBox"))
+        
+        offset_label = QLabel("Deslocamento:")
+        offset_label.setStyleSheet("color: #c9efb2;")
+        self.offset_spinbox = QSpinBox()
+        self.offset_spinbox.setRange(-255, 255)
+        self.offset_spinbox.setValue(0)
+        self.offset_spinbox.setStyleSheet(self.classes_spinbox.styleSheet())
+        
+        for widget in (method_label, self.method_combo, window_label, self.window_size_spinbox,
+                       k_label, self.k_spinbox, offset_label, self.offset_spinbox):
+            params_layout.addWidget(widget)
+        params_layout.addStretch()
+        layout.addLayout(params_layout)
+        
+        self.adaptive_btn = QPushButton("Aplicar Limiarização Adaptativa")
+        self.adaptive_btn.clicked.connect(self.apply_adaptive_thresholding)
+        self.adaptive_btn.setStyleSheet(self.otsu_btn.styleSheet())
+        layout.addWidget(self.adaptive_btn)
+        
+        parent_layout.addWidget(group)
+        
+    def create_regions_group(self, parent_layout):
+        """Cria o grupo de medição de objetos"""
+        group = QGroupBox("Objetos")
+        group.setStyleSheet(self.group_style)
+        
+        layout = QVBoxLayout(group)
+        
+        desc_label = QLabel("""
+        <b>Componentes conexos:</b> Conta os objetos da máscara (pixels diferentes de zero)
+        e mede área, retângulo envolvente, centroide e intensidade média na imagem original.
+        """)
+        desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        desc_label.setStyleSheet("color: #c9efb2; padding: 8px; background: #2c3825; border-radius: 4px;")
+        desc_label.setWordWrap(True)
+        layout.addWidget(desc_label)
+        
+        connectivity_layout = QHBoxLayout()
+        connectivity_label = QLabel("Conectividade:")
+        connectivity_label.setStyleSheet("color: #c9efb2;")
+        self.connectivity_combo = QComboBox()
+        self.connectivity_combo.addItem("8 vizinhos", 8)
+        self.connectivity_combo.addItem("4 vizinhos", 4)
+        self.connectivity_combo.setStyleSheet(self.method_combo.styleSheet())
+        
+        self.regions_btn = QPushButton("📏 Medir Objetos")
+        self.regions_btn.clicked.connect(self.measure_regions)
+        self.regions_btn.setStyleSheet(self.otsu_btn.styleSheet())
+        
+        connectivity_layout.addWidget(connectivity_label)
+        connectivity_layout.addWidget(self.connectivity_combo)
+        connectivity_layout.addWidget(self.regions_btn, 1)
+        layout.addLayout(connectivity_layout)
+        
         parent_layout.addWidget(group)
         
     def apply_otsu_thresholding(self):
         """Aplica limiarização de Otsu"""
         params = {}
-        self.segmentation_applied.emit("otsu", params) 
\ No newline at end of file
+        self.segmentation_applied.emit("otsu", params)
+        
+    def apply_multi_otsu_thresholding(self):
+        """Aplica limiarização de Otsu multinível"""
+        params = {"classes": self.classes_spinbox.value()}
+        self.segmentation_applied.emit("multi_otsu", params)
+        
+    def apply_adaptive_thresholding(self):
+        """Aplica limiarização adaptativa"""
+        params = {
+            "method": self.method_combo.currentData(),
+            "window_size": self.window_size_spinbox.value(),
+            "k": self.k_spinbox.value(),
+            "offset": self.offset_spinbox.value()
+        }
+        self.segmentation_applied.emit("adaptive_threshold", params)
+        
+    def measure_regions(self):
+        """Solicita a medição dos objetos da máscara atual"""
+        params = {"connectivity": self.connectivity_combo.currentData()}
+        self.segmentation_applied.emit("measure_regions", params)
+        
+    def show_regions_dialog(self, regions):
+        """Mostra as estatísticas das regiões em uma janela separada"""
+        dialog = RegionsDialog(regions, self)
+        dialog.exec()
+
+class RegionsDialog(QDialog):
+    """Dialog com a tabela de estatísticas por objeto"""
+    
+    # Colunas exibidas: (campo de REGION_DTYPE, título, casas decimais)
+    COLUMNS = (
+        ("label", "Rótulo", 0),
+        ("area", "Área", 0),
+        ("left", "X", 0),
+        ("top", "Y", 0),
+        ("width", "Largura", 0),
+        ("height", "Altura", 0),
+        ("centroid_x", "Centroide X", 1),
+        ("centroid_y", "Centroide Y", 1),
+        ("mean_intensity", "Intensidade Média", 1),
+    )
+    
+    # Acima deste número de objetos, só os maiores são listados
+    MAX_ROWS = 5000
+    
+    def __init__(self, regions, parent=None):
+        super().__init__(parent)
+        self.regions = regions
+        self.init_ui()
+        
+    def init_ui(self):
+        """Inicializa a interface do dialog"""
+        self.setWindowTitle("Objetos")
+        self.setGeometry(200, 200, 900, 600)
+        
+        layout = QVBoxLayout(self)
+        
+        regions = self.regions
+        summary = f"{len(regions)} objetos"
+        if len(regions):
+            summary += f" — área total {int(regions['area'].sum())} px, média {regions['area'].mean():.1f} px"
+        if len(regions) > self.MAX_ROWS:
+            # Listar os maiores objetos
+            regions = regions[regions["area"].argsort(kind="stable")[::-1][:self.MAX_ROWS]]
+            summary += f" (exibindo os {self.MAX_ROWS} maiores)"
+            
+        summary_label = QLabel(summary)
+        summary_label.setStyleSheet("color: #c9efb2; font-weight: bold; padding: 4px;")
+        layout.addWidget(summary_label)
+        
+        self.table = QTableWidget(len(regions), len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels([title for _, title, _ in self.COLUMNS])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        
+        for column, (field, _, decimals) in enumerate(self.COLUMNS):
+            for row, value in enumerate(regions[field].tolist()):
+                text = f"{value:.{decimals}f}" if value == value else "—"
+                self.table.setItem(row, column, QTableWidgetItem(text))
+                
+        layout.addWidget(self.table)
@@ -7,7 +7,8 @@ Widget para exibição de estatísticas detalhadas da imagem
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame, QGridLayout
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
-import numpy as np
+
+from src.analysis.stats_engine import get_stats_engine
 
 class StatsWidget(QWidget):
     """Widget para exibição de estatísticas detalhadas da imagem"""
@@ -90,68 +91,33 @@ class StatsWidget(QWidget):
             
             self.stat_labels[key] = value_label
             
-    def update_stats(self, image):
-        """Atualiza as estatísticas com a imagem fornecida"""
+    def update_stats(self, image, stats=None):
+        """
+        Atualiza as estatísticas com a imagem fornecida
+        
+        Args:
+            image: Imagem atual
+            stats: Estatísticas já calculadas pelo StatsEngine (opcional)
+        """
         if image is None:
             for label in self.stat_labels.values():
                 label.setText("N/A")
             return
             
-        # Calcular estatísticas básicas
-        mean_val = np.mean(image)
-        median_val = np.median(image)
-        std_val = np.std(image)
-        variance_val = np.var(image)
-        min_val = np.min(image)
-        max_val = np.max(image)
-        range_val = max_val - min_val
-        
-        # Calcular assimetria
-        skewness_val = self.calculate_skewness(image)
-        
-        # Calcular curtose
-        kurtosis_val = self.calculate_kurtosis(image)
-        
-        # Calcular entropia
-        entropy_val = self.calculate_entropy(image)
+        # Estatísticas derivadas de um único histograma (compartilhadas com o histograma)
+        if stats is None:
+            stats = get_stats_engine().compute(image)
         
         # Atualizar labels
         self.stat_labels["dims"].setText(f"{image.shape[1]} × {image.shape[0]}")
         self.stat_labels["size"].setText(f"{image.size:,} pixels")
-        self.stat_labels["mean"].setText(f"{mean_val:.2f}")
-        self.stat_labels["median"].setText(f"{median_val:.2f}")
-        self.stat_labels["std"].setText(f"{std_val:.2f}")
-        self.stat_labels["variance"].setText(f"{variance_val:.2f}")
-        self.stat_labels["min"].setText(f"{min_val:.0f}")
-        self.stat_labels["max"].setText(f"{max_val:.0f}")
-        self.stat_labels["range"].setText(f"{range_val:.0f}")
-        self.stat_labels["skewness"].setText(f"{skewness_val:.3f}")
-        self.stat_labels["kurtosis"].setText(f"{kurtosis_val:.3f}")
-        self.stat_labels["entropy"].setText(f"{entropy_val:.3f}")
-        
-    def calculate_skewness(self, image):
-        """Calcula a assimetria da imagem"""
-        mean = np.mean(image)
-        std = np.std(image)
-        if std == 0:
-            return 0
-        return np.mean(((image - mean) / std) ** 3)
-        
-    def calculate_kurtosis(self, image):
-        """Calcula a curtose da imagem"""
-        mean = np.mean(image)
-        std = np.std(image)
-        if std == 0:
-            return 0
-        return np.mean(((image - mean) / std) ** 4) - 3
-        
-    def calculate_entropy(self, image):
-        """Calcula a entropia da imagem"""
-        # Calcular histograma
-        hist, _ = np.histogram(image, bins=256, range=(0, 256))
-        hist = hist[hist > 0]  # Remover bins vazios
-        prob = hist / hist.sum()
-        
-        # Calcular entropia
-        entropy = -np.sum(prob * np.log2(prob))
-        return entropy 
\ No newline at end of file
+        self.stat_labels["mean"].setText(f"{stats['mean']:.2f}")
+        self.stat_labels["median"].setText(f"{stats['median']:.2f}")
+        self.stat_labels["std"].setText(f"{stats['std']:.2f}")
+        self.stat_labels["variance"].setText(f"{stats['variance']:.2f}")
+        self.stat_labels["min"].setText(f"{stats['min']:g}")
+        self.stat_labels["max"].setText(f"{stats['max']:g}")
+        self.stat_labels["range"].setText(f"{stats['range']:g}")
+        self.stat_labels["skewness"].setText(f"{stats['skewness']:.3f}")
+        self.stat_labels["kurtosis"].setText(f"{stats['kurtosis']:.3f}")
+        self.stat_labels["entropy"].setText(f"{stats['entropy']:.3f}")
@@ -61,8 +61,8 @@ class TransformsTab(QWidget):
         # Descrição
         desc_label = QLabel("""
         <b>Alargamento de Contraste:</b> Expande o intervalo de níveis de cinza para melhorar o contraste.<br>
-        • <b>Valor Mínimo:</b> 0<br>
-        • <b>Valor Máximo:</b> 255
+        • <b>Valor Mínimo:</b> mínimo do tipo da imagem (0)<br>
+        • <b>Valor Máximo:</b> máximo do tipo da imagem (255 em 8 bits, 65535 em 16 bits, 1.0 em ponto flutuante)
         """)
         desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         desc_label.setStyleSheet("color: #c9efb2; padding: 8px; background: #2c3825; border-radius: 4px;")
@@ -147,10 +147,8 @@ class TransformsTab(QWidget):
         
     def apply_contrast_stretch(self):
         """Aplica alargamento de contraste"""
-        params = {
-            "min_val": 0,
-            "max_val": 255
-        }
+        # Sem valores explícitos, a faixa segue o tipo da imagem
+        params = {}
         self.transform_applied.emit("contrast_stretch", params)
         
     def apply_histogram_equalization(self):
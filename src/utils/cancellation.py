@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cancelamento cooperativo de operações em segundo plano
+"""
+
+import threading
+from contextlib import contextmanager
+
+# Evento de cancelamento da operação em execução em cada thread
+_state = threading.local()
+
+class OperationCancelled(Exception):
+    """Levantada dentro de uma operação cujo resultado não é mais desejado"""
+
+@contextmanager
+def cancellation_scope(event):
+    """
+    Associa um evento de cancelamento ao código executado no bloco
+
+    Args:
+        event: threading.Event; quando sinalizado, o próximo ponto de
+               verificação (check_cancelled) interrompe a operação
+    """
+    previous = getattr(_state, "event", None)
+    _state.event = event
+    try:
+        yield
+    finally:
+        _state.event = previous
+
+def check_cancelled():
+    """
+    Ponto de verificação: levanta OperationCancelled se a operação da thread
+    atual foi cancelada (sem escopo ativo, nunca levanta)
+    """
+    event = getattr(_state, "event", None)
+    if event is not None and event.is_set():
+        raise OperationCancelled()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Processamento de imagens coloridas (RGB) pela luminância
+"""
+
+from src.utils.lazy_import import lazy_import
+
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+
+def is_color(image):
+    """Indica se a imagem tem vários canais (altura x largura x canais)"""
+    return image.ndim == 3 and image.shape[2] > 1
+
+def to_gray(image):
+    """Luminância de uma imagem RGB (imagens em cinza são devolvidas sem cópia)"""
+    if not is_color(image):
+        return image
+    return cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+
+def apply_to_luminance(func, image):
+    """
+    Aplica uma transformação de intensidade só ao canal Y (YCrCb)
+
+    A cor (Cr, Cb) é preservada e a transformação roda uma única vez, em
+    vez de uma vez por canal RGB.
+
+    Args:
+        func: Função que recebe e devolve a luminância 2-D (mesmo tipo)
+        image: Imagem em cinza ou RGB (uint8, uint16 ou float32)
+
+    Returns:
+        Imagem transformada, no mesmo formato da entrada
+    """
+    if not is_color(image):
+        return func(image)
+    ycrcb = cv2.cvtColor(image, cv2.COLOR_RGB2YCrCb)
+    ycrcb[..., 0] = func(np.ascontiguousarray(ycrcb[..., 0]))
+    return cv2.cvtColor(ycrcb, cv2.COLOR_YCrCb2RGB)
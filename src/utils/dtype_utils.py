@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tipos de imagem suportados e conversões com saturação
+"""
+
+from src.utils.lazy_import import lazy_import
+
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+
+# Tipos preservados de ponta a ponta pelo pipeline
+SUPPORTED_DTYPES = ("uint8", "uint16", "float32")
+
+# Formatos de arquivo que só guardam 8 bits por canal
+EIGHT_BIT_FORMATS = (".jpg", ".jpeg", ".bmp")
+
+def value_range(dtype):
+    """
+    Faixa nominal de valores do tipo
+
+    Inteiros usam a faixa completa do tipo; imagens em ponto flutuante
+    seguem a convenção [0, 1].
+    """
+    dtype = np.dtype(dtype)
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        return info.min, info.max
+    return 0.0, 1.0
+
+def to_float32(image):
+    """
+    Converte para float32 sem cópia quando já é float32
+
+    float32 representa exatamente todos os valores de 8 e 16 bits, então é
+    o tipo de trabalho mais estreito seguro para as operações com frações.
+    """
+    return image.astype(np.float32, copy=False)
+
+def saturate(values, dtype):
+    """
+    Converte valores calculados para o tipo da imagem
+
+    Inteiros são arredondados e limitados à faixa do tipo (sem o "dar a
+    volta" de astype); ponto flutuante é apenas convertido para float32.
+
+    Args:
+        values: Matriz calculada (qualquer tipo numérico)
+        dtype: Tipo de destino
+
+    Returns:
+        Matriz do tipo de destino
+    """
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.integer):
+        return values.astype(np.float32, copy=False)
+    if values.dtype == dtype:
+        return values
+
+    low, high = value_range(dtype)
+    if np.issubdtype(values.dtype, np.integer):
+        return np.clip(values, low, high).astype(dtype)
+    # Arredondar no próprio temporário antes de limitar e converter
+    rounded = np.rint(values)
+    np.clip(rounded, low, high, out=rounded)
+    return rounded.astype(dtype)
+
+def to_supported(image, keep_color=False):
+    """
+    Converte uma imagem carregada para um tipo suportado
+
+    Args:
+        image: Matriz lida com cv2.IMREAD_UNCHANGED (BGR, BGRA ou cinza)
+        keep_color: Manter as cores (RGB) em vez de converter para cinza
+
+    Returns:
+        Imagem uint8, uint16 ou float32: 2-D em cinza ou altura x largura x 3 em RGB
+    """
+    if np.issubdtype(image.dtype, np.floating):
+        image = image.astype(np.float32, copy=False)
+    elif image.dtype.name not in SUPPORTED_DTYPES:
+        image = _rescale_integer(image)
+
+    if image.ndim == 3:
+        channels = image.shape[2]
+        if keep_color and channels in (3, 4):
+            # Canal alfa descartado; o pipeline trabalha em RGB
+            return cv2.cvtColor(image, cv2.COLOR_BGRA2RGB if channels == 4 else cv2.COLOR_BGR2RGB)
+        if channels == 4:
+            image = cv2.cvtColor(image, cv2.COLOR_BGRA2GRAY)
+        elif channels == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        else:
+            image = image[..., 0]
+    return image
+
+def _rescale_integer(image):
+    """
+    Leva inteiros sem suporte (ex.: int16 de microscopia, int32) à faixa
+    nominal de um tipo suportado, pela faixa do tipo de origem
+
+    int8 e int16 são deslocados pelo mínimo do tipo para uint8 e uint16, sem
+    perda; inteiros mais largos viram float32 em [0, 1]. Os valores brutos
+    nunca passam para float32 diretamente: fora de [0, 1] eles seriam
+    saturados na exibição, nas operações e ao salvar.
+    """
+    low, high = value_range(image.dtype)
+    if image.dtype.itemsize <= 2:
+        target = np.uint8 if image.dtype.itemsize == 1 else np.uint16
+        return (image.astype(np.int32) - low).astype(target)
+    scaled = (image.astype(np.float64) - low) / (high - low)
+    return scaled.astype(np.float32)
+
+def to_display(image):
+    """
+    Converte para um tipo exibível pelo QImage sem perder a profundidade útil
+
+    uint8 e uint16 em cinza são exibidos diretamente (Grayscale8/Grayscale16);
+    ponto flutuante é limitado a [0, 1] e convertido para 8 bits, assim
+    como imagens coloridas de 16 bits (o QImage só exibe RGB de 8 bits).
+    """
+    if image.dtype == np.uint8:
+        return image
+    if image.dtype == np.uint16:
+        if image.ndim == 2:
+            return image
+        return saturate(to_float32(image) * np.float32(255 / 65535), np.uint8)
+    scaled = to_float32(image) * np.float32(255)
+    return saturate(scaled, np.uint8)
+
+def to_saveable(image, path):
+    """
+    Converte a imagem para um tipo aceito pelo formato do arquivo
+
+    JPEG e BMP guardam 8 bits; PNG guarda 8 ou 16 bits; TIFF guarda
+    também float32. As conversões preservam a faixa nominal do tipo, e
+    imagens coloridas voltam à ordem BGR do OpenCV.
+
+    Args:
+        image: Imagem a salvar
+        path: Caminho do arquivo (a extensão define o formato)
+
+    Returns:
+        Imagem pronta para cv2.imwrite
+    """
+    if image.ndim == 3 and image.shape[2] == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+
+    extension = path[path.rfind("."):].lower() if "." in path else ""
+    if extension in (".tif", ".tiff") or image.dtype == np.uint8:
+        return image
+
+    if extension in EIGHT_BIT_FORMATS:
+        if image.dtype == np.uint16:
+            return saturate(to_float32(image) * np.float32(255 / 65535), np.uint8)
+        return to_display(image)
+
+    # PNG e demais formatos: 16 bits
+    if image.dtype == np.uint16:
+        return image
+    return saturate(to_float32(image) * np.float32(65535), np.uint16)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Identificação de imagens para uso como chave de caches
+"""
+
+import hashlib
+import threading
+import weakref
+
+from .lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+# id do array -> (referência fraca, chave); evita recalcular o hash do mesmo objeto
+_known_arrays = {}
+_lock = threading.Lock()
+
+def image_key(image):
+    """
+    Retorna uma chave que identifica o conteúdo da imagem
+
+    O hash (BLAKE2b) considera forma, tipo e pixels, e é memorizado por objeto:
+    chamadas repetidas com o mesmo array custam O(1). Os módulos do sistema
+    nunca modificam imagens no próprio lugar, o que torna a memorização segura.
+
+    Args:
+        image: Imagem (numpy array)
+
+    Returns:
+        String hexadecimal que identifica a imagem
+    """
+    identity = id(image)
+    with _lock:
+        known = _known_arrays.get(identity)
+    if known is not None and known[0]() is image:
+        return known[1]
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.shape}|{image.dtype.str}".encode())
+    digest.update(np.ascontiguousarray(image).reshape(-1).view(np.uint8))
+    key = digest.hexdigest()
+
+    try:
+        reference = weakref.ref(image, lambda _, identity=identity: _forget(identity))
+    except TypeError:
+        return key
+
+    with _lock:
+        _known_arrays[identity] = (reference, key)
+    return key
+
+def _forget(identity):
+    """Remove a memorização de um array que deixou de existir"""
+    with _lock:
+        known = _known_arrays.get(identity)
+        if known is not None and known[0]() is None:
+            del _known_arrays[identity]
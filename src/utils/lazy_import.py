@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Importação adiada de bibliotecas pesadas (numpy, OpenCV, SciPy, scikit-image)
+"""
+
+import importlib
+import threading
+
+class LazyModule:
+    """
+    Substituto de um módulo que só o importa no primeiro acesso a um atributo
+
+    Permite manter "cv2 = lazy_import('cv2')" no topo do arquivo sem pagar o
+    custo da importação na abertura da janela.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            # importlib serializa importações concorrentes do mesmo módulo
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "carregado" if self._module is not None else "não carregado"
+        return f"<módulo adiado {self._name!r} ({state})>"
+
+def lazy_import(name):
+    """
+    Retorna um substituto do módulo que o importa no primeiro uso
+
+    Args:
+        name: Nome completo do módulo (ex.: "cv2", "scipy.ndimage")
+
+    Returns:
+        Objeto LazyModule
+    """
+    return LazyModule(name)
+
+def warm_up(module_names):
+    """
+    Importa os módulos informados em uma thread de fundo
+
+    Usado após a primeira pintura da janela, para que a primeira operação do
+    usuário não precise esperar pela pilha científica.
+
+    Args:
+        module_names: Nomes dos módulos a importar
+
+    Returns:
+        A thread iniciada
+    """
+    def run():
+        for name in module_names:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                # O erro aparecerá normalmente quando a operação for usada
+                pass
+
+    thread = threading.Thread(target=run, name="warm-up", daemon=True)
+    thread.start()
+    return thread
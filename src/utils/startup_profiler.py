@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Medição do tempo de inicialização (modo --profile-startup)
+"""
+
+import builtins
+import importlib
+import importlib.util
+import sys
+import threading
+import time
+
+class StartupProfiler:
+    """
+    Mede o custo de cada importação e os marcos da inicialização
+
+    Intercepta as instruções import e importlib.import_module; para cada
+    módulo carregado pela primeira vez registra o tempo total (incluindo os
+    módulos que ele importa) e o tempo próprio.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.imports = {}  # módulo -> [tempo total, tempo próprio, thread]
+        self.marks = []  # (rótulo, segundos desde o início)
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.original_import = None
+        self.original_import_module = None
+
+    def install(self):
+        """Passa a interceptar as importações"""
+        self.original_import = builtins.__import__
+        self.original_import_module = importlib.import_module
+
+        def profiled_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level:
+                package = (globals or {}).get("__package__") or ""
+                full_name = importlib.util.resolve_name("." * level + name, package)
+            else:
+                full_name = name
+            return self._measure(full_name, self.original_import, name, globals, locals, fromlist, level)
+
+        def profiled_import_module(name, package=None):
+            full_name = importlib.util.resolve_name(name, package) if name.startswith(".") else name
+            return self._measure(full_name, self.original_import_module, name, package)
+
+        builtins.__import__ = profiled_import
+        importlib.import_module = profiled_import_module
+
+    def uninstall(self):
+        """Restaura as funções de importação originais"""
+        if self.original_import is not None:
+            builtins.__import__ = self.original_import
+            importlib.import_module = self.original_import_module
+            self.original_import = None
+
+    def _measure(self, full_name, function, *args):
+        """Executa a importação medindo o tempo se o módulo ainda não foi carregado"""
+        if full_name in sys.modules:
+            return function(*args)
+
+        stack = getattr(self.local, "stack", None)
+        if stack is None:
+            stack = self.local.stack = []
+
+        # Cada nível acumula o tempo gasto nas importações internas
+        stack.append(0.0)
+        begin = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            elapsed = time.perf_counter() - begin
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            with self.lock:
+                if full_name not in self.imports:
+                    self.imports[full_name] = [elapsed, elapsed - children, threading.current_thread().name]
+
+    def mark(self, label):
+        """Registra um marco da inicialização"""
+        self.marks.append((label, time.perf_counter() - self.start))
+
+    def report(self, limit=25, stream=None):
+        """
+        Escreve o relatório de importações e marcos
+
+        Args:
+            limit: Quantidade de módulos listados (os mais caros)
+            stream: Destino do texto (padrão: sys.stderr)
+        """
+        stream = stream or sys.stderr
+        with self.lock:
+            entries = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)
+
+        print("\n=== Tempo de inicialização ===", file=stream)
+        for label, seconds in self.marks:
+            print(f"{seconds * 1000:10.1f} ms  {label}", file=stream)
+
+        print(f"\n{'total (ms)':>12} {'próprio (ms)':>13}  {'thread':<12} módulo", file=stream)
+        for name, (total, own, thread) in entries[:limit]:
+            print(f"{total * 1000:12.1f} {own * 1000:13.1f}  {thread:<12} {name}", file=stream)
+        own_total = sum(own for _, own, _ in self.imports.values())
+        print(f"\n{len(entries)} módulos importados, {own_total * 1000:.1f} ms no total", file=stream)
+
+    def watch(self, window, app):
+        """
+        Acompanha a janela principal: marca a primeira pintura, espera o
+        pré-carregamento em segundo plano, escreve o relatório e encerra
+        """
+        from PyQt6.QtCore import QObject, QEvent, QTimer
+
+        profiler = self
+
+        class FirstPaintFilter(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Type.Paint:
+                    window.removeEventFilter(self)
+                    profiler.mark("primeira pintura da janela")
+                    QTimer.singleShot(0, wait_warm_up)
+                return False
+
+        def wait_warm_up():
+            thread = window.warm_up_thread
+            if thread is None or thread.is_alive():
+                QTimer.singleShot(20, wait_warm_up)
+                return
+            self.mark("bibliotecas pré-carregadas em segundo plano")
+            self.uninstall()
+            self.report()
+            app.quit()
+
+        self.paint_filter = FirstPaintFilter()
+        window.installEventFilter(self.paint_filter)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Coleta das imagens de entrada do processamento em lote
+"""
+
+import os
+
+import pytest
+
+from src.pipeline.batch_processor import collect_inputs
+
+def touch(*parts):
+    """Cria um arquivo vazio (os diretórios intermediários também)"""
+    path = os.path.join(*parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, "wb").close()
+    return path
+
+def test_glob_keeps_subdirectories(tmp_path):
+    """Arquivos de mesmo nome em subpastas diferentes não colidem"""
+    first = touch(tmp_path, "scans", "a", "x.png")
+    second = touch(tmp_path, "scans", "b", "x.png")
+    touch(tmp_path, "scans", "b", "notes.txt")
+
+    inputs = collect_inputs([os.path.join(str(tmp_path), "scans", "*", "x.png")])
+    assert inputs == [(first, os.path.join("a", "x.png")), (second, os.path.join("b", "x.png"))]
+
+def test_recursive_glob_matches_directory(tmp_path):
+    """"scans/**/*.png" gera as mesmas saídas que o diretório "scans" """
+    touch(tmp_path, "scans", "top.png")
+    touch(tmp_path, "scans", "a", "x.png")
+    touch(tmp_path, "scans", "a", "deep", "x.png")
+    scans = os.path.join(str(tmp_path), "scans")
+
+    from_glob = collect_inputs([os.path.join(scans, "**", "*.png")])
+    from_directory = collect_inputs([scans])
+    assert sorted(from_glob) == sorted(from_directory)
+
+def test_plain_file_uses_its_name(tmp_path):
+    path = touch(tmp_path, "scans", "a", "x.png")
+    assert collect_inputs([path]) == [(path, "x.png")]
+
+def test_repeated_inputs_are_merged(tmp_path):
+    path = touch(tmp_path, "scans", "x.png")
+    scans = os.path.join(str(tmp_path), "scans")
+    assert collect_inputs([scans, os.path.join(scans, "*.png")]) == [(path, "x.png")]
+
+def test_output_collision_raises(tmp_path):
+    """Padrões diferentes que levam ao mesmo arquivo de saída são recusados"""
+    first = touch(tmp_path, "scans", "a", "x.png")
+    second = touch(tmp_path, "other", "a", "x.png")
+
+    with pytest.raises(ValueError, match="mesmo arquivo de saída"):
+        collect_inputs([os.path.join(str(tmp_path), "scans"), os.path.join(str(tmp_path), "other")])
+    with pytest.raises(ValueError):
+        collect_inputs([first, second])
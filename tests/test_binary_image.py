@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Morfologia binária compactada comparada com cv2.dilate/erode/morphologyEx
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+from src.morphology.binary_image import PackedBinaryImage, is_binary_mask
+from src.morphology.morphological_ops import COMPOUND_OPERATIONS, MorphologicalOps
+from src.morphology.structuring_elements import SHAPES, structuring_element
+
+# Larguras em torno dos limites das palavras de 64 bits
+WIDTHS = (1, 63, 64, 65, 130)
+
+MORPH_TYPES = {
+    "erosion": cv2.MORPH_ERODE,
+    "dilation": cv2.MORPH_DILATE,
+    "opening": cv2.MORPH_OPEN,
+    "closing": cv2.MORPH_CLOSE,
+    "gradient": cv2.MORPH_GRADIENT,
+    "tophat": cv2.MORPH_TOPHAT,
+    "blackhat": cv2.MORPH_BLACKHAT,
+}
+
+def random_mask(shape, density=0.3, seed=0):
+    """Máscara 0/255 aleatória, com pixels ativos também nas bordas"""
+    rng = np.random.default_rng(seed)
+    return np.where(rng.random(shape) < density, 255, 0).astype(np.uint8)
+
+@pytest.mark.parametrize("width", WIDTHS)
+@pytest.mark.parametrize("height", [1, 17])
+def test_pack_round_trip(height, width):
+    """Compactar e descompactar preserva a máscara e a contagem"""
+    mask = random_mask((height, width), 0.5, seed=width)
+    packed = PackedBinaryImage.from_mask(mask)
+
+    assert packed.shape == mask.shape
+    assert packed.count() == np.count_nonzero(mask)
+    np.testing.assert_array_equal(packed.to_mask(), mask)
+    np.testing.assert_array_equal(packed.to_mask(1), mask // 255)
+    np.testing.assert_array_equal((~packed).to_mask(), 255 - mask)
+
+@pytest.mark.parametrize("width", WIDTHS)
+@pytest.mark.parametrize("size, origin", [(1, 0), (2, 0), (3, 0), (8, 0), (65, 0),
+                                          ((3, 70), (1, -5)), ((9, 2), (-4, 0)), (4, -1)])
+def test_rect_matches_opencv(width, size, origin):
+    """Janelas retangulares pares, ímpares, deslocadas e maiores que uma palavra"""
+    mask = random_mask((23, width), 0.1, seed=width)
+    rows, cols = (size, size) if np.isscalar(size) else size
+    origin_row, origin_col = (origin, origin) if np.isscalar(origin) else origin
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (cols, rows))
+    anchor = (cols // 2 + origin_col, rows // 2 + origin_row)
+
+    packed = PackedBinaryImage.from_mask(mask)
+    np.testing.assert_array_equal(packed.dilate(size, origin).to_mask(),
+                                  cv2.dilate(mask, kernel, anchor=anchor))
+
+    dense = 255 - random_mask((23, width), 0.02, seed=width)
+    np.testing.assert_array_equal(PackedBinaryImage.from_mask(dense).erode(size, origin).to_mask(),
+                                  cv2.erode(dense, kernel, anchor=anchor))
+
+@pytest.mark.parametrize("shape", ["ellipse", "cross", "rect"])
+@pytest.mark.parametrize("size", [3, 11, 25, 31])
+@pytest.mark.parametrize("width", [64, 97])
+def test_element_matches_opencv(shape, size, width):
+    """Elementos estruturantes quaisquer, com âncora no centro"""
+    mask = random_mask((40, width), 0.05, seed=size)
+    kernel = structuring_element(shape, size)
+
+    packed = PackedBinaryImage.from_mask(mask)
+    np.testing.assert_array_equal(packed.dilate_element(kernel).to_mask(), cv2.dilate(mask, kernel))
+
+    # Erosão em uma máscara densa, para não sair toda em zero
+    dense = 255 - random_mask((40, width), 0.01, seed=size)
+    np.testing.assert_array_equal(PackedBinaryImage.from_mask(dense).erode_element(kernel).to_mask(),
+                                  cv2.erode(dense, kernel))
+
+@pytest.mark.parametrize("size", [3, 4, 15])
+def test_opening_closing_match_opencv(size):
+    """Abertura e fechamento retangulares"""
+    mask = random_mask((50, 70), 0.4, seed=size)
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (size, size))
+    packed = PackedBinaryImage.from_mask(mask)
+
+    np.testing.assert_array_equal(packed.opening(size).to_mask(),
+                                  cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel))
+    np.testing.assert_array_equal(packed.closing(size).to_mask(),
+                                  cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel))
+
+@pytest.mark.parametrize("shape", list(SHAPES))
+@pytest.mark.parametrize("kernel_size, iterations", [(11, 1), (5, 3), (27, 1)])
+def test_packed_path_matches_morphology_ex(monkeypatch, shape, kernel_size, iterations):
+    """MorphologicalOps.compute em máscaras 0/255 (rota compactada) contra cv2.morphologyEx"""
+    mask = random_mask((61, 130), 0.2, seed=kernel_size)
+    assert is_binary_mask(mask)
+    kernel = structuring_element(shape, kernel_size)
+
+    ops = MorphologicalOps()
+    # A rota compactada não passa pelos blocos nem pelo OpenCV
+    monkeypatch.setattr(ops.tile_engine, "apply", lambda *args: pytest.fail("rota em bytes usada"))
+    results = ops.compute(mask, list(COMPOUND_OPERATIONS), kernel_size, shape, iterations)
+
+    for name, morph_type in MORPH_TYPES.items():
+        expected = cv2.morphologyEx(mask, morph_type, kernel, iterations=iterations)
+        np.testing.assert_array_equal(results[name], expected, err_msg=name)
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16])
+@pytest.mark.parametrize("shape", ["ellipse", "cross"])
+@pytest.mark.parametrize("kernel_size", [7, 25])
+def test_gray_matches_morphology_ex(dtype, shape, kernel_size):
+    """Imagens em tons de cinza: kernel do OpenCV e decomposição em retângulos"""
+    rng = np.random.default_rng(kernel_size)
+    image = rng.integers(0, np.iinfo(dtype).max, (45, 66), endpoint=True).astype(dtype)
+    kernel = structuring_element(shape, kernel_size)
+
+    results = MorphologicalOps().compute(image, list(COMPOUND_OPERATIONS), kernel_size, shape)
+    for name, morph_type in MORPH_TYPES.items():
+        np.testing.assert_array_equal(results[name], cv2.morphologyEx(image, morph_type, kernel),
+                                      err_msg=name)
+
+def test_is_binary_mask():
+    """Somente máscaras uint8 2-D com 0 e 255"""
+    mask = random_mask((10, 10))
+    assert is_binary_mask(mask)
+    assert not is_binary_mask(mask // 255)
+    assert not is_binary_mask(mask.astype(np.uint16))
+    assert not is_binary_mask(np.dstack([mask] * 3))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rotulação em faixas comparada com a rotulação da imagem inteira pelo OpenCV
+"""
+
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+from src.segmentation.connected_components import ConnectedComponents, measure_image
+from src.utils.cancellation import OperationCancelled, cancellation_scope
+
+def random_mask(shape, density, seed=0):
+    """Máscara 0/255 aleatória; densidades altas formam objetos que cruzam várias faixas"""
+    rng = np.random.default_rng(seed)
+    return np.where(rng.random(shape) < density, 255, 0).astype(np.uint8)
+
+def reference(mask, connectivity):
+    """Rótulos e estatísticas do SAUF do OpenCV sobre a imagem inteira"""
+    count, labels, stats, centroids = cv2.connectedComponentsWithStatsWithAlgorithm(
+        (mask != 0).astype(np.uint8), connectivity, cv2.CV_32S, cv2.CCL_SAUF)
+    return count - 1, labels, stats[1:], centroids[1:]
+
+@pytest.mark.parametrize("connectivity", [4, 8])
+@pytest.mark.parametrize("strip_height", [1, 2, 7, 16, 1024])
+@pytest.mark.parametrize("shape, density", [((37, 53), 0.45), ((64, 48), 0.6), ((33, 1), 0.5), ((1, 40), 0.5)])
+def test_labels_and_stats_match_opencv(connectivity, strip_height, shape, density):
+    """Mesmos rótulos (ordem de varredura), áreas, retângulos e centroides"""
+    mask = random_mask(shape, density, seed=strip_height)
+    count, expected, stats, centroids = reference(mask, connectivity)
+
+    labels, regions = ConnectedComponents(strip_height, connectivity).label(mask)
+
+    np.testing.assert_array_equal(labels, expected)
+    assert len(regions) == count
+    np.testing.assert_array_equal(regions["label"], np.arange(1, count + 1))
+    np.testing.assert_array_equal(regions["area"], stats[:, cv2.CC_STAT_AREA])
+    np.testing.assert_array_equal(regions["left"], stats[:, cv2.CC_STAT_LEFT])
+    np.testing.assert_array_equal(regions["top"], stats[:, cv2.CC_STAT_TOP])
+    np.testing.assert_array_equal(regions["width"], stats[:, cv2.CC_STAT_WIDTH])
+    np.testing.assert_array_equal(regions["height"], stats[:, cv2.CC_STAT_HEIGHT])
+    np.testing.assert_allclose(regions["centroid_x"], centroids[:, 0])
+    np.testing.assert_allclose(regions["centroid_y"], centroids[:, 1])
+    assert np.isnan(regions["mean_intensity"]).all()
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16])
+@pytest.mark.parametrize("connectivity", [4, 8])
+def test_mean_intensity(dtype, connectivity):
+    """Intensidade média de cada região, em 8 e 16 bits"""
+    rng = np.random.default_rng(5)
+    mask = random_mask((50, 41), 0.5, seed=5)
+    intensity = rng.integers(0, np.iinfo(dtype).max, mask.shape, endpoint=True).astype(dtype)
+    _, expected, _, _ = reference(mask, connectivity)
+
+    labels, regions = ConnectedComponents(6, connectivity).label(mask, intensity)
+
+    np.testing.assert_array_equal(labels, expected)
+    for region in regions:
+        selected = intensity[expected == region["label"]]
+        assert region["mean_intensity"] == pytest.approx(selected.mean(dtype=np.float64))
+
+def test_measure_matches_label():
+    """measure dá as mesmas estatísticas sem montar a imagem de rótulos"""
+    mask = random_mask((45, 60), 0.5, seed=7)
+    engine = ConnectedComponents(strip_height=8)
+    _, regions = engine.label(mask, mask)
+    np.testing.assert_array_equal(engine.measure(mask, mask), regions)
+
+def test_memmap_input(tmp_path):
+    """A máscara pode ser um numpy.memmap lido faixa a faixa"""
+    mask = random_mask((70, 90), 0.55, seed=9)
+    stored = np.memmap(tmp_path / "mask.raw", dtype=np.uint8, mode="w+", shape=mask.shape)
+    stored[:] = mask
+    stored.flush()
+
+    labels, _ = ConnectedComponents(strip_height=16).label(
+        np.memmap(tmp_path / "mask.raw", dtype=np.uint8, mode="r", shape=mask.shape))
+    np.testing.assert_array_equal(labels, reference(mask, 8)[1])
+
+def test_empty_and_full_masks():
+    """Sem objetos: nenhuma região; máscara cheia: uma única região"""
+    engine = ConnectedComponents(strip_height=4)
+    labels, regions = engine.label(np.zeros((10, 12), dtype=np.uint8))
+    assert len(regions) == 0 and not labels.any()
+
+    labels, regions = engine.label(np.full((10, 12), 255, dtype=np.uint8))
+    assert len(regions) == 1 and regions["area"][0] == 120 and (labels == 1).all()
+
+def test_invalid_arguments():
+    """Conectividade e dimensões inválidas são rejeitadas"""
+    with pytest.raises(ValueError):
+        ConnectedComponents(connectivity=6)
+    with pytest.raises(ValueError):
+        ConnectedComponents().label(np.zeros((4, 4, 3), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        ConnectedComponents().label(np.zeros((4, 4), dtype=np.uint8), np.zeros((5, 4)))
+
+def test_cancelled_between_strips():
+    """Um trabalho cancelado para antes da próxima faixa"""
+    event = threading.Event()
+    event.set()
+    with cancellation_scope(event), pytest.raises(OperationCancelled):
+        ConnectedComponents(strip_height=4).measure(np.ones((16, 8), dtype=np.uint8))
+
+def test_measure_image_color():
+    """Imagens coloridas: máscara e intensidade pela luminância"""
+    mask = random_mask((40, 50), 0.5, seed=3)
+    color = np.repeat(mask[..., None], 3, axis=2)
+    intensity = np.dstack([mask // 2] * 3)
+
+    regions = measure_image(color, intensity, connectivity=4)
+    expected = ConnectedComponents(connectivity=4).measure(mask, mask // 2)
+    np.testing.assert_array_equal(regions, expected)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Filtros de máximo/mínimo de van Herk/Gil-Werman comparados com o OpenCV e o SciPy
+"""
+
+import cv2
+import numpy as np
+import pytest
+from scipy import ndimage
+
+from src.filters.extrema_engine import ExtremaEngine
+
+DTYPES = (np.uint8, np.uint16, np.float32)
+
+def random_image(shape, dtype, seed=0):
+    """Imagem aleatória cobrindo toda a faixa do tipo"""
+    rng = np.random.default_rng(seed)
+    if dtype == np.float32:
+        return rng.random(shape, dtype=np.float32)
+    return rng.integers(0, np.iinfo(dtype).max, shape, endpoint=True).astype(dtype)
+
+@pytest.fixture
+def blocked_engine():
+    """Motor sem a rota do OpenCV: todas as janelas passam pelos blocos"""
+    engine = ExtremaEngine()
+    engine.DIRECT_MAX_WINDOW = {}
+    return engine
+
+@pytest.mark.parametrize("dtype", DTYPES)
+@pytest.mark.parametrize("size", [1, 2, 3, 4, 7, (5, 2), (1, 9)])
+@pytest.mark.parametrize("shape", [(37, 53), (8, 6), (29, 31, 3)])
+def test_blocked_matches_opencv(blocked_engine, dtype, size, shape):
+    """Janelas pares e ímpares, imagens menores que a janela e coloridas"""
+    image = random_image(shape, dtype)
+    rows, cols = (size, size) if np.isscalar(size) else size
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (cols, rows))
+
+    maximum = blocked_engine.maximum(image, size)
+    minimum = blocked_engine.minimum(image, size)
+
+    assert maximum.dtype == image.dtype and maximum.shape == image.shape
+    np.testing.assert_array_equal(maximum, cv2.dilate(image, kernel).reshape(image.shape))
+    np.testing.assert_array_equal(minimum, cv2.erode(image, kernel).reshape(image.shape))
+
+@pytest.mark.parametrize("dtype", DTYPES)
+@pytest.mark.parametrize("size, origin", [(3, 1), (3, -1), (4, -2), ((5, 4), (2, -1)), (6, 0)])
+def test_blocked_matches_scipy_with_origin(blocked_engine, dtype, size, origin):
+    """Janelas deslocadas seguem a convenção de origem do scipy.ndimage"""
+    image = random_image((41, 34), dtype, seed=1)
+
+    np.testing.assert_array_equal(blocked_engine.maximum(image, size, origin),
+                                  ndimage.maximum_filter(image, size, origin=origin, mode="constant",
+                                                         cval=ExtremaEngine._lowest(image.dtype)))
+    np.testing.assert_array_equal(blocked_engine.minimum(image, size, origin),
+                                  ndimage.minimum_filter(image, size, origin=origin, mode="constant",
+                                                         cval=ExtremaEngine._highest(image.dtype)))
+
+@pytest.mark.parametrize("dtype", DTYPES)
+def test_direct_and_blocked_agree(blocked_engine, dtype):
+    """As duas rotas dão o mesmo resultado na mesma janela"""
+    image = random_image((64, 48), dtype, seed=2)
+    engine = ExtremaEngine()
+
+    for size in (3, 9, 15):
+        np.testing.assert_array_equal(engine.maximum(image, size), blocked_engine.maximum(image, size))
+        np.testing.assert_array_equal(engine.minimum(image, size), blocked_engine.minimum(image, size))
+
+def test_blocked_does_not_modify_input(blocked_engine):
+    """Janela 1 devolve uma cópia, não a própria entrada"""
+    image = random_image((10, 10), np.uint8)
+    result = blocked_engine.maximum(image, 1)
+    assert result is not image
+    np.testing.assert_array_equal(result, image)
+
+@pytest.mark.parametrize("origin", [2, -3])
+def test_origin_outside_window_raises(blocked_engine, origin):
+    """Origens fora da janela são rejeitadas"""
+    with pytest.raises(ValueError):
+        blocked_engine.maximum(random_image((10, 10), np.uint8), 3, origin)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Filtro gaussiano recursivo comparado com scipy.ndimage.gaussian_filter
+(borda replicada)
+"""
+
+import numpy as np
+import pytest
+from scipy import ndimage
+
+from src.filters.gaussian_engine import GaussianEngine
+
+# Erro máximo aceito na rota IIR, em fração do contraste (a aproximação de
+# terceira ordem não reproduz a forma exata do kernel)
+EDGE_TOLERANCE = 0.015
+NOISE_TOLERANCE = 0.002
+
+def reference(image, sigma):
+    """Gaussiana de referência em float64, sem truncamento relevante"""
+    return ndimage.gaussian_filter(image.astype(np.float64), sigma, mode="nearest", truncate=6.0)
+
+def edges_image(shape=(600, 700)):
+    """Degrau vertical, retângulo (cantos) e faixa fina em [0, 1]"""
+    image = np.zeros(shape, np.float32)
+    image[:, shape[1] // 2:] = 1.0
+    image[150:350, 100:160] = 1.0
+    image[450:455, :] = 0.5
+    return image
+
+@pytest.mark.parametrize("sigma", [20, 50, 100, 200])
+def test_iir_edges(sigma):
+    """Bordas e cantos: erro limitado pela forma do kernel, não pelo sigma"""
+    image = edges_image()
+    result = GaussianEngine().gaussian(image, sigma, method="iir")
+    assert np.abs(result - reference(image, sigma)).max() < EDGE_TOLERANCE
+
+@pytest.mark.parametrize("sigma", [20, 50, 100])
+def test_iir_noise(sigma):
+    image = np.random.default_rng(0).random((500, 400), dtype=np.float32)
+    result = GaussianEngine().gaussian(image, sigma, method="iir")
+    assert np.abs(result - reference(image, sigma)).max() < NOISE_TOLERANCE
+
+def test_iir_uint8_color():
+    """Tipo e canais preservados; resultado próximo da referência arredondada"""
+    image = (edges_image((300, 320))[..., None] * [255, 128, 64]).astype(np.uint8)
+    result = GaussianEngine().gaussian(image, 30, method="iir")
+    assert result.dtype == np.uint8 and result.shape == image.shape
+    expected = reference(image, (30, 30, 0))
+    assert np.abs(result - expected).max() <= 255 * EDGE_TOLERANCE + 1
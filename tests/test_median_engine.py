@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Filtro da mediana comparado com scipy.ndimage.median_filter (borda replicada)
+"""
+
+import numpy as np
+import pytest
+from scipy import ndimage
+
+from src.filters.median_engine import MedianEngine
+from src.filters.spatial_filters import SpatialFilters
+
+def reference(image, kernel_size):
+    """Mediana de referência, canal a canal"""
+    size = (kernel_size, kernel_size) + (1,) * (image.ndim - 2)
+    return ndimage.median_filter(image, size=size, mode="nearest")
+
+def random_image(shape, dtype, low=0, high=None, seed=0):
+    """Imagem aleatória na faixa [low, high] do tipo"""
+    rng = np.random.default_rng(seed)
+    if dtype == np.float32:
+        return rng.random(shape, dtype=np.float32)
+    high = np.iinfo(dtype).max if high is None else high
+    return rng.integers(low, high, shape, endpoint=True).astype(dtype)
+
+@pytest.mark.parametrize("kernel_size", [3, 5, 7, 31])
+@pytest.mark.parametrize("shape", [(37, 53), (64, 48), (21, 19, 3)])
+def test_uint8(kernel_size, shape):
+    """8 bits: rota do OpenCV, inclusive com kernel maior que a imagem"""
+    image = random_image(shape, np.uint8)
+    np.testing.assert_array_equal(MedianEngine().median(image, kernel_size), reference(image, kernel_size))
+
+@pytest.mark.parametrize("kernel_size", [3, 5, 7, 9, 15])
+@pytest.mark.parametrize("shape", [(45, 70), (64, 64), (33, 27, 3)])
+@pytest.mark.parametrize("low, high", [(0, 65535), (0x1234, 0x15FF), (0x00F0, 0x0110)])
+def test_uint16(kernel_size, shape, low, high):
+    """
+    16 bits: faixas estreitas de byte alto passam pela decomposição em
+    bytes; a faixa completa cai na seleção direta do scipy
+    """
+    image = random_image(shape, np.uint16, low, high, seed=kernel_size)
+    # Blocos pequenos exercitam as emendas entre blocos
+    engine = MedianEngine(block_size=16)
+    np.testing.assert_array_equal(engine.median(image, kernel_size), reference(image, kernel_size))
+
+@pytest.mark.parametrize("kernel_size", [7, 11])
+def test_uint16_byte_decomposition_only(monkeypatch, kernel_size):
+    """A decomposição em passadas de 8 bits é exata sozinha, sem a rota do scipy"""
+    image = random_image((50, 61), np.uint16, 0x3000, 0x36FF, seed=3)
+    expected = reference(image, kernel_size)
+
+    def forbidden(*args, **kwargs):
+        raise AssertionError("a rota do scipy não deveria ser usada")
+
+    engine = MedianEngine(block_size=16)
+    monkeypatch.setattr(MedianEngine, "_median_scipy", staticmethod(forbidden))
+    np.testing.assert_array_equal(engine.median(image, kernel_size), expected)
+
+@pytest.mark.parametrize("kernel_size", [3, 5, 7])
+@pytest.mark.parametrize("shape", [(30, 41), (18, 18, 3)])
+def test_float32(kernel_size, shape):
+    """Ponto flutuante: OpenCV até 5, scipy acima"""
+    image = random_image(shape, np.float32)
+    np.testing.assert_array_equal(MedianEngine().median(image, kernel_size), reference(image, kernel_size))
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16])
+def test_even_kernel_through_spatial_filters(dtype):
+    """O filtro espacial arredonda kernels pares para o ímpar seguinte"""
+    image = random_image((40, 52), dtype, seed=4)
+    np.testing.assert_array_equal(SpatialFilters().median_filter(image, 6), reference(image, 7))
+
+def test_kernel_one_returns_copy():
+    """Kernel 1 devolve uma cópia da entrada"""
+    image = random_image((10, 12), np.uint8)
+    result = MedianEngine().median(image, 1)
+    assert result is not image
+    np.testing.assert_array_equal(result, image)
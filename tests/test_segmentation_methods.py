@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Limiarização adaptativa nos tipos uint8, uint16 e float32
+"""
+
+import numpy as np
+import pytest
+
+from src.segmentation.segmentation_methods import SegmentationMethods
+
+def textured_image(shape=(120, 150), seed=0):
+    """Fundo com gradiente e ruído, cobrindo toda a faixa de 8 bits"""
+    rng = np.random.default_rng(seed)
+    ramp = np.linspace(0, 160, shape[1])[None, :]
+    image = np.clip(ramp + rng.normal(0, 30, shape), 0, 255).astype(np.uint8)
+    image[0, 0], image[0, 1] = 0, 255
+    return image
+
+@pytest.mark.parametrize("method", ["mean", "gaussian"])
+@pytest.mark.parametrize("offset", [-12, 0, 7, 25])
+def test_offset_scaled_to_dtype(method, offset):
+    """O mesmo deslocamento dá a mesma máscara em 8 bits, 16 bits e float"""
+    image = textured_image()
+    methods = SegmentationMethods()
+    expected = methods.adaptive_thresholding(image, method, 15, offset=offset)
+
+    wide = image.astype(np.uint16) * 257
+    np.testing.assert_array_equal(methods.adaptive_thresholding(wide, method, 15, offset=offset), expected)
+
+    # Em float, pixels exatamente no limiar podem cair do outro lado
+    unit = image.astype(np.float32) / 255
+    result = methods.adaptive_thresholding(unit, method, 15, offset=offset)
+    assert np.mean(result != expected) < 0.002